@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark checkpoint blob compression on transcript-heavy agent states.
+
+Builds a conversation whose tool results are meeting payloads shaped like
+`get_meeting_details` output (indented JSON with a full transcript), then
+serializes it with each codec and reports size, ratio and timings.
+
+Usage:
+    python command/benchmark_checkpoint_serializer.py [--meetings N] [--segments N] [--iterations N] [--threshold BYTES]
+
+Example:
+    python command/benchmark_checkpoint_serializer.py --meetings 5 --segments 400
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer  # noqa: E402
+
+from memory.serializer import CompressedSerializer, zstandard  # noqa: E402
+
+_SPEAKERS = ["Alice Chen", "Ben Ortiz", "Priya Nair", "Tom Walsh", "Sara Kim"]
+_WORDS = (
+    "we need to follow up on the roadmap budget hiring launch customer feedback "
+    "timeline next sprint action items design review metrics onboarding churn "
+    "pricing partnership quarter goals blockers dependencies deadline demo"
+).split()
+
+
+def build_meeting(rng: random.Random, index: int, segments: int) -> Dict[str, Any]:
+    """A meeting payload with the same shape as the backend's meeting entity."""
+    offset = 0.0
+    data = []
+    for _ in range(segments):
+        duration = rng.uniform(2, 25)
+        data.append(
+            {
+                "start": round(offset, 2),
+                "end": round(offset + duration, 2),
+                "offset": round(offset, 2),
+                "speaker": rng.choice(_SPEAKERS),
+                "conversation": " ".join(
+                    rng.choice(_WORDS) for _ in range(rng.randint(8, 40))
+                ).capitalize()
+                + ".",
+            }
+        )
+        offset += duration
+    return {
+        "id": f"meeting-{index:04d}",
+        "title": f"Weekly sync #{index}",
+        "meeting_date": f"2025-01-{(index % 28) + 1:02d}T10:00:00Z",
+        "duration_mins": round(offset / 60, 1),
+        "host_email": "alice@example.com",
+        "participants_email": [f"{name.split()[0].lower()}@example.com" for name in _SPEAKERS],
+        "summary": " ".join(rng.choice(_WORDS) for _ in range(120)),
+        "transcript_json": {"type": "segments", "data": data},
+    }
+
+
+def build_state(meetings: int, segments: int, seed: int = 7) -> Dict[str, Any]:
+    """Checkpoint channel values for a thread that fetched several meetings."""
+    rng = random.Random(seed)
+    messages: List[Any] = [HumanMessage(content="Summarize last week's meetings")]
+    for i in range(meetings):
+        call_id = f"call_{i}"
+        messages.append(
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "id": call_id,
+                        "name": "get_meeting_details",
+                        "args": {"meeting_id": f"meeting-{i:04d}"},
+                    }
+                ],
+            )
+        )
+        messages.append(
+            ToolMessage(
+                content=json.dumps(build_meeting(rng, i, segments), indent=2),
+                tool_call_id=call_id,
+            )
+        )
+    messages.append(AIMessage(content="Here is a summary of last week's meetings..."))
+    return {"messages": messages, "todos": [], "files": {}}
+
+
+def run(serde: Any, values: Dict[str, Any], iterations: int) -> Dict[str, float]:
+    size = 0
+    dump_time = load_time = 0.0
+    for _ in range(iterations):
+        size = 0
+        for value in values.values():
+            start = time.perf_counter()
+            dumped = serde.dumps_typed(value)
+            dump_time += time.perf_counter() - start
+            size += len(dumped[1])
+            start = time.perf_counter()
+            serde.loads_typed(dumped)
+            load_time += time.perf_counter() - start
+    return {
+        "bytes": size,
+        "dump_ms": dump_time * 1000 / iterations,
+        "load_ms": load_time * 1000 / iterations,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark compressed checkpoint serialization",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--meetings", type=int, default=5, help="Meetings fetched in the thread")
+    parser.add_argument("--segments", type=int, default=400, help="Transcript segments per meeting")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per codec")
+    parser.add_argument("--threshold", type=int, default=1024, help="Compression threshold in bytes")
+    args = parser.parse_args()
+
+    values = build_state(args.meetings, args.segments)
+    codecs = [("none", None), ("zlib", 1), ("zlib", 6)]
+    if zstandard is not None:
+        codecs += [("zstd", 1), ("zstd", 3), ("zstd", 9)]
+
+    baseline = run(JsonPlusSerializer(), values, args.iterations)
+    print(
+        f"State: {args.meetings} meetings x {args.segments} segments, "
+        f"{baseline['bytes'] / 1024:.1f} KiB serialized\n"
+    )
+    print(f"{'codec':<10}{'level':>6}{'KiB':>10}{'ratio':>8}{'dump ms':>10}{'load ms':>10}")
+    for codec, level in codecs:
+        serde = CompressedSerializer(codec=codec, threshold=args.threshold, level=level)
+        result = run(serde, values, args.iterations)
+        print(
+            f"{codec:<10}{level if level is not None else '-':>6}"
+            f"{result['bytes'] / 1024:>10.1f}"
+            f"{baseline['bytes'] / result['bytes']:>8.2f}"
+            f"{result['dump_ms']:>10.2f}{result['load_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming report engine over a synthetic year of meetings.
+
+Generates meeting rows shaped like `api/v1/meetings` pages (date, duration,
+host, participants, meeting type, team) one page at a time and reports
+throughput and peak memory for:
+
+  fold     MeetingReportAccumulator.add over each page
+  stream   build_meeting_report end to end, paging through an in-process
+           stand-in for the backend (no network)
+  list     the non-streaming baseline: all rows in one list, then summarized
+
+Timings include generating the rows (printed separately for reference).
+Peak memory is measured with tracemalloc in a separate, untimed run.
+
+Usage:
+    python command/benchmark_report_engine.py [--meetings N] [--page-size N] [--seed N]
+
+Example:
+    python command/benchmark_report_engine.py --meetings 50000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.meetings import meeting_pages  # noqa: E402
+from tools.reports import report_engine  # noqa: E402
+from tools.reports.report_engine import MeetingReportAccumulator  # noqa: E402
+from tools.utils.meeting_stats import meeting_insights  # noqa: E402
+
+MEETING_TYPES = ["Weekly sync", "1:1", "Standup", "Customer call", "Planning", "Retro"]
+TEAMS = ["Engineering", "Sales", "Support", "Marketing"]
+DURATIONS = [15, 25, 30, 30, 45, 60, 60, 90, 120, None]
+
+
+def build_row(rng: random.Random, index: int, total: int, end: datetime) -> Dict[str, Any]:
+    """Meeting `index` of `total`, spread evenly over the year before `end` (newest first)."""
+    meeting_date = end - timedelta(days=365 * index / total)
+    team = rng.randrange(len(TEAMS))
+    return {
+        "id": f"meeting-{index}",
+        "meeting_date": meeting_date.isoformat() + "Z",
+        "duration_mins": rng.choice(DURATIONS),
+        "host_email": f"host{rng.randrange(60)}@example.com",
+        "participants_email": [
+            f"person{rng.randrange(400)}@example.com" for _ in range(rng.randrange(1, 8))
+        ],
+        "meetingType": {"id": f"type-{team}", "name": rng.choice(MEETING_TYPES)},
+        "team": {"id": f"team-{team}", "name": TEAMS[team]},
+    }
+
+
+def pages(meetings: int, page_size: int, seed: int) -> Iterator[List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    end = datetime(2025, 12, 31, 18)
+    for start in range(0, meetings, page_size):
+        yield [build_row(rng, i, meetings, end) for i in range(start, min(start + page_size, meetings))]
+
+
+def run_fold(meetings: int, page_size: int, seed: int) -> int:
+    accumulator = MeetingReportAccumulator()
+    for rows in pages(meetings, page_size, seed):
+        accumulator.add(rows)
+    accumulator.report("Benchmark", {"from": None, "to": None})
+    return accumulator.meetings
+
+
+def run_stream(meetings: int, page_size: int, seed: int) -> int:
+    source = pages(meetings, page_size, seed)
+
+    async def backend(endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        page = int(parse_qs(urlsplit(endpoint).query)["page"][0])
+        rows = next(source, [])
+        return {
+            "data": rows,
+            "total": meetings,
+            "page": page,
+            "hasNextPage": (page + 1) * page_size < meetings,
+        }
+
+    meeting_pages._make_api_request = backend
+    meeting_pages.MEETINGS_PAGE_SIZE = page_size
+    report = asyncio.run(
+        report_engine.build_meeting_report(
+            "org", "user", "secret", date_range="2025-01-01,", max_meetings=meetings
+        )
+    )
+    return report["metrics"]["meetings"]
+
+
+def run_list(meetings: int, page_size: int, seed: int) -> int:
+    rows = [row for page in pages(meetings, page_size, seed) for row in page]
+    meeting_insights(rows)
+    return len(rows)
+
+
+def measure(run: Callable[[int, int, int], int], *args: int) -> Tuple[int, float, int]:
+    """(meetings counted, seconds, peak bytes); memory is traced in a second run."""
+    start = time.perf_counter()
+    counted = run(*args)
+    elapsed = time.perf_counter() - start
+    # tracemalloc slows Python code several times over, so it is not timed
+    tracemalloc.start()
+    run(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return counted, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the streaming report engine",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--meetings", type=int, default=20000, help="Meetings in the year")
+    parser.add_argument("--page-size", type=int, default=100, help="Meetings per page")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the dataset")
+    args = parser.parse_args()
+
+    # Row generation cost, included in every mode's time
+    start = time.perf_counter()
+    for _ in pages(args.meetings, args.page_size, args.seed):
+        pass
+    generation = time.perf_counter() - start
+
+    print(f"{args.meetings:,} meetings in pages of {args.page_size} (row generation: {generation:.2f}s)\n")
+    print(f"{'mode':<8}{'meetings':>10}{'seconds':>10}{'meetings/s':>12}{'peak MiB':>10}")
+    for name, run in (("fold", run_fold), ("stream", run_stream), ("list", run_list)):
+        counted, elapsed, peak = measure(run, args.meetings, args.page_size, args.seed)
+        print(
+            f"{name:<8}{counted:>10,}{elapsed:>10.2f}"
+            f"{counted / elapsed:>12,.0f}{peak / 2 ** 20:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark tool-output encoding against pretty-printed JSON.
+
+Builds payloads shaped like the backend responses each tool returns and
+reports the tokens the model would read with `json.dumps(indent=2)`, with
+compact JSON, with null/empty keys elided, with tabular lists, and with
+the tool's token budget applied. Tokens are counted with tiktoken
+(cl100k_base) when it is installed, otherwise estimated from characters.
+
+Usage:
+    python command/benchmark_tool_output.py [--meetings N] [--segments N] [--members N] [--budget TOKENS]
+
+Example:
+    python command/benchmark_tool_output.py --meetings 50 --segments 600
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from command.benchmark_checkpoint_serializer import build_meeting  # noqa: E402
+from tools.utils.tool_output import (  # noqa: E402
+    compact,
+    dumps_compact,
+    encode_tool_output,
+    estimate_tokens,
+    tabulate,
+)
+
+try:
+    import tiktoken
+
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _encoding = None
+
+
+def count_tokens(text: str) -> int:
+    if _encoding is None:
+        return estimate_tokens(text)
+    return len(_encoding.encode(text, disallowed_special=()))
+
+
+def list_row(meeting: Dict[str, Any]) -> Dict[str, Any]:
+    """A meeting as it appears in `api/v1/meetings` pages (no transcript)."""
+    row = {key: value for key, value in meeting.items() if key != "transcript_json"}
+    row.update(
+        {
+            "video_url": None,
+            "thumbnail": None,
+            "chapters": "",
+            "team_id": None,
+            "meeting_type": {"id": "type-1", "name": "Weekly sync", "description": None},
+            "summary_meta_data": {"Objectives": [], "Action Items": ["Send recap"]},
+        }
+    )
+    return row
+
+
+def build_payloads(meetings: int, segments: int, members: int) -> List[Tuple[str, Any]]:
+    """(tool name, decoded result) pairs for the tools with the largest outputs."""
+    rng = random.Random(7)
+    full = [build_meeting(rng, i, segments) for i in range(meetings)]
+    page = {
+        "data": [list_row(meeting) for meeting in full],
+        "total": meetings,
+        "page": 0,
+        "limit": meetings,
+        "totalPages": 1,
+        "hasNextPage": False,
+        "hasPreviousPage": False,
+    }
+    search = {
+        **page,
+        "data": [
+            {key: row[key] for key in ("id", "title", "meeting_date", "duration_mins")}
+            for row in page["data"]
+        ],
+    }
+    member_list = [
+        {
+            "id": f"member-{i}",
+            "user_id": f"user-{i}",
+            "email": f"user{i}@example.com",
+            "first_name": f"User{i}",
+            "last_name": None,
+            "avatar_url": None,
+            "team": {"id": f"team-{i % 4}", "name": f"Team {i % 4}"},
+            "is_admin": i == 0,
+        }
+        for i in range(members)
+    ]
+    return [
+        ("list_meetings", page),
+        ("smart_search_meetings", search),
+        ("get_meeting_details", {**list_row(full[0]), "transcript_json": full[0]["transcript_json"]}),
+        ("get_meeting_transcript", full[0]["transcript_json"]),
+        ("get_organization_members", member_list),
+    ]
+
+
+def encodings(budget: int) -> List[Tuple[str, Callable[[str, Any], str]]]:
+    return [
+        ("indent=2", lambda tool, value: json.dumps(value, indent=2, default=str)),
+        ("compact", lambda tool, value: dumps_compact(value)),
+        ("+elide", lambda tool, value: dumps_compact(compact(value))),
+        ("+tabular", lambda tool, value: dumps_compact(tabulate(compact(value)))),
+        ("+budget", lambda tool, value: encode_tool_output(value, tool, budget=budget)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark compact tool-output encoding",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--meetings", type=int, default=50, help="Meetings per list page")
+    parser.add_argument("--segments", type=int, default=600, help="Transcript segments per meeting")
+    parser.add_argument("--members", type=int, default=40, help="Organization members")
+    parser.add_argument("--budget", type=int, default=8000, help="Token budget for the last column")
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.meetings, args.segments, args.members)
+    modes = encodings(args.budget)
+    counter = "tiktoken cl100k_base" if _encoding is not None else "chars / 4 estimate"
+    print(f"Tokens per tool result ({counter}); saving is relative to indent=2\n")
+    print(f"{'tool':<26}" + "".join(f"{name:>12}" for name, _ in modes) + f"{'saving':>9}{'ms':>8}")
+    for tool, value in payloads:
+        tokens = []
+        elapsed = 0.0
+        for name, encode in modes:
+            start = time.perf_counter()
+            text = encode(tool, value)
+            if name == "+budget":
+                elapsed = time.perf_counter() - start
+            tokens.append(count_tokens(text))
+        # Saving from encoding alone, before the budget cuts anything
+        saving = 1 - tokens[3] / tokens[0]
+        print(
+            f"{tool:<26}"
+            + "".join(f"{count:>12,}" for count in tokens)
+            + f"{saving:>9.0%}{elapsed * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
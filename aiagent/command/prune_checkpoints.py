@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Command-line tool to prune the Postgres checkpoint tables.
+
+Usage:
+    python command/prune_checkpoints.py [--keep-last N] [--max-age-days D] [--no-compact-writes] [--dry-run] [--vacuum] [--json]
+
+Example:
+    python command/prune_checkpoints.py --keep-last 10 --max-age-days 30 --dry-run
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from memory.retention import (  # noqa: E402
+    CHECKPOINT_COMPACT_WRITES,
+    CHECKPOINT_KEEP_LAST,
+    CHECKPOINT_MAX_AGE_DAYS,
+    RetentionPolicy,
+    prune_checkpoints,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prune old conversation checkpoints and report the space reclaimed",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Postgres URL (default: DATABASE_URL or POSTGRES_CONNECTION_STRING)",
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=CHECKPOINT_KEEP_LAST,
+        help=f"Checkpoints to keep per thread, 0 to keep all (default: {CHECKPOINT_KEEP_LAST})",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=CHECKPOINT_MAX_AGE_DAYS,
+        help=f"Delete threads idle for longer than this, 0 to disable (default: {CHECKPOINT_MAX_AGE_DAYS:g})",
+    )
+    parser.add_argument(
+        "--no-compact-writes",
+        dest="compact_writes",
+        action="store_false",
+        default=CHECKPOINT_COMPACT_WRITES,
+        help="Keep pending writes of checkpoints that have been superseded",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be deleted without deleting anything",
+    )
+    parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="VACUUM the checkpoint tables afterwards",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    args = parser.parse_args()
+
+    policy = RetentionPolicy(
+        keep_last=args.keep_last,
+        max_age_days=args.max_age_days,
+        compact_writes=args.compact_writes,
+    )
+    try:
+        report = prune_checkpoints(
+            args.database_url, policy, dry_run=args.dry_run, vacuum=args.vacuum
+        )
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(f"✅ {report.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,14 +15,23 @@ from tools import (
     calculator,
     get_current_time,
     get_meeting_details,
+    get_meeting_transcript,
     get_organization_data,
     get_organization_members,
     get_team_members,
     get_user_accessible_meeting_types,
     get_user_permissions,
     get_user_profile,
+    search_meeting_transcript,
     smart_search_meetings,
 )
+from tools.core.deadline import DeadlineMiddleware
+from tools.utils.user_context_fetcher import UserContextMiddleware
+
+try:
+    from langgraph.config import get_config
+except ImportError:
+    get_config = None
 
 
 @dataclass
@@ -42,9 +51,14 @@ class KnowtedContext:
 
 @dynamic_prompt
 def knowted_system_prompt(request: ModelRequest) -> str:
-    """Dynamic system prompt that reads from runtime context."""
+    """Dynamic system prompt from the runtime context (or run config) and the loaded user context."""
     context = getattr(getattr(request, "runtime", None), "context", None)
     config = None
+    if get_config is not None:
+        try:
+            config = get_config()
+        except Exception:
+            config = None
 
     if isinstance(context, KnowtedContext):
         config = {
@@ -60,7 +74,8 @@ def knowted_system_prompt(request: ModelRequest) -> str:
             }
         }
 
-    return build_system_prompt_from_config(config)
+    user_context = (request.state or {}).get("user_context")
+    return build_system_prompt_from_config(config, user_context)
 
 
 def create_knowted_agent(
@@ -76,6 +91,8 @@ def create_knowted_agent(
         smart_search_meetings,
         # Meeting tools
         get_meeting_details,
+        get_meeting_transcript,
+        search_meeting_transcript,
         # User context
         get_user_accessible_meeting_types,
         # Organization tools
@@ -98,7 +115,9 @@ def create_knowted_agent(
 
     agent = create_deep_agent(
         model=llm,
-        middleware=[knowted_system_prompt],
+        # UserContextMiddleware loads the user's context for the prompt once per run;
+        # DeadlineMiddleware bounds each tool call by its budget and the run's deadline
+        middleware=[UserContextMiddleware(), knowted_system_prompt, DeadlineMiddleware()],
         tools=tools,
         checkpointer=checkpointer,
         context_schema=KnowtedContext,
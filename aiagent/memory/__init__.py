@@ -4,10 +4,20 @@ Knowted Memory Layer
 Memory and checkpointing for conversation history and user preferences.
 """
 
+from .async_checkpointer import PooledAsyncPostgresSaver, aclose_checkpointers
+from .bounded_checkpointer import BoundedMemorySaver
 from .checkpointer import get_checkpointer, setup_checkpointer
+from .retention import RetentionPolicy, prune_checkpoints
+from .serializer import CompressedSerializer
 
 __all__ = [
+    "BoundedMemorySaver",
+    "CompressedSerializer",
+    "PooledAsyncPostgresSaver",
+    "RetentionPolicy",
+    "aclose_checkpointers",
     "get_checkpointer",
+    "prune_checkpoints",
     "setup_checkpointer",
 ]
 
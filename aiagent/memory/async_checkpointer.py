@@ -0,0 +1,234 @@
+"""
+Async Pooled Postgres Checkpointer
+
+Non-blocking checkpointer for agents running on an event loop (the
+LangGraph server). Checkpoints go through AsyncPostgresSaver backed by a
+psycopg AsyncConnectionPool, so concurrent threads each get their own
+connection instead of serializing on one.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+CHECKPOINTER_POOL_MIN_SIZE = int(os.getenv("CHECKPOINTER_POOL_MIN_SIZE", "1"))
+CHECKPOINTER_POOL_MAX_SIZE = int(os.getenv("CHECKPOINTER_POOL_MAX_SIZE", "10"))
+CHECKPOINTER_POOL_TIMEOUT = float(os.getenv("CHECKPOINTER_POOL_TIMEOUT", "30"))
+
+# Savers with an open pool, closed by aclose_checkpointers() on shutdown
+_open_savers: List["PooledAsyncPostgresSaver"] = []
+
+
+class _PoolAsyncPostgresSaver(AsyncPostgresSaver):
+    """
+    AsyncPostgresSaver that checks out a pool connection per operation.
+
+    The upstream saver holds one lock around every cursor, which is needed
+    for a single shared connection but serializes all threads on a pool.
+    """
+
+    @asynccontextmanager
+    async def _cursor(self, *, pipeline: bool = False) -> AsyncIterator[Any]:
+        async with self.conn.connection() as conn:
+            if pipeline and self.supports_pipeline:
+                async with conn.pipeline(), conn.cursor(
+                    binary=True, row_factory=dict_row
+                ) as cur:
+                    yield cur
+            elif pipeline:
+                async with conn.transaction(), conn.cursor(
+                    binary=True, row_factory=dict_row
+                ) as cur:
+                    yield cur
+            else:
+                async with conn.cursor(binary=True, row_factory=dict_row) as cur:
+                    yield cur
+
+
+class _PoolState:
+    """Shared between shallow clones (LangGraph may clone the checkpointer)."""
+
+    def __init__(self) -> None:
+        self.pool: Optional[AsyncConnectionPool] = None
+        self.saver: Optional[_PoolAsyncPostgresSaver] = None
+        self.lock: Optional[asyncio.Lock] = None
+
+
+class PooledAsyncPostgresSaver(BaseCheckpointSaver):
+    """
+    Lazily opened async Postgres checkpointer.
+
+    The graph is built at import time, before the server's event loop runs,
+    so the pool is opened (and tables migrated) on the first async call.
+    Sync methods are only valid from worker threads once the pool is open.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = CHECKPOINTER_POOL_MIN_SIZE,
+        max_size: int = CHECKPOINTER_POOL_MAX_SIZE,
+        timeout: float = CHECKPOINTER_POOL_TIMEOUT,
+        serde: Any = None,
+    ):
+        super().__init__(serde=serde)
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self._state = _PoolState()
+
+    async def _ensure_saver(self) -> _PoolAsyncPostgresSaver:
+        state = self._state
+        if state.saver is not None:
+            return state.saver
+        if state.lock is None:
+            state.lock = asyncio.Lock()
+        async with state.lock:
+            if state.saver is None:
+                pool = AsyncConnectionPool(
+                    self.connection_string,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    timeout=self.timeout,
+                    open=False,
+                    # Settings required by AsyncPostgresSaver
+                    kwargs={
+                        "autocommit": True,
+                        "prepare_threshold": 0,
+                        "row_factory": dict_row,
+                    },
+                )
+                await pool.open(wait=True)
+                saver = _PoolAsyncPostgresSaver(pool, serde=self.serde)
+                await saver.setup()
+                state.pool, state.saver = pool, saver
+                _open_savers.append(self)
+        return state.saver
+
+    def _require_saver(self) -> _PoolAsyncPostgresSaver:
+        if self._state.saver is None:
+            raise RuntimeError(
+                "PooledAsyncPostgresSaver is not open yet; use the async interface "
+                "(e.g. `await graph.ainvoke(...)`) at least once first"
+            )
+        return self._state.saver
+
+    @property
+    def pool(self) -> Optional[AsyncConnectionPool]:
+        return self._state.pool
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        state = self._state
+        if state.pool is not None:
+            await state.pool.close()
+        state.pool = state.saver = None
+        if self in _open_savers:
+            _open_savers.remove(self)
+
+    # Async interface
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        saver = await self._ensure_saver()
+        return await saver.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        saver = await self._ensure_saver()
+        async for item in saver.alist(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        saver = await self._ensure_saver()
+        return await saver.aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        saver = await self._ensure_saver()
+        await saver.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        saver = await self._ensure_saver()
+        await saver.adelete_thread(thread_id)
+
+    # Sync interface (worker threads only)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self._require_saver().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ):
+        return self._require_saver().list(
+            config, filter=filter, before=before, limit=limit
+        )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._require_saver().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._require_saver().put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._require_saver().delete_thread(thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        # Same version format as the Postgres savers
+        return AsyncPostgresSaver.get_next_version(self, current, channel)
+
+
+async def aclose_checkpointers() -> None:
+    """Close every open async checkpointer pool (call on server shutdown)."""
+    for saver in list(_open_savers):
+        try:
+            await saver.aclose()
+        except Exception as e:
+            print(f"Warning: Could not close checkpointer pool: {e}")
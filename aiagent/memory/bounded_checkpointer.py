@@ -0,0 +1,254 @@
+"""
+Bounded In-Memory Checkpointer
+
+Fallback checkpointer for processes without a database. Unlike MemorySaver
+it cannot grow without limit: whole threads are evicted least recently used
+first once the thread count or byte budget is exceeded, and threads idle
+for longer than the TTL expire. Byte accounting covers the serialized
+checkpoints, blobs and writes, which are compressed like the Postgres ones.
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+from .serializer import get_checkpoint_serializer
+
+MEMORY_CHECKPOINTER_MAX_THREADS = int(os.getenv("MEMORY_CHECKPOINTER_MAX_THREADS", "1000"))
+MEMORY_CHECKPOINTER_MAX_BYTES = int(
+    os.getenv("MEMORY_CHECKPOINTER_MAX_BYTES", str(256 * 1024 * 1024))
+)
+# Seconds a thread may stay idle before it expires (0 disables)
+MEMORY_CHECKPOINTER_TTL = float(os.getenv("MEMORY_CHECKPOINTER_TTL", "21600"))
+
+_instances: "weakref.WeakSet[BoundedMemorySaver]" = weakref.WeakSet()
+
+
+@dataclass
+class _ThreadUsage:
+    bytes: int = 0
+    last_access: float = field(default_factory=time.monotonic)
+    # Keys of this thread's entries in `writes` and `blobs`, for O(1) eviction
+    write_keys: Set[Tuple[str, str, str]] = field(default_factory=set)
+    blob_keys: Set[Tuple[Any, ...]] = field(default_factory=set)
+
+
+@dataclass
+class BoundedSaverStats:
+    evictions: int = 0
+    expirations: int = 0
+    evicted_bytes: int = 0
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    InMemorySaver with per-thread LRU eviction, a byte budget and TTL expiry.
+
+    The thread being written is never evicted by its own write, so a single
+    thread larger than the budget is kept until another thread needs room.
+    """
+
+    def __init__(
+        self,
+        max_threads: int = MEMORY_CHECKPOINTER_MAX_THREADS,
+        max_bytes: int = MEMORY_CHECKPOINTER_MAX_BYTES,
+        ttl: float = MEMORY_CHECKPOINTER_TTL,
+        serde: Any = None,
+    ):
+        super().__init__(serde=serde or get_checkpoint_serializer())
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = BoundedSaverStats()
+        self._threads: "OrderedDict[str, _ThreadUsage]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+        _instances.add(self)
+
+    # Accounting
+
+    def _checkpoint_size(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> int:
+        saved = self.storage.get(thread_id, {}).get(checkpoint_ns, {}).get(checkpoint_id)
+        if saved is None:
+            return 0
+        checkpoint, metadata, _ = saved
+        return len(checkpoint[1]) + len(metadata[1])
+
+    def _blob_size(self, key: Tuple[Any, ...]) -> int:
+        blob = self.blobs.get(key)
+        return len(blob[1]) if blob is not None else 0
+
+    def _writes_size(self, key: Tuple[str, str, str]) -> int:
+        return sum(len(write[2][1]) for write in self.writes.get(key, {}).values())
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        usage = self._threads.get(thread_id)
+        if usage is None:
+            usage = self._threads[thread_id] = _ThreadUsage()
+        else:
+            usage.last_access = time.monotonic()
+            self._threads.move_to_end(thread_id)
+        return usage
+
+    def _is_expired(self, usage: _ThreadUsage, now: float) -> bool:
+        return self.ttl > 0 and now - usage.last_access > self.ttl
+
+    def _evict(self, thread_id: str) -> None:
+        usage = self._threads.pop(thread_id, None)
+        self.storage.pop(thread_id, None)
+        if usage is None:
+            return
+        for key in usage.write_keys:
+            self.writes.pop(key, None)
+        for key in usage.blob_keys:
+            self.blobs.pop(key, None)
+        self._bytes -= usage.bytes
+
+    def _enforce_limits(self, current: Optional[str] = None) -> None:
+        """Expire idle threads, then evict LRU threads until within budget."""
+        now = time.monotonic()
+        # LRU order is last-access order, so expired threads are at the front
+        while self._threads:
+            thread_id, usage = next(iter(self._threads.items()))
+            if not self._is_expired(usage, now):
+                break
+            self.stats.expirations += 1
+            self.stats.evicted_bytes += usage.bytes
+            self._evict(thread_id)
+
+        for thread_id in list(self._threads):
+            if len(self._threads) <= self.max_threads and self._bytes <= self.max_bytes:
+                break
+            if thread_id == current:
+                continue
+            self.stats.evictions += 1
+            self.stats.evicted_bytes += self._threads[thread_id].bytes
+            self._evict(thread_id)
+
+    def _resident(self, thread_id: str) -> bool:
+        """Whether a thread is stored, expiring it first if it is idle too long."""
+        usage = self._threads.get(thread_id)
+        if usage is None:
+            return False
+        if self._is_expired(usage, time.monotonic()):
+            self.stats.expirations += 1
+            self.stats.evicted_bytes += usage.bytes
+            self._evict(thread_id)
+            return False
+        self._touch(thread_id)
+        return True
+
+    # Saver interface
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._lock:
+            if not self._resident(config["configurable"]["thread_id"]):
+                return None
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        # Materialized under the lock so eviction cannot mutate storage mid-iteration
+        with self._lock:
+            if config is not None and not self._resident(
+                config["configurable"]["thread_id"]
+            ):
+                return iter(())
+            items: List[CheckpointTuple] = list(
+                super().list(config, filter=filter, before=before, limit=limit)
+            )
+        return iter(items)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        blob_keys = [
+            (thread_id, checkpoint_ns, channel, version)
+            for channel, version in new_versions.items()
+        ]
+        with self._lock:
+            before = self._checkpoint_size(thread_id, checkpoint_ns, checkpoint["id"]) + sum(
+                self._blob_size(key) for key in blob_keys
+            )
+            result = super().put(config, checkpoint, metadata, new_versions)
+            after = self._checkpoint_size(thread_id, checkpoint_ns, checkpoint["id"]) + sum(
+                self._blob_size(key) for key in blob_keys
+            )
+            usage = self._touch(thread_id)
+            usage.blob_keys.update(blob_keys)
+            usage.bytes += after - before
+            self._bytes += after - before
+            self._enforce_limits(current=thread_id)
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        with self._lock:
+            before = self._writes_size(key)
+            super().put_writes(config, writes, task_id, task_path)
+            after = self._writes_size(key)
+            usage = self._touch(thread_id)
+            usage.write_keys.add(key)
+            usage.bytes += after - before
+            self._bytes += after - before
+            self._enforce_limits(current=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._evict(thread_id)
+
+    # Metrics
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "threads": len(self._threads),
+                "bytes": self._bytes,
+                "max_threads": self.max_threads,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "evictions": self.stats.evictions,
+                "expirations": self.stats.expirations,
+                "evicted_bytes": self.stats.evicted_bytes,
+            }
+
+
+def memory_checkpointer_stats() -> List[Dict[str, Any]]:
+    """Snapshots of every live BoundedMemorySaver."""
+    return [saver.snapshot() for saver in list(_instances)]
@@ -2,15 +2,31 @@
 Checkpointer Setup for Knowted Agents
 
 Uses PostgreSQL for persistent conversation memory.
-Falls back to in-memory checkpointer for development.
+Falls back to a bounded in-memory checkpointer for development.
+
+Under the LangGraph server the async pooled checkpointer is selected
+automatically; set CHECKPOINTER_MODE=sync|async to override.
 """
 
 import os
 from typing import Optional, Union
 
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.checkpoint.postgres import PostgresSaver
 
+from .async_checkpointer import PooledAsyncPostgresSaver
+from .bounded_checkpointer import BoundedMemorySaver
+from .serializer import get_checkpoint_serializer
+
+# "auto" (async under the LangGraph server, sync otherwise), "async" or "sync"
+CHECKPOINTER_MODE = os.getenv("CHECKPOINTER_MODE", "auto").lower()
+
+
+def _use_async_checkpointer() -> bool:
+    if CHECKPOINTER_MODE in ("async", "sync"):
+        return CHECKPOINTER_MODE == "async"
+    # The langgraph CLI exports LANGSERVE_GRAPHS to the server process
+    return bool(os.getenv("LANGSERVE_GRAPHS"))
+
 
 class PersistentPostgresSaver:
     """
@@ -19,8 +35,9 @@ class PersistentPostgresSaver:
     PostgresSaver.from_conn_string() returns a context manager, but we need
     to keep it alive for the lifetime of the agent. This wrapper handles that.
     """
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, serde=None):
         self.connection_string = connection_string
+        self.serde = serde
         self._saver = None
         self._context = None
     
@@ -28,6 +45,8 @@ class PersistentPostgresSaver:
         if self._saver is None:
             self._context = PostgresSaver.from_conn_string(self.connection_string)
             self._saver = self._context.__enter__()
+            if self.serde is not None:
+                self._saver.serde = self.serde
         return self._saver
     
     def __exit__(self, *args):
@@ -56,7 +75,9 @@ class PersistentPostgresSaver:
         return self._saver.put(config, checkpoint, metadata, new_versions)
 
 
-def get_checkpointer(use_postgres: bool = True) -> Optional[Union[PostgresSaver, PersistentPostgresSaver]]:
+def get_checkpointer(
+    use_postgres: bool = True,
+) -> Optional[Union[PostgresSaver, PersistentPostgresSaver, PooledAsyncPostgresSaver]]:
     """
     Get PostgreSQL checkpointer for conversation memory.
 
@@ -64,7 +85,7 @@ def get_checkpointer(use_postgres: bool = True) -> Optional[Union[PostgresSaver,
         use_postgres: Whether to use PostgreSQL (requires connection)
 
     Returns:
-        PostgresSaver instance or None
+        PooledAsyncPostgresSaver (LangGraph server), PersistentPostgresSaver, or None
     """
     connection_string = os.getenv("DATABASE_URL") or os.getenv(
         "POSTGRES_CONNECTION_STRING"
@@ -72,8 +93,13 @@ def get_checkpointer(use_postgres: bool = True) -> Optional[Union[PostgresSaver,
 
     if use_postgres and connection_string:
         try:
+            # Compresses large blobs; still reads uncompressed rows
+            serde = get_checkpoint_serializer()
+            if _use_async_checkpointer():
+                # Pool opens lazily on the server's event loop
+                return PooledAsyncPostgresSaver(connection_string, serde=serde)
             # Return a persistent wrapper that keeps the context manager alive
-            return PersistentPostgresSaver(connection_string)
+            return PersistentPostgresSaver(connection_string, serde=serde)
         except Exception as e:
             print(f"Warning: Could not connect to PostgreSQL checkpointer: {e}")
             print("Falling back to in-memory checkpointer for development.")
@@ -84,7 +110,9 @@ def get_checkpointer(use_postgres: bool = True) -> Optional[Union[PostgresSaver,
     return None
 
 
-def setup_checkpointer(use_postgres: bool = True) -> Union[MemorySaver, PersistentPostgresSaver]:
+def setup_checkpointer(
+    use_postgres: bool = True,
+) -> Union[BoundedMemorySaver, PersistentPostgresSaver, PooledAsyncPostgresSaver]:
     """
     Setup checkpointer for conversation memory.
 
@@ -92,15 +120,21 @@ def setup_checkpointer(use_postgres: bool = True) -> Union[MemorySaver, Persiste
         use_postgres: Whether to use PostgreSQL
 
     Returns:
-        Checkpointer instance (PostgresSaver or MemorySaver)
+        Checkpointer instance (PostgresSaver or BoundedMemorySaver)
     """
     checkpointer = get_checkpointer(use_postgres)
 
     if checkpointer is None:
-        # Use in-memory checkpointer for development
+        # Use bounded in-memory checkpointer for development
+        saver = BoundedMemorySaver()
         print("⚠️  WARNING: Using in-memory checkpointer. Conversation data will be lost on restart!")
+        print(
+            f"   Keeping at most {saver.max_threads} threads / "
+            f"{saver.max_bytes // (1024 * 1024)} MiB; least recently used threads are evicted."
+        )
         print("   Set DATABASE_URL or POSTGRES_CONNECTION_STRING to use PostgreSQL.")
-        return MemorySaver()
+        return saver
 
-    print("✅ Using PostgreSQL checkpointer - conversation data will be persisted")
+    mode = "async pooled" if isinstance(checkpointer, PooledAsyncPostgresSaver) else "sync"
+    print(f"✅ Using PostgreSQL checkpointer ({mode}) - conversation data will be persisted")
     return checkpointer
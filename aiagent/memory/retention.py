@@ -0,0 +1,253 @@
+"""
+Checkpoint Retention for Knowted Agents
+
+Prunes the Postgres checkpoint tables, which otherwise grow with every
+agent step. The policy keeps the newest N checkpoints per thread, expires
+threads idle for longer than a maximum age, and compacts pending writes
+that a newer checkpoint has already superseded. Blobs no longer
+referenced by any remaining checkpoint are deleted too.
+
+Run it once from the CLI (`python command/prune_checkpoints.py`) or
+periodically in the server (`CHECKPOINT_RETENTION_INTERVAL`).
+"""
+
+import asyncio
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import psycopg
+
+CHECKPOINT_KEEP_LAST = int(os.getenv("CHECKPOINT_KEEP_LAST", "20"))
+CHECKPOINT_MAX_AGE_DAYS = float(os.getenv("CHECKPOINT_MAX_AGE_DAYS", "90"))
+CHECKPOINT_COMPACT_WRITES = os.getenv("CHECKPOINT_COMPACT_WRITES", "true").lower() == "true"
+# Seconds between background runs; 0 disables the background task
+CHECKPOINT_RETENTION_INTERVAL = float(os.getenv("CHECKPOINT_RETENTION_INTERVAL", "0"))
+
+_CHECKPOINT_TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+# Every DELETE returns the on-disk size of each removed row
+_EXPIRE_THREADS = """
+CREATE TEMP TABLE _expired_threads ON COMMIT DROP AS
+SELECT thread_id FROM checkpoints
+GROUP BY thread_id
+HAVING max((checkpoint ->> 'ts')::timestamptz) < %(cutoff)s
+"""
+
+_DELETE_EXPIRED = """
+WITH deleted AS (
+    DELETE FROM {table} t USING _expired_threads e
+    WHERE t.thread_id = e.thread_id
+    RETURNING pg_column_size(t.*) AS size
+)
+SELECT count(*), coalesce(sum(size), 0) FROM deleted
+"""
+
+_DELETE_OLD_CHECKPOINTS = """
+WITH ranked AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id,
+           row_number() OVER (
+               PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+           ) AS rank
+    FROM checkpoints
+), deleted AS (
+    DELETE FROM checkpoints c USING ranked r
+    WHERE c.thread_id = r.thread_id
+      AND c.checkpoint_ns = r.checkpoint_ns
+      AND c.checkpoint_id = r.checkpoint_id
+      AND r.rank > %(keep_last)s
+    RETURNING pg_column_size(c.*) AS size
+)
+SELECT count(*), coalesce(sum(size), 0) FROM deleted
+"""
+
+# Writes of deleted checkpoints, plus (when compacting) writes of
+# checkpoints that already have a child and so were folded into it
+_DELETE_WRITES = """
+WITH deleted AS (
+    DELETE FROM checkpoint_writes w
+    WHERE NOT EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = w.thread_id
+          AND c.checkpoint_ns = w.checkpoint_ns
+          AND c.checkpoint_id = w.checkpoint_id
+    ) OR (%(compact)s AND EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = w.thread_id
+          AND c.checkpoint_ns = w.checkpoint_ns
+          AND c.parent_checkpoint_id = w.checkpoint_id
+    ))
+    RETURNING pg_column_size(w.*) AS size
+)
+SELECT count(*), coalesce(sum(size), 0) FROM deleted
+"""
+
+# Only blobs older than the newest referenced version of their channel are
+# removed, so blobs written just ahead of their checkpoint row are kept
+_DELETE_ORPHAN_BLOBS = """
+WITH deleted AS (
+    DELETE FROM checkpoint_blobs b
+    WHERE NOT EXISTS (
+        SELECT 1 FROM checkpoints c
+        WHERE c.thread_id = b.thread_id
+          AND c.checkpoint_ns = b.checkpoint_ns
+          AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+    ) AND b.version < (
+        SELECT max(c.checkpoint -> 'channel_versions' ->> b.channel)
+        FROM checkpoints c
+        WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns
+    )
+    RETURNING pg_column_size(b.*) AS size
+)
+SELECT count(*), coalesce(sum(size), 0) FROM deleted
+"""
+
+
+@dataclass
+class RetentionPolicy:
+    """What to keep. Set a limit to None to disable that rule."""
+
+    keep_last: Optional[int] = CHECKPOINT_KEEP_LAST
+    max_age_days: Optional[float] = CHECKPOINT_MAX_AGE_DAYS
+    compact_writes: bool = CHECKPOINT_COMPACT_WRITES
+
+
+@dataclass
+class PruneReport:
+    expired_threads: int = 0
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    blobs_deleted: int = 0
+    bytes_reclaimed: int = 0
+    dry_run: bool = False
+
+    @property
+    def rows_deleted(self) -> int:
+        return self.checkpoints_deleted + self.writes_deleted + self.blobs_deleted
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "rows_deleted": self.rows_deleted}
+
+    def summary(self) -> str:
+        prefix = "Would reclaim" if self.dry_run else "Reclaimed"
+        return (
+            f"{prefix} {self.rows_deleted} rows ({self.bytes_reclaimed / 1024:.1f} KiB): "
+            f"{self.checkpoints_deleted} checkpoints, {self.writes_deleted} writes, "
+            f"{self.blobs_deleted} blobs; {self.expired_threads} threads expired"
+        )
+
+
+def _get_connection_string() -> Optional[str]:
+    return os.getenv("DATABASE_URL") or os.getenv("POSTGRES_CONNECTION_STRING")
+
+
+def _delete(cur: psycopg.Cursor, report: PruneReport, field: str, query: str, params=None) -> None:
+    cur.execute(query, params)
+    rows, size = cur.fetchone()
+    setattr(report, field, getattr(report, field) + rows)
+    report.bytes_reclaimed += int(size)
+
+
+def prune_checkpoints(
+    connection_string: Optional[str] = None,
+    policy: Optional[RetentionPolicy] = None,
+    dry_run: bool = False,
+    vacuum: bool = False,
+) -> PruneReport:
+    """
+    Apply a retention policy to the checkpoint tables in one transaction.
+
+    Args:
+        connection_string: Postgres URL (defaults to DATABASE_URL)
+        policy: Retention policy (defaults to the CHECKPOINT_* settings)
+        dry_run: Count what would be deleted, then roll back
+        vacuum: VACUUM the tables afterwards so Postgres can reuse the space
+
+    Returns:
+        PruneReport with rows and bytes reclaimed
+    """
+    connection_string = connection_string or _get_connection_string()
+    if not connection_string:
+        raise ValueError("DATABASE_URL or POSTGRES_CONNECTION_STRING is not set")
+    policy = policy or RetentionPolicy()
+    report = PruneReport(dry_run=dry_run)
+
+    with psycopg.connect(connection_string) as conn:
+        with conn.cursor() as cur:
+            if policy.max_age_days is not None and policy.max_age_days > 0:
+                cutoff = datetime.now(timezone.utc) - timedelta(days=policy.max_age_days)
+                cur.execute(_EXPIRE_THREADS, {"cutoff": cutoff})
+                report.expired_threads = cur.rowcount
+                for table, field in zip(
+                    _CHECKPOINT_TABLES,
+                    ("checkpoints_deleted", "writes_deleted", "blobs_deleted"),
+                ):
+                    _delete(cur, report, field, _DELETE_EXPIRED.format(table=table))
+
+            if policy.keep_last is not None and policy.keep_last > 0:
+                _delete(
+                    cur,
+                    report,
+                    "checkpoints_deleted",
+                    _DELETE_OLD_CHECKPOINTS,
+                    {"keep_last": policy.keep_last},
+                )
+
+            _delete(
+                cur,
+                report,
+                "writes_deleted",
+                _DELETE_WRITES,
+                {"compact": policy.compact_writes},
+            )
+            _delete(cur, report, "blobs_deleted", _DELETE_ORPHAN_BLOBS)
+
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+
+        if vacuum and not dry_run:
+            # VACUUM cannot run inside a transaction block
+            conn.autocommit = True
+            for table in _CHECKPOINT_TABLES:
+                conn.execute(f"VACUUM (ANALYZE) {table}")
+
+    return report
+
+
+async def run_retention_loop(
+    interval: float = CHECKPOINT_RETENTION_INTERVAL,
+    connection_string: Optional[str] = None,
+    policy: Optional[RetentionPolicy] = None,
+) -> None:
+    """Prune checkpoints every `interval` seconds until cancelled."""
+    while True:
+        try:
+            report = await asyncio.to_thread(
+                prune_checkpoints, connection_string, policy
+            )
+            if report.rows_deleted:
+                print(f"Checkpoint retention: {report.summary()}")
+        except Exception as e:
+            print(f"Warning: Checkpoint retention run failed: {e}")
+        await asyncio.sleep(interval)
+
+
+def start_retention_task(
+    interval: float = CHECKPOINT_RETENTION_INTERVAL,
+    policy: Optional[RetentionPolicy] = None,
+) -> Optional["asyncio.Task[None]"]:
+    """
+    Start the background retention loop on the running event loop.
+
+    Returns None when the interval is 0 or no database is configured.
+    Cancel the returned task on shutdown.
+    """
+    connection_string = _get_connection_string()
+    if interval <= 0 or not connection_string:
+        return None
+    return asyncio.get_running_loop().create_task(
+        run_retention_loop(interval, connection_string, policy)
+    )
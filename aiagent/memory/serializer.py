@@ -0,0 +1,117 @@
+"""
+Compressed Checkpoint Serializer
+
+Checkpoint blobs are dominated by large tool results (meeting transcripts,
+indented JSON payloads) that compress well. CompressedSerializer wraps the
+default serializer and compresses payloads above a size threshold, tagging
+the type as `<type>+zstd` or `<type>+zlib`. Rows without a codec suffix are
+read unchanged, so existing uncompressed checkpoints stay readable, and
+compressed rows stay readable with compression turned off.
+"""
+
+import os
+import threading
+import zlib
+from typing import Any, Optional, Tuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+try:
+    import zstandard
+except ImportError:  # zlib fallback
+    zstandard = None
+
+# "zstd", "zlib" or "none" (write uncompressed)
+CHECKPOINT_COMPRESSION = os.getenv("CHECKPOINT_COMPRESSION", "zstd").lower()
+# Payloads smaller than this many bytes are stored uncompressed
+CHECKPOINT_COMPRESSION_THRESHOLD = int(
+    os.getenv("CHECKPOINT_COMPRESSION_THRESHOLD", "1024")
+)
+CHECKPOINT_COMPRESSION_LEVEL = os.getenv("CHECKPOINT_COMPRESSION_LEVEL")
+
+_CODECS = ("zstd", "zlib")
+_DEFAULT_LEVELS = {"zstd": 3, "zlib": 6}
+
+
+class CompressedSerializer(SerializerProtocol):
+    """Serializer that compresses large payloads of a wrapped serializer."""
+
+    def __init__(
+        self,
+        serde: Optional[SerializerProtocol] = None,
+        codec: str = CHECKPOINT_COMPRESSION,
+        threshold: int = CHECKPOINT_COMPRESSION_THRESHOLD,
+        level: Optional[int] = None,
+    ):
+        if codec not in _CODECS and codec != "none":
+            raise ValueError(f"Unsupported checkpoint compression codec: {codec}")
+        if codec == "zstd" and zstandard is None:
+            print("Warning: zstandard is not installed; compressing checkpoints with zlib")
+            codec = "zlib"
+        self.serde = serde or JsonPlusSerializer()
+        self.codec = codec
+        self.threshold = threshold
+        self.level = level if level is not None else _DEFAULT_LEVELS.get(codec, 0)
+        # zstandard contexts are not thread-safe
+        self._local = threading.local()
+
+    def _zstd_compressor(self) -> Any:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level
+            )
+        return compressor
+
+    def _zstd_decompressor(self) -> Any:
+        if zstandard is None:
+            raise ImportError(
+                "Checkpoint was compressed with zstd; install `zstandard` to read it"
+            )
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor
+
+    def compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return self._zstd_compressor().compress(data)
+        return zlib.compress(data, self.level)
+
+    def decompress(self, codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            return self._zstd_decompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """Serialize an object, compressing the bytes if that pays off."""
+        typ, data = self.serde.dumps_typed(obj)
+        if self.codec == "none" or len(data) < self.threshold:
+            return typ, data
+        compressed = self.compress(data)
+        if len(compressed) >= len(data):
+            return typ, data
+        return f"{typ}+{self.codec}", compressed
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        typ, payload = data
+        base, sep, codec = typ.rpartition("+")
+        if sep and codec in _CODECS:
+            return self.serde.loads_typed((base, self.decompress(codec, payload)))
+        # Uncompressed (including rows written before compression was enabled)
+        return self.serde.loads_typed(data)
+
+
+def get_checkpoint_serializer() -> CompressedSerializer:
+    """
+    Build the checkpoint serializer from the CHECKPOINT_COMPRESSION settings.
+
+    With compression set to "none" the serializer still reads compressed rows.
+    """
+    level = int(CHECKPOINT_COMPRESSION_LEVEL) if CHECKPOINT_COMPRESSION_LEVEL else None
+    try:
+        return CompressedSerializer(level=level)
+    except ValueError as e:
+        print(f"Warning: {e}; checkpoints will not be compressed")
+        return CompressedSerializer(codec="none")
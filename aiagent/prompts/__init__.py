@@ -3,7 +3,9 @@ Prompt building functions for Knowted AI Agent
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+from tools.utils.meeting_type_registry import meeting_types_prompt
 
 SYSTEM_PROMPT_TEMPLATE = """## Role:
 You are Knowted, an AI assistant integrated into the Knowted application. You're an expert at analysing meetings and you assist {user_name} by analysing organised meeting data and meeting transcripts.
@@ -25,12 +27,12 @@ Using current time Assume date range however if no result is found, mention abou
 
 {meeting_types_text}
 
-When searching begin broad and don't assume the meeting type. Query multiple until it is clear.
+When searching begin broad and don't assume the meeting type. Pass several comma-separated meeting_type_ids to smart_search_meetings in one call rather than searching each type in turn.
 
 Tools:
 Smart Search allows you to create your own query and get returned the results
 
-To get transcripts just use the meeting Id returned from list meeting of RAG tools
+To get transcripts just use the meeting Id returned from list meeting of RAG tools with get_meeting_transcript (long transcripts come in pages), or search_meeting_transcript to find where something was said
 
 ## Never ask the user for the meeting_type instead attempt all meeting_types in search if necassary.
 
@@ -47,36 +49,34 @@ To get transcripts just use the meeting Id returned from list meeting of RAG too
 
 
 def _format_meeting_types(accessible_meeting_types: Optional[List[Dict]]) -> str:
-    """Format meeting types for the system prompt."""
-    if not accessible_meeting_types:
-        return "No meeting types available"
-
-    meeting_types_list = []
-    for meeting_type in accessible_meeting_types:
-        meeting_type_name = meeting_type.get("name", "Unknown")
-        meeting_type_id = meeting_type.get("id", "")
-        meeting_type_description = meeting_type.get("description", "")
-        meeting_types_list.append(
-            f"Name: {meeting_type_name}\nID: {meeting_type_id}\nDescription: {meeting_type_description}"
-        )
-    return "\n\n".join(meeting_types_list)
+    """Format meeting types for the system prompt (memoized; built once per list)."""
+    return meeting_types_prompt(accessible_meeting_types)
 
 
-def build_system_prompt_from_config(config: Optional[Dict]) -> str:
+def build_system_prompt_from_config(
+    config: Optional[Dict], user_context: Optional[Dict] = None
+) -> str:
     """
     Build system prompt from config.
 
     Args:
         config: LangGraph config dict with configurable containing user context
+        user_context: Snapshot from `fetch_user_context`, filling in values
+            the config does not set
 
     Returns:
         Formatted system prompt string with default values if config is missing
     """
     configurable = config.get("configurable", {}) if config else {}
-    user_name = configurable.get("user_name", "users")
-    accessible_meeting_types = configurable.get("accessible_meeting_types", [])
-    organization_name = configurable.get("organization_name")
-    team_name = configurable.get("team_name")
+    user_context = user_context or {}
+
+    def value(key: str) -> Any:
+        return configurable.get(key) or user_context.get(key)
+
+    user_name = value("user_name") or "users"
+    accessible_meeting_types = configurable.get("accessible_meeting_types")
+    organization_name = value("organization_name")
+    team_name = value("team_name")
     current_meeting_id = configurable.get("current_meeting_id")
     current_time = datetime.now().isoformat()
 
@@ -95,7 +95,13 @@ def build_system_prompt_from_config(config: Optional[Dict]) -> str:
     if current_meeting_id:
         current_meeting_context = f"\n- Current Meeting ID: {current_meeting_id} (The user is currently viewing this meeting. When the user asks questions without specifying a meeting, prioritize information from this meeting.)"
 
-    meeting_types_text = _format_meeting_types(accessible_meeting_types)
+    if accessible_meeting_types:
+        meeting_types_text = _format_meeting_types(accessible_meeting_types)
+    else:
+        # The meeting-type registry's prebuilt fragment, via the user context
+        meeting_types_text = user_context.get("meeting_types_prompt") or _format_meeting_types(
+            user_context.get("accessible_meeting_types")
+        )
 
     return SYSTEM_PROMPT_TEMPLATE.format(
         user_name=user_name,
@@ -7,11 +7,18 @@ RAG layer for accessing Knowted's knowledge base:
 - Team data
 """
 
-from .vector_store import get_vector_store, setup_vector_store
+from .vector_store import (
+    get_shared_vector_store,
+    get_vector_store,
+    reset_vector_store,
+    setup_vector_store,
+)
 from .retriever import create_knowted_retriever
 
 __all__ = [
     "get_vector_store",
+    "get_shared_vector_store",
+    "reset_vector_store",
     "setup_vector_store",
     "create_knowted_retriever",
 ]
@@ -0,0 +1,236 @@
+"""
+Query Embedding Cache for Knowted RAG
+
+Wraps an embeddings model so repeated queries are embedded once. Keys are
+the normalized query text plus the model name; the model is always sent
+the caller's original text. Lookups go through a bounded in-memory LRU,
+then an optional SQLite tier; concurrent async misses are batched into a
+single embeddings call.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+_Key = Tuple[str, str]
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace and case so near-identical queries share a key."""
+    return " ".join(text.split()).casefold()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    batches: int = 0
+    batched_texts: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.persistent_hits + self.misses
+        return (self.hits + self.persistent_hits) / lookups if lookups else 0.0
+
+
+class SQLiteEmbeddingStore:
+    """Persistent embedding tier backed by a local SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                "model TEXT NOT NULL, query TEXT NOT NULL, embedding BLOB NOT NULL, "
+                "created_at REAL NOT NULL, PRIMARY KEY (model, query))"
+            )
+            self._conn.commit()
+
+    def get_many(self, keys: List[_Key]) -> Dict[_Key, List[float]]:
+        found: Dict[_Key, List[float]] = {}
+        with self._lock:
+            for model, query in keys:
+                row = self._conn.execute(
+                    "SELECT embedding FROM query_embeddings WHERE model = ? AND query = ?",
+                    (model, query),
+                ).fetchone()
+                if row is not None:
+                    found[(model, query)] = array("d", row[0]).tolist()
+        return found
+
+    def put_many(self, items: Dict[_Key, List[float]]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO query_embeddings VALUES (?, ?, ?, ?)",
+                [
+                    (model, query, array("d", vector).tobytes(), now)
+                    for (model, query), vector in items.items()
+                ],
+            )
+            self._conn.commit()
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that caches query embeddings.
+
+    Document embeddings pass straight through. Batched misses are embedded
+    with `aembed_documents`, which for OpenAI models yields the same vectors
+    as `aembed_query`.
+    """
+
+    def __init__(
+        self,
+        underlying: Embeddings,
+        maxsize: int = 1024,
+        store: Optional[SQLiteEmbeddingStore] = None,
+        batch_window: float = 0.005,
+    ):
+        self.underlying = underlying
+        self.model_name = str(
+            getattr(underlying, "model", None) or type(underlying).__name__
+        )
+        self.maxsize = maxsize
+        self.store = store
+        self.batch_window = batch_window
+        self.stats = EmbeddingCacheStats()
+        self._lru: "OrderedDict[_Key, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Per event loop: pending futures by key, and keys waiting for the next flush
+        self._inflight: "weakref.WeakKeyDictionary[Any, Dict[_Key, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Original text of each queued key (the first caller's)
+        self._queued: "weakref.WeakKeyDictionary[Any, Dict[_Key, str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._flushes: "Set[asyncio.Task]" = set()
+
+    def _key(self, text: str) -> _Key:
+        return (self.model_name, normalize_query(text))
+
+    def _lru_get(self, key: _Key) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._lru.get(key)
+            if vector is not None:
+                self._lru.move_to_end(key)
+            return vector
+
+    def _lru_put(self, key: _Key, vector: List[float]) -> None:
+        with self._lock:
+            self._lru[key] = vector
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.underlying.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.underlying.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._lru_get(key)
+        if vector is not None:
+            self.stats.hits += 1
+            return list(vector)
+        if self.store is not None:
+            vector = self.store.get_many([key]).get(key)
+            if vector is not None:
+                self.stats.persistent_hits += 1
+                self._lru_put(key, vector)
+                return list(vector)
+        self.stats.misses += 1
+        vector = self.underlying.embed_query(text)
+        self._lru_put(key, vector)
+        if self.store is not None:
+            self.store.put_many({key: vector})
+        return list(vector)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = self._key(text)
+        vector = self._lru_get(key)
+        if vector is not None:
+            self.stats.hits += 1
+            return list(vector)
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        future = inflight.get(key)
+        if future is None:
+            future = loop.create_future()
+            inflight[key] = future
+            queued = self._queued.setdefault(loop, {})
+            if not queued:
+                loop.call_later(self.batch_window, self._start_flush, loop)
+            queued[key] = text
+        return list(await asyncio.shield(future))
+
+    def _start_flush(self, loop: Any) -> None:
+        task = loop.create_task(self._flush(loop))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, loop: Any) -> None:
+        """Resolve every queued key with at most one embeddings call."""
+        queued = self._queued.pop(loop, {})
+        inflight = self._inflight.get(loop, {})
+        if not queued:
+            return
+        keys = list(queued)
+        try:
+            found: Dict[_Key, List[float]] = {}
+            if self.store is not None:
+                found = await asyncio.to_thread(self.store.get_many, keys)
+                self.stats.persistent_hits += len(found)
+            missing = [key for key in keys if key not in found]
+            if missing:
+                self.stats.misses += len(missing)
+                self.stats.batches += 1
+                self.stats.batched_texts += len(missing)
+                vectors = await self.underlying.aembed_documents(
+                    [queued[key] for key in missing]
+                )
+                fresh = dict(zip(missing, vectors))
+                found.update(fresh)
+                if self.store is not None:
+                    await asyncio.to_thread(self.store.put_many, fresh)
+            for key in keys:
+                self._lru_put(key, found[key])
+                future = inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_result(found[key])
+        except BaseException as e:
+            # Fail the waiting callers too, including when the flush is cancelled
+            for key in keys:
+                future = inflight.pop(key, None)
+                if future is not None and not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._lru),
+            "maxsize": self.maxsize,
+            "model": self.model_name,
+            "persistent": self.store.path if self.store is not None else None,
+            **asdict(self.stats),
+            "hit_rate": round(self.stats.hit_rate, 4),
+        }
@@ -6,7 +6,7 @@ Creates retriever tools for accessing Knowted's knowledge base.
 
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.tools import create_retriever_tool
-from .vector_store import setup_vector_store
+from .vector_store import get_shared_vector_store
 
 
 def create_knowted_retriever(
@@ -23,7 +23,7 @@ def create_knowted_retriever(
     Returns:
         Retriever tool
     """
-    vector_store = setup_vector_store(collection_name)
+    vector_store = get_shared_vector_store(collection_name)
     retriever = vector_store.as_retriever(search_kwargs={"k": k})
     
     return create_retriever_tool(
@@ -3,13 +3,24 @@ Vector Store Setup for Knowted RAG
 
 Uses PostgreSQL with pgvector extension for vector storage.
 Falls back to in-memory store for development.
+
+`get_shared_vector_store()` keeps one store per collection for the whole
+process, backed by a pooled SQLAlchemy engine, so the retrieval hot path
+only pays for the query embedding and one SQL query.
 """
 
 import os
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
-from langchain_community.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
 from langchain_openai import OpenAIEmbeddings
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+from .embedding_cache import CachedQueryEmbeddings, SQLiteEmbeddingStore
 
 # Try to import PGVector from langchain_postgres (new), fallback to langchain_community (old)
 try:
@@ -23,15 +34,66 @@ except ImportError:
 
     USE_NEW_PGVECTOR = False
 
+# Connection pool settings for the shared vector store engine
+VECTOR_STORE_POOL_SIZE = int(os.getenv("VECTOR_STORE_POOL_SIZE", "5"))
+VECTOR_STORE_MAX_OVERFLOW = int(os.getenv("VECTOR_STORE_MAX_OVERFLOW", "10"))
+VECTOR_STORE_POOL_RECYCLE = int(os.getenv("VECTOR_STORE_POOL_RECYCLE", "1800"))
+# Seconds between health checks of a shared store
+VECTOR_STORE_HEALTH_CHECK_INTERVAL = float(
+    os.getenv("VECTOR_STORE_HEALTH_CHECK_INTERVAL", "60")
+)
+
+
+# Query embedding cache: in-memory LRU size (0 disables) and optional SQLite tier
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+EMBEDDING_CACHE_SQLITE_PATH = os.getenv("EMBEDDING_CACHE_SQLITE_PATH", "")
+
+_cached_embeddings: Optional[CachedQueryEmbeddings] = None
+_embeddings_lock = threading.Lock()
+
+
+def embedding_cache_stats() -> Optional[Dict[str, Any]]:
+    """Counters for the shared query embedding cache, if it has been created."""
+    return _cached_embeddings.snapshot() if _cached_embeddings is not None else None
+
+
+def _engine_args() -> Dict[str, Any]:
+    return {
+        "pool_size": VECTOR_STORE_POOL_SIZE,
+        "max_overflow": VECTOR_STORE_MAX_OVERFLOW,
+        "pool_recycle": VECTOR_STORE_POOL_RECYCLE,
+        # Validate connections on checkout so dropped sockets are replaced
+        "pool_pre_ping": True,
+    }
+
 
 def get_embeddings():
     """
     Get embeddings model.
     Uses OpenAI embeddings (can be switched to Anthropic if available).
+
+    Query embeddings are cached process-wide (see `rag.embedding_cache`)
+    unless EMBEDDING_CACHE_SIZE is 0.
     """
+    global _cached_embeddings
+
     api_key = os.getenv("OPENAI_API_KEY")
     if api_key:
-        return OpenAIEmbeddings(openai_api_key=api_key)
+        if EMBEDDING_CACHE_SIZE <= 0:
+            return OpenAIEmbeddings(openai_api_key=api_key)
+        with _embeddings_lock:
+            if _cached_embeddings is None:
+                store = (
+                    SQLiteEmbeddingStore(EMBEDDING_CACHE_SQLITE_PATH)
+                    if EMBEDDING_CACHE_SQLITE_PATH
+                    else None
+                )
+                _cached_embeddings = CachedQueryEmbeddings(
+                    OpenAIEmbeddings(openai_api_key=api_key),
+                    maxsize=EMBEDDING_CACHE_SIZE,
+                    store=store,
+                )
+            return _cached_embeddings
 
     # Fallback: Use Anthropic embeddings if available
     # Note: Anthropic doesn't have separate embeddings, so we'll use OpenAI
@@ -44,6 +106,7 @@ def get_embeddings():
 def get_vector_store(
     collection_name: str = "knowted_knowledge_base",
     use_postgres: bool = True,
+    engine: Optional[Engine] = None,
 ) -> Optional[PGVector]:
     """
     Get or create vector store.
@@ -51,6 +114,7 @@ def get_vector_store(
     Args:
         collection_name: Name of the collection
         use_postgres: Whether to use PostgreSQL (requires pgvector)
+        engine: Pooled SQLAlchemy engine to reuse (new PGVector API only)
 
     Returns:
         Vector store instance
@@ -68,7 +132,7 @@ def get_vector_store(
                 # This should be called lazily, not during module import
                 return PGVector(
                     embeddings=embeddings,
-                    connection=connection_string,
+                    connection=engine or connection_string,
                     collection_name=collection_name,
                     use_jsonb=True,  # Use JSONB for metadata as recommended
                     pre_delete_collection=False,  # Don't delete on init
@@ -79,6 +143,7 @@ def get_vector_store(
                     embedding_function=embeddings,
                     connection_string=connection_string,
                     collection_name=collection_name,
+                    engine_args=_engine_args(),
                 )
         except Exception as e:
             print(f"Warning: Could not connect to PostgreSQL vector store: {e}")
@@ -93,18 +158,20 @@ def get_vector_store(
 
 def setup_vector_store(
     collection_name: str = "knowted_knowledge_base",
+    engine: Optional[Engine] = None,
 ) -> PGVector:
     """
     Setup and initialize vector store.
 
     Args:
         collection_name: Name of the collection
+        engine: Pooled SQLAlchemy engine to reuse (optional)
 
     Returns:
         Initialized vector store (falls back to in-memory if PostgreSQL unavailable)
     """
     try:
-        vector_store = get_vector_store(collection_name)
+        vector_store = get_vector_store(collection_name, engine=engine)
 
         if vector_store is None:
             # Use in-memory store for development
@@ -122,3 +189,152 @@ def setup_vector_store(
             raise ValueError(
                 f"Could not setup vector store or in-memory fallback: {e2}"
             ) from e2
+
+
+@dataclass
+class _SharedStore:
+    store: VectorStore
+    engine: Optional[Engine]
+    checked_at: float
+    # In-memory fallback standing in for a configured PostgreSQL store
+    degraded: bool = False
+
+
+_shared_stores: Dict[str, _SharedStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def _connection_string() -> Optional[str]:
+    return os.getenv("DATABASE_URL") or os.getenv("POSTGRES_CONNECTION_STRING")
+
+
+def _create_pooled_engine() -> Optional[Engine]:
+    connection_string = _connection_string()
+    if not connection_string or not USE_NEW_PGVECTOR:
+        return None
+    return create_engine(connection_string, **_engine_args())
+
+
+# Expression indexes serving the tenant filter pushed down by rag_search
+# ((cmetadata ->> key) IN (...)), scoped by collection
+_METADATA_INDEXES = {
+    "ix_langchain_pg_embedding_organization_id": "organization_id",
+    "ix_langchain_pg_embedding_organisation_id": "organisation_id",
+}
+
+
+def ensure_metadata_indexes(engine: Engine) -> None:
+    """Create the tenant metadata indexes if they don't exist yet."""
+    try:
+        with engine.begin() as conn:
+            for index_name, key in _METADATA_INDEXES.items():
+                conn.execute(
+                    text(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} "
+                        "ON langchain_pg_embedding "
+                        f"(collection_id, (cmetadata ->> '{key}'))"
+                    )
+                )
+    except Exception as e:
+        print(f"Warning: Could not create vector store metadata indexes: {e}")
+
+
+def _is_healthy(entry: _SharedStore) -> bool:
+    """
+    Run a trivial query through the pool.
+
+    In-memory stores are healthy unless they are a fallback for a configured
+    PostgreSQL store, so that the next check retries the PostgreSQL build.
+    """
+    if entry.degraded:
+        return False
+    if entry.engine is None:
+        return True
+    try:
+        with entry.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        print(f"Warning: Vector store health check failed: {e}")
+        return False
+
+
+def _build_shared_store(collection_name: str, now: float) -> _SharedStore:
+    engine = _create_pooled_engine()
+    store = setup_vector_store(collection_name, engine=engine)
+    degraded = bool(_connection_string()) and not isinstance(store, PGVector)
+    if engine is not None and not isinstance(store, PGVector):
+        # Fell back to in-memory; the engine is unused
+        engine.dispose()
+        engine = None
+    if engine is not None:
+        ensure_metadata_indexes(engine)
+    if degraded:
+        print("Warning: Serving an in-memory vector store until PostgreSQL is reachable")
+    return _SharedStore(store, engine, now, degraded)
+
+
+def get_shared_vector_store(
+    collection_name: str = "knowted_knowledge_base",
+) -> VectorStore:
+    """
+    Get the process-wide vector store for a collection, building it once.
+
+    The store is periodically health-checked; if the check fails, its
+    engine is disposed and the store is rebuilt. An in-memory fallback for a
+    configured PostgreSQL store fails every check, so the PostgreSQL build
+    is retried each interval. Checks and builds do
+    network and database I/O and run outside the registry lock, so call
+    this through `asyncio.to_thread` from async code.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        Shared vector store (in-memory if PostgreSQL is unavailable)
+    """
+    with _shared_stores_lock:
+        entry = _shared_stores.get(collection_name)
+    now = time.monotonic()
+    if entry is not None:
+        if now - entry.checked_at < VECTOR_STORE_HEALTH_CHECK_INTERVAL:
+            return entry.store
+        if _is_healthy(entry):
+            entry.checked_at = now
+            return entry.store
+
+    built = _build_shared_store(collection_name, now)
+    with _shared_stores_lock:
+        current = _shared_stores.get(collection_name)
+        if current is not None and current is not entry:
+            # Another thread installed a fresh store first; keep it
+            winner, loser = current, built
+        else:
+            _shared_stores[collection_name] = built
+            winner, loser = built, current
+    if loser is not None:
+        _dispose(loser)
+    return winner.store
+
+
+def reset_vector_store(collection_name: Optional[str] = None) -> None:
+    """
+    Drop shared stores so the next call reconnects.
+
+    Args:
+        collection_name: Collection to reset (omit to reset all)
+    """
+    with _shared_stores_lock:
+        names = [collection_name] if collection_name else list(_shared_stores)
+        for name in names:
+            entry = _shared_stores.pop(name, None)
+            if entry is not None:
+                _dispose(entry)
+
+
+def _dispose(entry: _SharedStore) -> None:
+    if entry.engine is not None:
+        try:
+            entry.engine.dispose()
+        except Exception as e:
+            print(f"Warning: Could not dispose vector store engine: {e}")
@@ -0,0 +1,43 @@
+"""Shared fixtures: backend-shaped meeting rows."""
+
+from typing import Callable, List, Optional
+
+import pytest
+
+
+def _list_row(
+    index: int, meeting_type: str, duration: Optional[int], participants: List[str]
+) -> dict:
+    """A row as `api/v1/meetings` returns it (MeetingListResponseDto)."""
+    return {
+        "id": f"meeting-{index}",
+        "analysed": True,
+        "duration_mins": duration,
+        "host_email": participants[0],
+        "meeting_date": f"2025-03-{3 + index:02d}T10:00:00.000Z",
+        "meeting_url": None,
+        "created_at": "2025-03-01T00:00:00.000Z",
+        "participants_email": participants,
+        "thumbnail": None,
+        "title": f"Meeting {index}",
+        "video_processing_status": "completed",
+        "team": {"id": "team-1", "name": "Engineering"},
+        "meetingType": {"id": f"type-{meeting_type}", "name": meeting_type},
+    }
+
+
+def _project(row: dict, columns: List[str]) -> dict:
+    """What a backend honouring `select=` returns for a row."""
+    return {key: value for key, value in row.items() if key in columns}
+
+
+@pytest.fixture
+def list_row() -> Callable[..., dict]:
+    """Factory: list_row(index, meeting_type, duration, participants); the first participant hosts."""
+    return _list_row
+
+
+@pytest.fixture
+def project() -> Callable[[dict, List[str]], dict]:
+    """Factory: project(row, columns) keeps the projected columns of a row."""
+    return _project
@@ -0,0 +1,96 @@
+"""Deadline scopes, request timeouts and per-tool budgets."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from tools.core import deadline
+from tools.core.deadline import (
+    DeadlineExceeded,
+    DeadlineMiddleware,
+    deadline_scope,
+    remaining,
+    request_timeout,
+)
+
+
+def tool_request(state=None):
+    return SimpleNamespace(
+        tool_call={"name": "slow_tool", "id": "call-1", "args": {}}, state=state or {}
+    )
+
+
+def test_nested_scopes_only_shorten_the_deadline():
+    assert remaining() is None
+    with deadline_scope(10) as outer:
+        with deadline_scope(60) as inner:
+            assert inner == outer
+        with deadline_scope(1) as shorter:
+            assert shorter < outer
+        assert deadline.get_deadline() == outer
+    assert remaining() is None
+
+
+def test_request_timeout_is_capped_and_raises_once_expired():
+    assert request_timeout(30) == 30
+    with deadline_scope(5):
+        assert 4 < request_timeout(30) <= 5
+    with deadline_scope(at=time.time() - 1):
+        with pytest.raises(DeadlineExceeded):
+            request_timeout(30)
+
+
+def test_tool_budget_overrides_and_disabling(monkeypatch):
+    monkeypatch.setattr(deadline, "KNOWTED_TOOL_BUDGET", 30.0)
+    monkeypatch.setattr(deadline, "KNOWTED_TOOL_BUDGETS", {"fast_tool": 5.0, "free_tool": 0.0})
+
+    assert deadline.tool_budget("fast_tool") == 5.0
+    assert deadline.tool_budget("other_tool") == 30.0
+    assert deadline.tool_budget("free_tool") is None
+
+
+def test_tool_over_budget_returns_an_error_message(monkeypatch):
+    monkeypatch.setattr(deadline, "KNOWTED_TOOL_BUDGETS", {"slow_tool": 0.05})
+    monkeypatch.setattr(deadline, "_CANCEL_GRACE", 0.0)
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    message = asyncio.run(DeadlineMiddleware().awrap_tool_call(tool_request(), handler))
+
+    assert message.status == "error"
+    assert "slow_tool stopped because it ran out of time" in message.content
+    assert cancelled == [True]
+
+
+def test_exhausted_run_deadline_skips_the_tool():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+
+    request = tool_request({"run_deadline": time.time() - 1})
+    message = asyncio.run(DeadlineMiddleware().awrap_tool_call(request, handler))
+
+    assert "the run's time budget is exhausted" in message.content
+    assert calls == []
+
+
+def test_tool_sees_the_earlier_of_run_deadline_and_budget(monkeypatch):
+    monkeypatch.setattr(deadline, "KNOWTED_TOOL_BUDGETS", {"slow_tool": 60.0})
+    run_deadline = time.time() + 2
+
+    async def handler(request):
+        return deadline.get_deadline()
+
+    request = tool_request({"run_deadline": run_deadline})
+    seen = asyncio.run(DeadlineMiddleware().awrap_tool_call(request, handler))
+
+    assert seen == run_deadline
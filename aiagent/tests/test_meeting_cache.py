@@ -0,0 +1,48 @@
+"""Meeting cache invalidation racing an in-flight fetch."""
+
+import asyncio
+
+import pytest
+
+from tools.meetings import meeting_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    meeting_cache.meeting_cache.clear()
+    yield
+    meeting_cache.meeting_cache.clear()
+
+
+def test_fetch_in_flight_during_an_update_is_not_cached(monkeypatch):
+    state = {"title": "Before"}
+    events = {}
+    calls = []
+
+    async def backend(endpoint, **kwargs):
+        title = state["title"]
+        calls.append(title)
+        if len(calls) == 1:
+            events["sent"].set()
+            await events["updated"].wait()
+        return {"id": "meeting-1", "title": title}
+
+    monkeypatch.setattr(meeting_cache, "_make_api_request", backend)
+
+    async def scenario():
+        events.update(sent=asyncio.Event(), updated=asyncio.Event())
+        stale = asyncio.ensure_future(
+            meeting_cache.fetch_meeting("meeting-1", "org", "user", "secret")
+        )
+        await events["sent"].wait()
+        state["title"] = "After"
+        meeting_cache.invalidate_meeting("org", "meeting-1")
+        # Started after the update: does not join the stale fetch
+        fresh = await meeting_cache.fetch_meeting("meeting-1", "org", "user", "secret")
+        events["updated"].set()
+        await stale
+        cached = await meeting_cache.fetch_meeting("meeting-1", "org", "user", "secret")
+        return (await stale)["title"], fresh["title"], cached["title"]
+
+    assert asyncio.run(scenario()) == ("Before", "After", "After")
+    assert calls == ["Before", "After"]
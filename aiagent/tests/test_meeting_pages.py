@@ -0,0 +1,103 @@
+"""Paging, bounded prefetch and early close of the meetings iterator."""
+
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from tools.meetings import meeting_pages
+from tools.meetings.meeting_pages import MeetingPages, collect_meetings
+
+
+def backend(monkeypatch, total: int, fail_on_page=None):
+    """Serve `total` meetings in pages; returns the list of requested pages."""
+    requested = []
+
+    async def request(endpoint, **kwargs):
+        query = parse_qs(urlsplit(endpoint).query)
+        page, limit = int(query["page"][0]), int(query["limit"][0])
+        requested.append(page)
+        await asyncio.sleep(0)
+        if page == fail_on_page:
+            return {"statusCode": 403, "message": "Forbidden resource"}
+        ids = range(page * limit, min(total, (page + 1) * limit))
+        return {
+            "data": [{"id": f"meeting-{i}"} for i in ids],
+            "total": total,
+            "hasNextPage": (page + 1) * limit < total,
+        }
+
+    monkeypatch.setattr(meeting_pages, "_make_api_request", request)
+    return requested
+
+
+def test_pages_are_read_in_order_until_the_last(monkeypatch):
+    requested = backend(monkeypatch, total=25)
+
+    async def scenario():
+        async with MeetingPages({}, "org", "user", "secret", page_size=10) as pages:
+            rows = [row["id"] async for row in pages.rows()]
+        return rows, pages
+
+    rows, pages = asyncio.run(scenario())
+
+    assert rows == [f"meeting-{i}" for i in range(25)]
+    assert requested == [0, 1, 2]
+    assert pages.total == 25 and pages.exhausted
+
+
+def test_collect_stops_at_the_limit(monkeypatch):
+    requested = backend(monkeypatch, total=1000)
+
+    result = asyncio.run(collect_meetings({}, "org", "user", "secret", limit=150))
+
+    assert len(result["data"]) == 150
+    assert result["total"] == 1000 and result["hasNextPage"]
+    assert requested == [0, 1]
+
+
+def test_prefetch_is_bounded_while_the_consumer_waits(monkeypatch):
+    requested = backend(monkeypatch, total=1000)
+
+    async def scenario():
+        async with MeetingPages({}, "org", "user", "secret", page_size=10, prefetch=1) as pages:
+            await pages.__anext__()
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return list(requested)
+
+    # Page 0 was read, page 1 waits in the queue, page 2 waits to be put
+    assert asyncio.run(scenario()) == [0, 1, 2]
+
+
+def test_leaving_early_cancels_the_prefetch(monkeypatch):
+    requested = backend(monkeypatch, total=1000)
+
+    async def scenario():
+        async with MeetingPages({}, "org", "user", "secret", page_size=10) as pages:
+            async for _ in pages:
+                break
+        fetched = len(requested)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        return pages, fetched
+
+    pages, fetched = asyncio.run(scenario())
+
+    assert pages._task.cancelled()
+    assert len(requested) == fetched
+    assert not pages.exhausted
+
+
+def test_backend_errors_reach_the_consumer(monkeypatch):
+    backend(monkeypatch, total=1000, fail_on_page=1)
+
+    async def scenario():
+        pages_read = 0
+        async with MeetingPages({}, "org", "user", "secret", page_size=10) as pages:
+            with pytest.raises(ValueError, match="Forbidden resource"):
+                async for _ in pages:
+                    pages_read += 1
+        return pages_read
+
+    assert asyncio.run(scenario()) == 1
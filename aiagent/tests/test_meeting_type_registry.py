@@ -0,0 +1,51 @@
+"""Meeting-type registry isolation between users of one organization."""
+
+import asyncio
+
+from tools.utils import meeting_type_registry
+
+
+def test_registry_is_not_shared_between_users(monkeypatch):
+    calls = []
+
+    async def backend(endpoint, *, user_id, **kwargs):
+        calls.append(user_id)
+        if user_id == "reader":
+            return [{"id": "type-1", "name": "Standup", "description": "Daily"}]
+        return {"statusCode": 403, "message": "Forbidden"}
+
+    monkeypatch.setattr(meeting_type_registry, "_make_api_request", backend)
+    meeting_type_registry.meeting_type_registry_cache.clear()
+
+    async def scenario():
+        registry = await meeting_type_registry.get_meeting_type_registry(
+            "org", "reader", "secret"
+        )
+        assert registry.get("type-1")["name"] == "Standup"
+        try:
+            await meeting_type_registry.get_meeting_type_registry("org", "other", "secret")
+        except ValueError as e:
+            return str(e)
+
+    assert asyncio.run(scenario()) == "Forbidden"
+    assert calls == ["reader", "other"]
+
+
+def test_invalidate_drops_one_user_or_the_organization(monkeypatch):
+    async def backend(endpoint, **kwargs):
+        return [{"id": "type-1", "name": "Standup"}]
+
+    monkeypatch.setattr(meeting_type_registry, "_make_api_request", backend)
+    cache = meeting_type_registry.meeting_type_registry_cache
+    cache.clear()
+
+    async def load(user_id):
+        await meeting_type_registry.get_meeting_type_registry("org", user_id, "secret")
+
+    async def scenario():
+        for user_id in ("a", "b", "c"):
+            await load(user_id)
+
+    asyncio.run(scenario())
+    assert meeting_type_registry.invalidate_meeting_type_registry("org", "a") == 1
+    assert meeting_type_registry.invalidate_meeting_type_registry("org") == 2
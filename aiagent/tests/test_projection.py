@@ -0,0 +1,70 @@
+"""select= projections: column validation and handling of backend rejections."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tools.core import api_tools
+from tools.search.smart_search_tool import _projection
+
+CONTEXT = {"organization_id": "org", "user_id": "user", "internal_service_secret": "secret"}
+
+
+def test_unknown_sort_columns_are_not_projected():
+    assert _projection("title", None, "made_up_column DESC") == ["id", "title"]
+    assert _projection("title", "Objectives", "duration_mins ASC") == [
+        "id",
+        "title",
+        "duration_mins",
+        "summary_meta_data.Objectives",
+    ]
+    assert _projection(None, None, "title") is None
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Backend rejecting select= with the given 400 message; returns the requested URLs."""
+    monkeypatch.setattr(api_tools, "KNOWTED_API_PROJECTION", True)
+    monkeypatch.setattr(api_tools, "_projection_unsupported", set())
+    requested = []
+
+    def serve(message):
+        async def handler(request):
+            requested.append(str(request.url))
+            if "select=" in str(request.url):
+                return httpx.Response(400, json={"statusCode": 400, "message": message})
+            return httpx.Response(200, json={"data": [], "total": 0})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(api_tools, "get_http_client", lambda: client)
+        return requested
+
+    return serve
+
+
+def request(endpoint):
+    return asyncio.run(
+        api_tools._make_api_request(endpoint, select=["id", "title"], **CONTEXT)
+    )
+
+
+def test_rejected_select_property_disables_projection_for_the_path(backend):
+    requested = backend(["property select should not exist"])
+
+    assert request("api/v1/reports/a?page=0") == {"data": [], "total": 0}
+    request("api/v1/reports/a?page=1")
+
+    assert ["select=" in url for url in requested] == [True, False, False]
+    assert api_tools._projection_unsupported == {"api/v1/reports/a"}
+
+
+def test_other_rejections_only_affect_the_request(backend):
+    requested = backend(["select contains unknown column made_up_column"])
+
+    assert request("api/v1/reports/b") == {"data": [], "total": 0}
+    request("api/v1/reports/b")
+
+    assert ["select=" in url for url in requested] == [True, False, True, False]
+    assert api_tools._projection_unsupported == set()
+
@@ -0,0 +1,41 @@
+"""Report accumulator over backend-shaped meeting list pages."""
+
+import asyncio
+
+import pytest
+
+from tools.reports.report_engine import _REPORT_COLUMNS, MeetingReportAccumulator, build_meeting_report
+
+
+def test_pages_fold_into_the_report_breakdowns(list_row, project):
+    pages = [
+        [
+            list_row(0, "Standup", 15, ["a@example.com", "b@example.com"]),
+            list_row(1, "Planning", 60, ["b@example.com"]),
+        ],
+        [
+            list_row(7, "Standup", 30, ["A@example.com"]),
+            list_row(8, "Standup", None, ["c@example.com", "a@example.com"]),
+        ],
+    ]
+    accumulator = MeetingReportAccumulator()
+    for page in pages:
+        accumulator.add([project(row, _REPORT_COLUMNS) for row in page])
+    report = accumulator.report("Meetings Report", {"from": "2025-03-01", "to": "2025-03-31"})
+
+    assert report["metrics"]["meetings"] == 4
+    assert report["metrics"]["total_hours"] == 1.8
+    assert report["metrics"]["p50_duration_mins"] == 30
+    assert report["metrics"]["distinct_participants"] == 3
+    assert report["breakdowns"]["meeting_types"] == [
+        {"name": "Standup", "meetings": 3, "share": 0.75, "hours": 0.8},
+        {"name": "Planning", "meetings": 1, "share": 0.25, "hours": 1.0},
+    ]
+    assert report["breakdowns"]["teams"] == [{"name": "Engineering", "meetings": 4, "share": 1.0}]
+    assert report["breakdowns"]["weeks"] == {"2025-03-03": 2, "2025-03-10": 2}
+    assert report["breakdowns"]["participants"][0] == {"email": "a@example.com", "meetings": 3}
+
+
+def test_unsupported_report_types_are_rejected():
+    with pytest.raises(ValueError, match="team_performance"):
+        asyncio.run(build_meeting_report("org", "user", "secret", report_type="team_performance"))
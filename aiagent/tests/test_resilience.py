@@ -0,0 +1,132 @@
+"""Retry/backoff and circuit breaker transitions for backend calls."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from tools.core import resilience
+from tools.core.resilience import CircuitBreaker, CircuitOpenError, send_with_retries
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(resilience, "backoff_delay", lambda attempt: 0.0)
+    resilience._breakers.clear()
+    yield
+    resilience._breakers.clear()
+
+
+def responses(*items):
+    """A send() returning (or raising) each item in turn, counting calls."""
+    calls = []
+
+    async def send():
+        item = items[len(calls)]
+        calls.append(item)
+        if isinstance(item, Exception):
+            raise item
+        return httpx.Response(item)
+
+    return send, calls
+
+
+def test_transient_failures_are_retried_until_success():
+    send, calls = responses(httpx.ConnectError("refused"), 503, 200)
+
+    response = asyncio.run(send_with_retries("GET", "api/v1/teams", send, retries=2))
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert resilience.get_breaker("GET api/v1/teams").failures == 0
+
+
+def test_last_response_is_returned_when_retries_run_out():
+    send, calls = responses(503, 503, 503)
+
+    response = asyncio.run(send_with_retries("GET", "api/v1/teams", send, retries=2))
+
+    assert response.status_code == 503
+    assert len(calls) == 3
+
+
+def test_non_idempotent_methods_are_not_retried():
+    send, calls = responses(503, 200)
+
+    response = asyncio.run(send_with_retries("POST", "api/v1/meetings", send, retries=2))
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_retry_after_is_honoured(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(resilience.asyncio, "sleep", sleep)
+    send, _ = responses(429, 200)
+
+    async def send_with_header():
+        response = await send()
+        if response.status_code == 429:
+            return httpx.Response(429, headers={"Retry-After": "1.5"})
+        return response
+
+    response = asyncio.run(send_with_retries("GET", "api/v1/teams", send_with_header))
+
+    assert response.status_code == 200
+    assert delays == [1.5]
+
+
+def test_ids_are_collapsed_in_breaker_keys():
+    key = resilience.endpoint_key("get", "api/v1/meetings/123?x=1")
+    assert key == "GET api/v1/meetings/{id}"
+
+
+def test_breaker_opens_half_opens_and_closes():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    for _ in range(2):
+        breaker.before_call("GET x")
+        breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("GET x")
+
+    # After the reset timeout one probe goes through; others still fail fast
+    breaker.opened_at = time.monotonic() - 31
+    assert breaker.state == "half_open"
+    breaker.before_call("GET x")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("GET x")
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call("GET x")
+    assert breaker.rejected == 2
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    breaker.opened_at = time.monotonic() - 31
+    breaker.before_call("GET x")
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("GET x")
+
+
+def test_open_circuit_fails_fast_without_calling_the_backend(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    monkeypatch.setattr(resilience, "get_breaker", lambda key: breaker)
+    send, calls = responses(503, 503, 200)
+
+    first = asyncio.run(send_with_retries("GET", "api/v1/teams", send, retries=1))
+    assert first.status_code == 503
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(send_with_retries("GET", "api/v1/teams", send, retries=1))
+    assert len(calls) == 2
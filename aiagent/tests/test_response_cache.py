@@ -0,0 +1,117 @@
+"""Reference response caching, ETag revalidation and invalidation by writes."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from tools.core import api_tools
+from tools.core.response_cache import ResponseCache
+
+CONTEXT = {"organization_id": "org", "user_id": "user", "internal_service_secret": "secret"}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(policies=[("api/v1/teams*", 300.0)], maxsize=8)
+    monkeypatch.setattr(api_tools, "response_cache", cache)
+    return cache
+
+
+def serve(monkeypatch, handler):
+    """Route backend requests to `handler` (an async httpx request handler)."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(api_tools, "get_http_client", lambda: client)
+
+
+def test_only_policy_endpoints_have_a_ttl(cache):
+    assert cache.ttl_for("api/v1/teams?organization_id=org") == 300.0
+    assert cache.ttl_for("api/v1/teams/team-1") == 300.0
+    assert cache.ttl_for("api/v1/meetings") is None
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = ResponseCache(policies=[], maxsize=2)
+    for key in ("a", "b"):
+        cache.store(key, key, {}, 1, 60, cache.generation)
+    cache.lookup("a")
+    cache.store("c", "c", {}, 1, 60, cache.generation)
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").value == "a"
+    assert cache.stats.evictions == 1
+
+
+def test_expired_entry_is_revalidated_with_its_etag(cache, monkeypatch):
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": "team-1"}], headers={"ETag": '"v1"'})
+
+    serve(monkeypatch, handler)
+
+    async def scenario():
+        first = await api_tools._make_api_request("api/v1/teams", **CONTEXT)
+        # Served from the cache while fresh
+        cached = await api_tools._make_api_request("api/v1/teams", **CONTEXT)
+        cache.lookup(("org", "user", "api/v1/teams")).expires_at = time.monotonic() - 1
+        revalidated = await api_tools._make_api_request("api/v1/teams", **CONTEXT)
+        return first, cached, revalidated
+
+    first, cached, revalidated = asyncio.run(scenario())
+
+    assert requests == [None, '"v1"']
+    assert cached is first and revalidated is first
+    assert cache.stats.revalidated == 1
+
+
+def test_write_drops_the_organizations_cached_resource(cache):
+    keys = [
+        ("org", "a", "api/v1/teams"),
+        ("org", "b", "api/v1/teams/1"),
+        ("other", "a", "api/v1/teams"),
+    ]
+    for key in keys:
+        cache.store(key, [], {}, 1, 60, cache.generation)
+
+    assert cache.invalidate_for_write("org", "api/v1/teams/1") == 2
+    assert cache.lookup(("other", "a", "api/v1/teams")) is not None
+
+
+def test_get_racing_a_write_is_not_stored(cache, monkeypatch):
+    # Events are created inside the scenario's event loop
+    events = {}
+    state = {"name": "Before"}
+
+    async def handler(request):
+        if request.method == "GET":
+            name = state["name"]
+            events["get_sent"].set()
+            await events["write_done"].wait()
+            return httpx.Response(200, json={"id": "team-1", "name": name})
+        state["name"] = "After"
+        return httpx.Response(200, json={"id": "team-1", "name": "After"})
+
+    serve(monkeypatch, handler)
+
+    async def scenario():
+        events.update(get_sent=asyncio.Event(), write_done=asyncio.Event())
+        read = asyncio.ensure_future(api_tools._make_api_request("api/v1/teams/team-1", **CONTEXT))
+        await events["get_sent"].wait()
+        await api_tools._make_api_request(
+            "api/v1/teams/team-1", method="PATCH", data={"name": "After"}, **CONTEXT
+        )
+        events["write_done"].set()
+        stale = await read
+        fresh = await api_tools._make_api_request("api/v1/teams/team-1", **CONTEXT)
+        return stale, fresh
+
+    stale, fresh = asyncio.run(scenario())
+
+    # The in-flight read returns what it fetched, but it was not cached
+    assert stale["name"] == "Before"
+    assert fresh["name"] == "After"
@@ -0,0 +1,149 @@
+"""Coalescing of concurrent identical backend GETs."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from tools.core import single_flight as sf
+
+
+def test_concurrent_identical_requests_share_one_call():
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": "org-1"}
+
+    async def scenario():
+        return await asyncio.gather(
+            *(sf.single_flight("test/share", ("GET", "url", "user"), request) for _ in range(5))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert sf.single_flight_stats()["test/share"]["collapsed"] == 4
+
+
+def test_different_keys_and_later_calls_are_not_collapsed():
+    calls = []
+
+    async def request():
+        calls.append(1)
+        count = len(calls)
+        await asyncio.sleep(0)
+        return count
+
+    async def scenario():
+        first = await asyncio.gather(
+            sf.single_flight("test/keys", ("GET", "url", "user-a"), request),
+            sf.single_flight("test/keys", ("GET", "url", "user-b"), request),
+        )
+        # The first request has finished: this one runs again
+        second = await sf.single_flight("test/keys", ("GET", "url", "user-a"), request)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert sorted(first) == [1, 2]
+    assert second == 3
+
+
+def test_errors_propagate_to_every_waiter_and_are_not_kept():
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("backend down")
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(sf.single_flight("test/error", ("GET", "url"), failing) for _ in range(3)),
+            return_exceptions=True,
+        )
+        retry = await asyncio.gather(
+            sf.single_flight("test/error", ("GET", "url"), failing), return_exceptions=True
+        )
+        return results, retry
+
+    results, retry = asyncio.run(scenario())
+
+    assert [str(error) for error in results] == ["backend down"] * 3
+    assert isinstance(retry[0], ValueError)
+    assert len(calls) == 2
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others():
+    async def request():
+        await asyncio.sleep(0.02)
+        return "shared"
+
+    async def scenario():
+        first = asyncio.ensure_future(sf.single_flight("test/cancel", ("GET", "url"), request))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(sf.single_flight("test/cancel", ("GET", "url"), request))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "shared"
+
+
+def test_only_opted_in_endpoints_match():
+    assert sf.match_endpoint("api/v1/meetings/meeting-1?x=1") == "api/v1/meetings/*"
+    assert sf.match_endpoint("/api/v1/teams") == "api/v1/teams"
+    assert sf.match_endpoint("api/v1/reports/generate") is None
+
+
+def test_get_after_a_write_does_not_join_an_earlier_get(monkeypatch):
+    from tools.core import api_tools
+
+    state = {"title": "Before"}
+    events = {}
+    gets = []
+
+    async def handler(request):
+        if request.method == "GET":
+            title = state["title"]
+            gets.append(title)
+            if len(gets) == 1:
+                events["sent"].set()
+                await events["written"].wait()
+            return httpx.Response(200, json={"id": "meeting-1", "title": title})
+        state["title"] = "After"
+        return httpx.Response(200, json={"id": "meeting-1", "title": "After"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(api_tools, "get_http_client", lambda: client)
+    context = {"organization_id": "org", "user_id": "user", "internal_service_secret": "secret"}
+    endpoint = "api/v1/meetings/meeting-1?organization_id=org"
+
+    async def scenario():
+        events.update(sent=asyncio.Event(), written=asyncio.Event())
+        before = asyncio.ensure_future(api_tools._make_api_request(endpoint, **context))
+        await events["sent"].wait()
+        await api_tools._make_api_request(
+            "api/v1/meetings/meeting-1", method="PATCH", data={"title": "After"}, **context
+        )
+        after = asyncio.ensure_future(api_tools._make_api_request(endpoint, **context))
+        await asyncio.sleep(0.01)
+        events["written"].set()
+        return (await before)["title"], (await after)["title"]
+
+    assert asyncio.run(scenario()) == ("Before", "After")
+    assert gets == ["Before", "After"]
+
+
+def test_writes_are_counted_per_organization_and_resource():
+    before = sf.write_generation("org-w", "api/v1/meetings/1")
+    sf.note_write("org-w", "api/v1/meetings/2?x=1")
+
+    assert sf.write_generation("org-w", "api/v1/meetings") == before + 1
+    assert sf.write_generation("org-w", "api/v1/teams") == 0
+    assert sf.write_generation("other", "api/v1/meetings/1") == 0
@@ -0,0 +1,58 @@
+"""Team insights statistics over backend-shaped meeting list rows, and meeting failures."""
+
+import asyncio
+
+import pytest
+
+from tools.teams import team_tools
+from tools.teams.team_tools import _INSIGHT_COLUMNS
+from tools.utils.meeting_stats import meeting_insights
+
+
+def test_projection_keeps_the_fields_the_statistics_read(list_row, project):
+    rows = [
+        list_row(0, "Standup", 15, ["a@example.com"]),
+        list_row(1, "Standup", 15, ["a@example.com"]),
+        list_row(2, "Planning", 60, ["b@example.com"]),
+        list_row(3, "Standup", 30, ["a@example.com"]),
+    ]
+    insights = meeting_insights([project(row, _INSIGHT_COLUMNS) for row in rows])
+
+    assert insights["meetings"] == 4
+    assert insights["meeting_types"]["top"] == [
+        {"name": "Standup", "meetings": 3, "share": 0.75},
+        {"name": "Planning", "meetings": 1, "share": 0.25},
+    ]
+    assert insights["hosts"]["top"][0] == {"name": "a@example.com", "meetings": 3, "share": 0.75}
+    assert insights["duration_mins"]["p50"] == 22.5
+    # 2025-03-03 is a Monday: all four meetings fall in that ISO week
+    assert insights["meetings_per_week"]["by_week"] == {"2025-03-03": 4}
+
+
+def _patch_team_tools(monkeypatch, collect):
+    async def backend(endpoint, **kwargs):
+        return {"id": "team-1", "name": "Engineering"}
+
+    monkeypatch.setattr(team_tools, "get_context_from_config", lambda: ("org", "user", "secret"))
+    monkeypatch.setattr(team_tools, "_make_api_request", backend)
+    monkeypatch.setattr(team_tools, "collect_meetings", collect)
+
+
+def test_meetings_failure_is_reported_with_the_team(monkeypatch):
+    async def collect(*args, **kwargs):
+        raise ValueError("Forbidden resource")
+
+    _patch_team_tools(monkeypatch, collect)
+    output = asyncio.run(team_tools.get_team_insights.ainvoke({"team_id": "team-1"}))
+
+    assert '"name":"Engineering"' in output
+    assert '"meeting_insights_error":"Could not fetch team meetings: Forbidden resource"' in output
+
+
+def test_cancelled_meetings_request_cancels_the_tool(monkeypatch):
+    async def collect(*args, **kwargs):
+        raise asyncio.CancelledError()
+
+    _patch_team_tools(monkeypatch, collect)
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(team_tools.get_team_insights.ainvoke({"team_id": "team-1"}))
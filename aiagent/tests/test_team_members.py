@@ -0,0 +1,53 @@
+"""get_team_members lookups by team ID or name, with and without the teams list."""
+
+import asyncio
+
+from tools.teams import team_tools
+from tools.utils.member_directory import MemberDirectory
+
+MEMBERS = [
+    {"user_id": "user-1", "email": "a@example.com", "team": {"name": "Engineering"}},
+    {"user_id": "user-2", "email": "b@example.com", "team": {"name": "Sales"}},
+]
+
+
+def get_team_members(monkeypatch, team_id, team_names):
+    directory = MemberDirectory("org")
+    directory.update(MEMBERS)
+
+    async def member_directory(*args):
+        return directory
+
+    async def get_team_names(*args):
+        return team_names
+
+    monkeypatch.setattr(team_tools, "get_context_from_config", lambda: ("org", "user", "secret"))
+    monkeypatch.setattr(team_tools, "get_member_directory", member_directory)
+    monkeypatch.setattr(team_tools, "get_team_names", get_team_names)
+    return asyncio.run(team_tools.get_team_members.ainvoke({"team_id": team_id}))
+
+
+def test_team_id_is_resolved_through_the_teams_list(monkeypatch):
+    output = get_team_members(monkeypatch, "team-1", {"team-1": "Engineering"})
+    assert "a@example.com" in output and "b@example.com" not in output
+
+
+def test_team_name_works_without_the_teams_list(monkeypatch):
+    output = get_team_members(monkeypatch, "Sales", {})
+    assert "b@example.com" in output
+
+
+def test_unresolvable_team_id_is_an_error_not_an_empty_team(monkeypatch):
+    output = get_team_members(monkeypatch, "team-1", {})
+    assert output.startswith("Error: Could not resolve team 'team-1'")
+    assert "pass the team name" in output
+
+
+def test_unknown_team_is_reported(monkeypatch):
+    output = get_team_members(monkeypatch, "team-9", {"team-1": "Engineering"})
+    assert output == "Error: No team with ID or name 'team-9' in this organization"
+
+
+def test_known_team_without_members_is_empty(monkeypatch):
+    output = get_team_members(monkeypatch, "team-2", {"team-2": "Design"})
+    assert not output.startswith("Error")
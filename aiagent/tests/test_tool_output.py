@@ -0,0 +1,74 @@
+"""Compact encoding, truncation markers and cursors of tool outputs."""
+
+import json
+
+import pytest
+
+from tools.utils.tool_output import encode_tool_output
+
+
+def meetings(count: int) -> dict:
+    return {
+        "data": [
+            {"id": f"meeting-{i}", "title": f"Meeting {i}", "summary": "x" * 40, "url": None}
+            for i in range(count)
+        ],
+        "total": count,
+    }
+
+
+def test_small_results_are_compact_and_tabular():
+    output = encode_tool_output(meetings(3), budget=1000)
+
+    assert "\n" not in output and "url" not in output
+    assert json.loads(output)["data"]["columns"] == ["id", "title", "summary"]
+
+
+def test_over_budget_result_is_cut_with_a_cursor_marker():
+    output = json.loads(encode_tool_output(meetings(50), resumable=True, budget=300))
+
+    marker = output["_truncated"][0]
+    shown = len(output["data"]["rows"])
+    assert 0 < shown < 50
+    assert marker["path"] == "data"
+    assert marker["items"] == f"0-{shown} of 50"
+    assert marker["cursor"] == f"data:{shown}"
+    # Fields outside the cut list are kept
+    assert output["total"] == 50
+
+
+def test_cursors_walk_the_whole_list_without_gaps():
+    value = meetings(50)
+    seen, cursor = [], None
+    for _ in range(50):
+        output = json.loads(
+            encode_tool_output(value, cursor=cursor, resumable=True, budget=300, tabular=False)
+        )
+        seen.extend(row["id"] for row in output["data"])
+        cursor = output.get("_truncated", [{}])[0].get("cursor")
+        if cursor is None:
+            break
+
+    assert seen == [f"meeting-{i}" for i in range(50)]
+
+
+def test_non_resumable_tools_get_a_hint_instead_of_a_cursor():
+    marker = json.loads(encode_tool_output(meetings(50), budget=300))["_truncated"][0]
+
+    assert "cursor" not in marker
+    assert marker["hint"].startswith("Narrow the request")
+
+
+def test_long_text_is_cut_at_a_line_break():
+    text = "\n".join(f"Speaker {i}: {'words ' * 10}" for i in range(200))
+    output = encode_tool_output(text, budget=200)
+
+    body, _, marker = output.rpartition("\n[truncated: ")
+    assert body.endswith("\n")
+    assert len(output) <= 200 * 4
+    assert json.loads(marker[:-1])[0]["chars"].startswith("0-")
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        encode_tool_output(meetings(5), cursor="nope:3", resumable=True)
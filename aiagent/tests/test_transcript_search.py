@@ -0,0 +1,68 @@
+"""Transcript tools: search errors, invalid patterns and the meeting details overview."""
+
+import asyncio
+
+import pytest
+
+from tools.meetings import meeting_cache, meeting_tools
+
+
+def test_error_response_is_raised_and_not_cached(monkeypatch):
+    calls = []
+
+    async def backend(endpoint, **kwargs):
+        calls.append(endpoint)
+        return {"statusCode": 404, "message": "Meeting not found"}
+
+    monkeypatch.setattr(meeting_cache, "_make_api_request", backend)
+    meeting_cache.transcript_index_cache.clear()
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Meeting not found"):
+            asyncio.run(
+                meeting_cache.fetch_transcript_index("meeting-1", "org", "user", "secret")
+            )
+    assert len(calls) == 2
+
+
+def test_tool_reports_invalid_regex(monkeypatch):
+    monkeypatch.setattr(
+        meeting_tools, "get_context_from_config", lambda: ("org", "user", "secret")
+    )
+    result = asyncio.run(
+        meeting_tools.search_meeting_transcript.ainvoke(
+            {"meeting_id": "meeting-1", "query": "pric(e", "regex": True}
+        )
+    )
+    assert result.startswith("Error: Invalid regular expression")
+
+
+def test_meeting_details_replace_the_transcript_with_an_overview(monkeypatch):
+    meeting = {
+        "id": "meeting-1",
+        "title": "Planning",
+        "summary": "Pricing review",
+        "transcript": "Sarah: pricing\nTom: agreed",
+        "transcript_json": {
+            "type": "segments",
+            "data": [
+                {"speaker": "Sarah", "start": 0, "end": 4.5, "conversation": "pricing"},
+                {"speaker": "Tom", "start": 4.5, "end": 9, "conversation": "agreed"},
+            ],
+        },
+    }
+
+    async def fetch(meeting_id, *args):
+        return meeting
+
+    monkeypatch.setattr(
+        meeting_tools, "get_context_from_config", lambda: ("org", "user", "secret")
+    )
+    monkeypatch.setattr(meeting_tools, "fetch_meeting", fetch)
+
+    output = asyncio.run(meeting_tools.get_meeting_details.ainvoke({"meeting_id": "meeting-1"}))
+
+    assert "agreed" not in output
+    assert '"total_segments":2' in output
+    assert '"speakers":["Sarah","Tom"]' in output
+    assert "get_meeting_transcript" in output
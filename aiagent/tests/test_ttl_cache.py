@@ -0,0 +1,68 @@
+"""AsyncTTLCache load sharing, cancellation and invalidation races."""
+
+import asyncio
+
+from tools.utils.ttl_cache import AsyncTTLCache
+
+
+def test_concurrent_misses_share_one_load():
+    cache = AsyncTTLCache("test_shared_load")
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(3)))
+
+    assert asyncio.run(scenario()) == ["value"] * 3
+    assert calls == [1]
+    assert cache.stats.coalesced == 2
+
+
+def test_cancelled_loader_does_not_cancel_the_waiters():
+    cache = AsyncTTLCache("test_cancelled_load")
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario():
+        first = asyncio.ensure_future(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        return first.cancelled(), await waiter
+
+    assert asyncio.run(scenario()) == (True, "value")
+    # The waiter ran the load again itself
+    assert len(calls) == 2
+    assert cache.get("key") == "value"
+
+
+def test_load_overlapping_an_invalidation_is_not_stored():
+    cache = AsyncTTLCache("test_invalidated_load")
+    state = {"name": "Before"}
+
+    async def loader():
+        name = state["name"]
+        await asyncio.sleep(0.01)
+        return name
+
+    async def scenario():
+        stale = asyncio.ensure_future(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        state["name"] = "After"
+        cache.invalidate("key")
+        # Started after the invalidation: does not join the stale load
+        fresh = await cache.get_or_load("key", loader)
+        return await stale, fresh
+
+    assert asyncio.run(scenario()) == ("Before", "After")
+    assert cache.get("key") == "After"
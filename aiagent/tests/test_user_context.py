@@ -0,0 +1,74 @@
+"""User context loading at the start of a run and its use in the system prompt."""
+
+import asyncio
+
+from prompts import build_system_prompt_from_config
+from tools.utils import user_context_fetcher
+from tools.utils.user_context_fetcher import UserContextMiddleware
+
+SNAPSHOT = {
+    "user_name": "Ada Lovelace",
+    "organization_name": "Knowted",
+    "team_name": "Engineering",
+    "accessible_meeting_types": [{"id": "type-1", "name": "Standup", "description": "Daily"}],
+}
+
+
+def test_middleware_loads_the_users_context(monkeypatch):
+    calls = []
+
+    async def fetch(organization_id, user_id, internal_service_secret):
+        calls.append((organization_id, user_id))
+        return SNAPSHOT
+
+    monkeypatch.setattr(
+        user_context_fetcher, "get_context_from_config", lambda: ("org", "user", "secret")
+    )
+    monkeypatch.setattr(user_context_fetcher, "fetch_user_context", fetch)
+
+    update = asyncio.run(UserContextMiddleware().abefore_agent({"messages": []}, None))
+
+    assert update == {"user_context": SNAPSHOT}
+    assert calls == [("org", "user")]
+
+
+def test_middleware_skips_runs_without_identity(monkeypatch):
+    monkeypatch.setattr(
+        user_context_fetcher, "get_context_from_config", lambda: (None, None, None)
+    )
+
+    assert asyncio.run(UserContextMiddleware().abefore_agent({"messages": []}, None)) is None
+
+
+def test_prompt_fills_what_the_config_leaves_out():
+    config = {"configurable": {"user_name": "Ada", "organization_name": None}}
+    prompt = build_system_prompt_from_config(config, SNAPSHOT)
+
+    assert "Ada" in prompt and "Ada Lovelace" not in prompt
+    assert "- Organization: Knowted" in prompt
+    assert "- Team: Engineering" in prompt
+    assert "Name: Standup\nID: type-1" in prompt
+
+
+def test_prompt_uses_the_registry_fragment_from_the_user_context(monkeypatch):
+    from tools.utils.meeting_type_registry import MeetingTypeRegistry
+
+    registry = MeetingTypeRegistry.from_result("org", SNAPSHOT["accessible_meeting_types"])
+
+    async def get(*args, **kwargs):
+        return None
+
+    async def get_registry(*args):
+        return registry
+
+    monkeypatch.setattr(user_context_fetcher, "_make_api_request", get)
+    monkeypatch.setattr(user_context_fetcher, "get_member_directory", get)
+    monkeypatch.setattr(user_context_fetcher, "get_meeting_type_registry", get_registry)
+
+    context = asyncio.run(
+        user_context_fetcher.fetch_user_context("org", "user", "secret", use_cache=False)
+    )
+    prompt = build_system_prompt_from_config(None, context)
+
+    assert context["meeting_types_prompt"] is registry.prompt_fragment
+    assert registry.prompt_fragment in prompt
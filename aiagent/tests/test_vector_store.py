@@ -0,0 +1,63 @@
+"""Shared vector store rebuilds after a PostgreSQL fallback."""
+
+from contextlib import contextmanager
+
+from rag import vector_store
+
+
+class FakeConnection:
+    def execute(self, statement):
+        return None
+
+
+class FakeEngine:
+    def __init__(self):
+        self.disposed = False
+
+    @contextmanager
+    def connect(self):
+        yield FakeConnection()
+
+    def dispose(self):
+        self.disposed = True
+
+
+class FakePGVector:
+    pass
+
+
+def test_fallback_store_is_rebuilt_at_the_next_health_check(monkeypatch):
+    fallback, pgvector = object(), FakePGVector()
+    builds = iter([fallback, pgvector])
+    engines = []
+
+    def create_engine():
+        engines.append(FakeEngine())
+        return engines[-1]
+
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/knowted")
+    monkeypatch.setattr(vector_store, "PGVector", FakePGVector)
+    monkeypatch.setattr(vector_store, "_create_pooled_engine", create_engine)
+    monkeypatch.setattr(vector_store, "setup_vector_store", lambda name, engine: next(builds))
+    monkeypatch.setattr(vector_store, "ensure_metadata_indexes", lambda engine: None)
+    monkeypatch.setattr(vector_store, "VECTOR_STORE_HEALTH_CHECK_INTERVAL", 0)
+    vector_store.reset_vector_store()
+
+    try:
+        # PostgreSQL is unreachable: the in-memory fallback is served
+        assert vector_store.get_shared_vector_store("test") is fallback
+        assert engines[0].disposed
+
+        # The next check retries the PostgreSQL build, which then passes its checks
+        assert vector_store.get_shared_vector_store("test") is pgvector
+        assert vector_store.get_shared_vector_store("test") is pgvector
+        assert not engines[1].disposed
+    finally:
+        vector_store.reset_vector_store()
+
+
+def test_rag_search_filters_the_same_in_memory_class_it_gets():
+    from tools.search import rag_tool
+
+    # rag_tool picks the tenant filter with isinstance on this class
+    assert rag_tool.InMemoryVectorStore is vector_store.InMemoryVectorStore
@@ -16,7 +16,11 @@ from .core import (
     get_organization_data,
     get_user_accessible_meeting_types,
 )
-from .meetings import get_meeting_details
+from .meetings import (
+    get_meeting_details,
+    get_meeting_transcript,
+    search_meeting_transcript,
+)
 from .organizations import get_organization_members
 from .permissions import get_user_permissions
 from .profiles import get_user_profile
@@ -28,6 +32,8 @@ __all__ = [
     "smart_search_meetings",
     # Meeting tools
     "get_meeting_details",
+    "get_meeting_transcript",
+    "search_meeting_transcript",
     # User context
     "get_user_accessible_meeting_types",
     # Organization tools
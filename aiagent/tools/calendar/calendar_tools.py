@@ -7,6 +7,7 @@ Tools for calendar integration and sync status.
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.tool_output import encode_tool_output
 
 
 @tool
@@ -38,9 +39,7 @@ async def get_calendar_sync_status() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_calendar_sync_status")
     except Exception as e:
         return f"Error fetching calendar sync status: {str(e)}"
 
@@ -75,9 +74,7 @@ async def get_available_calendars() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_available_calendars")
     except Exception as e:
         return f"Error fetching available calendars: {str(e)}"
 
@@ -112,9 +109,7 @@ async def get_my_calendars() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_my_calendars")
     except Exception as e:
         return f"Error fetching user calendars: {str(e)}"
 
@@ -4,12 +4,22 @@ Knowted Backend API Integration Tools
 Tools for calling Knowted's NestJS backend API.
 """
 
+import logging
 import os
-from typing import Any, Dict, Optional, Tuple
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, urlsplit
 
 import httpx
 from langchain_core.tools import tool
 
+from ..utils.tool_output import encode_tool_output
+from .deadline import request_timeout
+from .http_client import KNOWTED_HTTP_CONNECT_TIMEOUT, KNOWTED_HTTP_TIMEOUT, get_http_client
+from .resilience import send_with_retries
+from .response_cache import response_cache
+from .single_flight import match_endpoint, note_write, single_flight, write_generation
+
 # Try to import get_config from different possible locations
 try:
     from langgraph.config import get_config
@@ -28,6 +38,34 @@ KNOWTED_API_URL = os.getenv("KNOWTED_API_URL", "http://localhost:3000")
 KNOWTED_API_KEY = os.getenv("KNOWTED_API_KEY", "")
 # Internal service secret for service-to-service authentication (preferred for AI agent)
 INTERNAL_SERVICE_SECRET = os.getenv("INTERNAL_SERVICE_SECRET", "")
+# Ask the backend for only the needed columns (select=). Off by default: the
+# backend's ValidationPipe (forbidNonWhitelisted) rejects unknown query
+# properties, and no DTO accepts `select` yet
+KNOWTED_API_PROJECTION = os.getenv("KNOWTED_API_PROJECTION", "false").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+# Endpoint paths that rejected select=; they get full responses from then on
+_projection_unsupported: Set[str] = set()
+
+# ValidationPipe message for a query property no DTO declares
+_SELECT_NOT_ALLOWED = re.compile(r"\bproperty select should not exist\b", re.IGNORECASE)
+
+
+def _with_select(endpoint: str, select: List[str]) -> str:
+    """Append a select= projection to the endpoint's query string."""
+    separator = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{separator}select={quote(','.join(select), safe=',._')}"
+
+
+def _rejects_select(response: httpx.Response) -> bool:
+    """Whether a 400 rejects the `select` query property itself (not one of its columns)."""
+    try:
+        message = response.json().get("message")
+    except (ValueError, AttributeError):
+        message = response.text
+    messages = message if isinstance(message, list) else [message]
+    return any(isinstance(m, str) and _SELECT_NOT_ALLOWED.search(m) for m in messages)
 
 
 def get_context_from_config() -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -89,6 +127,7 @@ async def _make_api_request(
     organization_id: Optional[str] = None,
     user_id: Optional[str] = None,
     internal_service_secret: Optional[str] = None,
+    select: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Make a request to Knowted backend API using service-to-service authentication.
@@ -101,11 +140,40 @@ async def _make_api_request(
         organization_id: Organization ID for access control (required)
         user_id: User ID for access control (required)
         internal_service_secret: Service secret for authentication (required)
+        select: Columns to project server-side (dotted for nested keys, e.g.
+            "summary_meta_data.Objectives"). If the backend rejects the
+            parameter, the full response is returned, so callers must still
+            trim the result themselves.
 
     Returns:
-        JSON response from API
+        JSON response from API. Cached responses and concurrent identical
+        GETs share one decoded result, so treat it as read-only.
     """
-    url = f"{KNOWTED_API_URL}/{endpoint.lstrip('/')}"
+    endpoint = endpoint.lstrip("/")
+
+    path = urlsplit(endpoint).path.strip("/")
+    if select and KNOWTED_API_PROJECTION and path not in _projection_unsupported:
+        try:
+            return await _make_api_request(
+                _with_select(endpoint, select),
+                method=method,
+                data=data,
+                headers=dict(headers) if headers else None,
+                organization_id=organization_id,
+                user_id=user_id,
+                internal_service_secret=internal_service_secret,
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 400:
+                raise
+            if _rejects_select(e.response):
+                # The endpoint does not accept projections at all
+                _projection_unsupported.add(path)
+                logger.warning("%s does not support select=; requesting full responses", path)
+            else:
+                # Rejected for this request only (e.g. an unknown column)
+                logger.warning("%s rejected select=%s; requesting the full response", path, select)
+    url = f"{KNOWTED_API_URL}/{endpoint}"
 
     request_headers = headers or {}
 
@@ -124,15 +192,73 @@ async def _make_api_request(
     request_headers["X-Organization-ID"] = organization_id
     request_headers["X-User-ID"] = user_id
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.request(
-            method=method,
-            url=url,
-            json=data,
-            headers=request_headers,
+    is_read = method.upper() == "GET" and data is None
+
+    # Reference data is cached per tenant; expired entries are revalidated
+    cache_ttl = response_cache.ttl_for(endpoint) if is_read else None
+    cache_key = (organization_id, user_id, endpoint)
+    cached = response_cache.lookup(cache_key) if cache_ttl is not None else None
+    generation = response_cache.generation
+    if cached is not None:
+        if cached.fresh:
+            return cached.value
+        request_headers.update(cached.conditional_headers())
+
+    async def send() -> Dict[str, Any]:
+        # Never wait past the run's / tool's deadline
+        timeout = request_timeout(KNOWTED_HTTP_TIMEOUT)
+        # Shared pooled client - keeps connections to the backend alive across calls
+        client = get_http_client()
+        # Retries idempotent methods; fails fast while the endpoint's circuit is open
+        response = await send_with_retries(
+            method,
+            endpoint,
+            lambda: client.request(
+                method=method,
+                url=url,
+                json=data,
+                headers=request_headers,
+                timeout=httpx.Timeout(
+                    timeout, connect=min(KNOWTED_HTTP_CONNECT_TIMEOUT, timeout)
+                ),
+            ),
         )
+        if response.status_code == 304 and cached is not None:
+            return response_cache.mark_revalidated(cached, cache_ttl)
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        if cache_ttl is not None:
+            response_cache.store(
+                cache_key,
+                result,
+                response.headers,
+                len(response.content),
+                cache_ttl,
+                generation,
+                revalidating=cached is not None,
+            )
+        return result
+
+    if not is_read:
+        try:
+            return await send()
+        finally:
+            # The write may have changed cached reference data
+            response_cache.invalidate_for_write(organization_id, endpoint)
+            # GETs sent from now on must not join ones sent before the write
+            note_write(organization_id, endpoint)
+
+    # Collapse concurrent identical GETs into one request
+    pattern = match_endpoint(endpoint)
+    if pattern is not None:
+        key = (
+            "GET",
+            url,
+            tuple(sorted(request_headers.items())),
+            write_generation(organization_id, endpoint),
+        )
+        return await single_flight(pattern, key, send)
+    return await send()
 
 
 @tool
@@ -168,9 +294,7 @@ async def call_knowted_api(
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "call_knowted_api")
     except httpx.HTTPStatusError as e:
         return f"API Error: {e.response.status_code} - {e.response.text}"
     except Exception as e:
@@ -208,8 +332,6 @@ async def get_organization_data() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_organization_data")
     except Exception as e:
         return f"Error fetching organization data: {str(e)}"
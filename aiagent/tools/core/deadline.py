@@ -0,0 +1,169 @@
+"""
+Deadlines and Latency Budgets for Tool Calls
+
+A run gets a deadline when it starts if one is set explicitly
+(`configurable.deadline` as an epoch timestamp, or now + KNOWTED_RUN_BUDGET
+when that is configured). Each tool call runs under the
+earlier of that deadline and its own budget, held in a context variable
+that `_make_api_request` reads to size its timeout. A tool that runs out
+of time returns an error message to the model instead of stalling the
+stream, and multi-request tools return the sections they finished.
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, ToolCallRequest
+from langchain.agents.middleware.types import PrivateStateAttr
+from langchain_core.messages import ToolMessage
+from typing_extensions import Annotated, NotRequired
+
+try:
+    from langgraph.config import get_config
+except ImportError:
+    get_config = None
+
+# Seconds a run may spend before tools stop calling the backend (0, the
+# default, leaves runs unbounded unless the caller passes a deadline)
+KNOWTED_RUN_BUDGET = float(os.getenv("KNOWTED_RUN_BUDGET", "0"))
+# Default per-tool budget in seconds (0 disables)
+KNOWTED_TOOL_BUDGET = float(os.getenv("KNOWTED_TOOL_BUDGET", "30"))
+
+
+def _parse_budgets(value: str) -> Dict[str, float]:
+    """Parse "tool=seconds,tool=seconds"."""
+    budgets = {}
+    for item in value.split(","):
+        name, sep, seconds = item.strip().partition("=")
+        if sep and name:
+            budgets[name.strip()] = float(seconds)
+    return budgets
+
+
+# Per-tool overrides, e.g. "smart_search_meetings=20,get_meeting_details=15"
+KNOWTED_TOOL_BUDGETS = _parse_budgets(os.getenv("KNOWTED_TOOL_BUDGETS", ""))
+
+# Extra seconds a tool gets after its deadline to return what it has
+# (its backend calls time out at the deadline) before it is cancelled
+_CANCEL_GRACE = 0.5
+
+# Absolute deadline (time.time()) of the current scope, or None for unbounded
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "knowted_deadline", default=None
+)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The time budget of the current run or tool call is used up."""
+
+
+def get_deadline() -> Optional[float]:
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.time()
+
+
+@contextmanager
+def deadline_scope(
+    seconds: Optional[float] = None, at: Optional[float] = None
+) -> Iterator[Optional[float]]:
+    """
+    Run a block under a deadline. Nested scopes can only shorten it.
+
+    Args:
+        seconds: Budget relative to now
+        at: Absolute deadline (time.time() based)
+
+    Yields:
+        The effective deadline
+    """
+    candidates = [d for d in (_deadline.get(), at) if d is not None]
+    if seconds is not None:
+        candidates.append(time.time() + seconds)
+    effective = min(candidates) if candidates else None
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+def request_timeout(default: float) -> float:
+    """
+    Timeout for the next request: the default, capped by the time left.
+
+    Raises:
+        DeadlineExceeded: No time is left
+    """
+    left = remaining()
+    if left is None:
+        return default
+    if left <= 0:
+        raise DeadlineExceeded("Time budget exhausted before calling the backend")
+    return min(default, left)
+
+
+def tool_budget(tool_name: str) -> Optional[float]:
+    budget = KNOWTED_TOOL_BUDGETS.get(tool_name, KNOWTED_TOOL_BUDGET)
+    return budget if budget > 0 else None
+
+
+class DeadlineState(AgentState):
+    run_deadline: NotRequired[Annotated[Optional[float], PrivateStateAttr]]
+
+
+class DeadlineMiddleware(AgentMiddleware):
+    """Sets the run deadline and enforces per-tool budgets."""
+
+    state_schema = DeadlineState
+
+    def before_agent(self, state: DeadlineState, runtime: Any) -> Optional[Dict[str, Any]]:
+        deadline = None
+        if get_config is not None:
+            try:
+                deadline = get_config().get("configurable", {}).get("deadline")
+            except Exception:
+                deadline = None
+        if deadline is None and KNOWTED_RUN_BUDGET > 0:
+            deadline = time.time() + KNOWTED_RUN_BUDGET
+        return {"run_deadline": float(deadline) if deadline is not None else None}
+
+    def _timeout_message(self, request: ToolCallRequest, reason: str) -> ToolMessage:
+        return ToolMessage(
+            content=(
+                f"Error: {request.tool_call['name']} stopped because {reason}. "
+                "Answer with the information gathered so far or narrow the request."
+            ),
+            tool_call_id=request.tool_call["id"],
+            name=request.tool_call["name"],
+            status="error",
+        )
+
+    def wrap_tool_call(self, request: ToolCallRequest, handler: Callable[..., Any]) -> Any:
+        with deadline_scope(
+            tool_budget(request.tool_call["name"]), request.state.get("run_deadline")
+        ):
+            return handler(request)
+
+    async def awrap_tool_call(
+        self, request: ToolCallRequest, handler: Callable[..., Awaitable[Any]]
+    ) -> Any:
+        name = request.tool_call["name"]
+        with deadline_scope(tool_budget(name), request.state.get("run_deadline")):
+            left = remaining()
+            if left is None:
+                return await handler(request)
+            if left <= 0:
+                return self._timeout_message(request, "the run's time budget is exhausted")
+            try:
+                return await asyncio.wait_for(handler(request), timeout=left + _CANCEL_GRACE)
+            except asyncio.TimeoutError:
+                return self._timeout_message(request, f"it ran out of time after {left:.1f}s")
@@ -0,0 +1,100 @@
+"""
+Shared HTTP Client for Knowted Backend Calls
+
+Keeps one pooled httpx.AsyncClient per event loop so tool calls reuse
+keep-alive connections to the NestJS backend instead of paying TCP/TLS
+setup on every request.
+"""
+
+import asyncio
+import os
+import weakref
+from typing import Optional
+
+import httpx
+
+# Pool configuration (override via environment)
+KNOWTED_HTTP_TIMEOUT = float(os.getenv("KNOWTED_HTTP_TIMEOUT", "30"))
+KNOWTED_HTTP_CONNECT_TIMEOUT = float(os.getenv("KNOWTED_HTTP_CONNECT_TIMEOUT", "5"))
+KNOWTED_HTTP_MAX_CONNECTIONS = int(os.getenv("KNOWTED_HTTP_MAX_CONNECTIONS", "100"))
+KNOWTED_HTTP_MAX_KEEPALIVE = int(os.getenv("KNOWTED_HTTP_MAX_KEEPALIVE", "20"))
+KNOWTED_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("KNOWTED_HTTP_KEEPALIVE_EXPIRY", "30"))
+KNOWTED_HTTP2 = os.getenv("KNOWTED_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# httpx connections are bound to the loop that opened them, so each loop
+# (LangGraph may run graphs on several) gets its own client.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2])."""
+    if not KNOWTED_HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("Warning: KNOWTED_HTTP2 is enabled but h2 is not installed, using HTTP/1.1")
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            KNOWTED_HTTP_TIMEOUT, connect=KNOWTED_HTTP_CONNECT_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_connections=KNOWTED_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=KNOWTED_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=KNOWTED_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=_http2_enabled(),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the pooled client for the running event loop, creating it lazily.
+
+    Must be called from inside a coroutine. The lookup has no await point,
+    so concurrent callers on the same loop always share one client.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _build_client()
+        _clients[loop] = client
+    return client
+
+
+async def aclose_http_client() -> None:
+    """Close the client bound to the running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    client: Optional[httpx.AsyncClient] = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def aclose_http_clients() -> None:
+    """
+    Close every pooled client.
+
+    Clients owned by the running loop are closed gracefully. Clients whose
+    loop has already stopped can no longer be awaited and are just dropped.
+    """
+    await aclose_http_client()
+    for loop, client in list(_clients.items()):
+        if loop.is_closed() or not loop.is_running() or client.is_closed:
+            _clients.pop(loop, None)
+            continue
+        future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        try:
+            await asyncio.wrap_future(future)
+        except Exception as e:
+            print(f"Warning: Could not close HTTP client: {e}")
+        _clients.pop(loop, None)
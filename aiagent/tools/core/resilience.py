@@ -0,0 +1,222 @@
+"""
+Retries and Circuit Breaking for Backend Calls
+
+Idempotent requests are retried on connection errors and transient
+statuses (408, 429, 502, 503, 504) with jittered exponential backoff,
+honouring `Retry-After` and the current deadline. Each endpoint (method plus path, with IDs
+collapsed) has a circuit breaker: after repeated failures it opens and
+calls fail fast until a probe request succeeds.
+"""
+
+import asyncio
+import email.utils
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .deadline import DeadlineExceeded, remaining
+
+KNOWTED_HTTP_RETRIES = int(os.getenv("KNOWTED_HTTP_RETRIES", "2"))
+KNOWTED_HTTP_RETRY_BASE_DELAY = float(os.getenv("KNOWTED_HTTP_RETRY_BASE_DELAY", "0.2"))
+KNOWTED_HTTP_RETRY_MAX_DELAY = float(os.getenv("KNOWTED_HTTP_RETRY_MAX_DELAY", "5"))
+KNOWTED_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("KNOWTED_CIRCUIT_FAILURE_THRESHOLD", "5"))
+KNOWTED_CIRCUIT_RESET_TIMEOUT = float(os.getenv("KNOWTED_CIRCUIT_RESET_TIMEOUT", "30"))
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_STATUSES = {408, 429, 502, 503, 504}
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling the backend while an endpoint's circuit is open."""
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """Breaker key: method plus path with ID segments collapsed."""
+    path = urlsplit(endpoint).path.strip("/")
+    segments = ["{id}" if _ID_SEGMENT.match(part) else part for part in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def _is_failure_status(status_code: int) -> bool:
+    """Statuses that count against the breaker (server-side trouble, not rate limits)."""
+    return status_code >= 500 or status_code == 408
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date)."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (0-based)."""
+    ceiling = min(KNOWTED_HTTP_RETRY_MAX_DELAY, KNOWTED_HTTP_RETRY_BASE_DELAY * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = KNOWTED_CIRCUIT_FAILURE_THRESHOLD
+    reset_timeout: float = KNOWTED_CIRCUIT_RESET_TIMEOUT
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+    rejected: int = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.probing or time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self, key: str) -> None:
+        """Raise CircuitOpenError unless a call may go through now."""
+        if self.opened_at is None:
+            return
+        remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+        if remaining > 0 or self.probing:
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"Backend endpoint {key} is unavailable (circuit open); "
+                f"retry in {max(remaining, 0):.0f}s"
+            )
+        # Let one probe through; it decides whether the circuit closes
+        self.probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.probing or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(key: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker()
+        return breaker
+
+
+async def send_with_retries(
+    method: str,
+    endpoint: str,
+    send: Callable[[], Awaitable[httpx.Response]],
+    retries: int = KNOWTED_HTTP_RETRIES,
+) -> httpx.Response:
+    """
+    Send a request through the endpoint's circuit breaker, retrying if safe.
+
+    Only idempotent methods are retried. Status errors are not raised here;
+    the final response is returned for the caller to check.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint (used for the breaker key)
+        send: Zero-argument coroutine function sending the request once
+        retries: Maximum retries after the first attempt
+
+    Returns:
+        The last response received
+
+    Raises:
+        CircuitOpenError: The endpoint's circuit is open
+        httpx.TransportError: The last attempt failed to connect or timed out
+    """
+    key = endpoint_key(method, endpoint)
+    breaker = get_breaker(key)
+    retries = retries if method.upper() in IDEMPOTENT_METHODS else 0
+
+    attempt = 0
+    while True:
+        breaker.before_call(key)
+        response: Optional[httpx.Response] = None
+        try:
+            response = await send()
+        except httpx.TimeoutException as e:
+            left = remaining()
+            if left is not None and left <= 0.05:
+                # Our own deadline cut the request short; not the backend's fault
+                breaker.probing = False
+                raise DeadlineExceeded(f"Time budget exhausted waiting for {key}") from e
+            breaker.record_failure()
+            if attempt >= retries:
+                raise
+            last_error = e
+            delay = backoff_delay(attempt)
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if attempt >= retries:
+                raise
+            last_error = e
+            delay = backoff_delay(attempt)
+        except BaseException:
+            # Cancelled or unexpected: free the probe slot without a verdict
+            breaker.probing = False
+            raise
+        else:
+            if _is_failure_status(response.status_code):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            if response.status_code not in RETRYABLE_STATUSES or attempt >= retries:
+                return response
+            delay = _retry_after(response)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            elif delay > KNOWTED_HTTP_RETRY_MAX_DELAY:
+                # The backend asked for a longer pause than we are willing to wait
+                return response
+        left = remaining()
+        if left is not None and delay >= left:
+            # Retrying would overrun the deadline
+            if response is None:
+                raise last_error
+            return response
+        attempt += 1
+        print(f"Warning: Retrying {key} in {delay:.2f}s (attempt {attempt}/{retries})")
+        await asyncio.sleep(delay)
+
+
+def circuit_stats() -> Dict[str, Dict[str, object]]:
+    """State and counters of every endpoint's circuit breaker."""
+    with _breakers_lock:
+        return {
+            key: {
+                "state": breaker.state,
+                "failures": breaker.failures,
+                "rejected": breaker.rejected,
+            }
+            for key, breaker in _breakers.items()
+        }
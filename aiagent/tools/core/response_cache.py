@@ -0,0 +1,189 @@
+"""
+Backend Response Cache
+
+Caches GET responses for reference endpoints (meeting types, permissions,
+organizations, teams) per tenant, with a TTL per endpoint pattern. Expired
+entries are kept for conditional revalidation: the next request sends
+`If-None-Match` / `If-Modified-Since` and an unchanged payload costs a 304
+instead of a full body. Writes invalidate the cached resource.
+"""
+
+import fnmatch
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .single_flight import resource_name
+
+
+def _parse_policies(value: str) -> List[Tuple[str, float]]:
+    """Parse "pattern=ttl,pattern=ttl" into (glob, seconds) pairs."""
+    policies = []
+    for item in value.split(","):
+        pattern, sep, ttl = item.strip().rpartition("=")
+        if sep and pattern:
+            policies.append((pattern.strip("/"), float(ttl)))
+    return policies
+
+
+# Endpoint path globs and the seconds their responses stay fresh
+RESPONSE_CACHE_POLICIES = _parse_policies(
+    os.getenv(
+        "KNOWTED_RESPONSE_CACHE_POLICIES",
+        "api/v1/meeting-types*=300,api/v1/permissions*=120,"
+        "api/v1/organizations/*=300,api/v1/teams*=300",
+    )
+)
+RESPONSE_CACHE_MAXSIZE = int(os.getenv("KNOWTED_RESPONSE_CACHE_MAXSIZE", "2048"))
+
+# Writes to a resource also invalidate these resources (members embed teams)
+_RELATED_RESOURCES = {"teams": ("organizations",), "profiles": ("organizations",)}
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    refreshed: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+
+@dataclass
+class CachedResponse:
+    value: Any
+    expires_at: float
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU of decoded responses keyed by (organization_id, user_id, endpoint)."""
+
+    def __init__(
+        self,
+        policies: List[Tuple[str, float]] = RESPONSE_CACHE_POLICIES,
+        maxsize: int = RESPONSE_CACHE_MAXSIZE,
+    ):
+        self.policies = policies
+        self.maxsize = maxsize
+        self.stats = ResponseCacheStats()
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; responses fetched across one are not stored
+        self.generation = 0
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """TTL of the first policy matching the endpoint path, or None if uncached."""
+        path = urlsplit(endpoint).path.strip("/")
+        for pattern, ttl in self.policies:
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def lookup(self, key: Hashable) -> Optional[CachedResponse]:
+        """Return the entry (fresh or awaiting revalidation) and count fresh hits."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            self.stats.misses += 1
+        elif entry.fresh:
+            self.stats.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: Hashable,
+        value: Any,
+        headers: Mapping[str, str],
+        size: int,
+        ttl: float,
+        generation: int,
+        revalidating: bool = False,
+    ) -> None:
+        """
+        Store a 200 response with its validators.
+
+        `generation` is the cache generation read before the request was
+        sent; if a write invalidated the cache meanwhile, nothing is stored.
+        """
+        if revalidating:
+            self.stats.refreshed += 1
+        entry = CachedResponse(
+            value=value,
+            expires_at=time.monotonic() + ttl,
+            size=size,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def mark_revalidated(self, entry: CachedResponse, ttl: float) -> Any:
+        """Extend an entry after a 304 and return its cached value."""
+        entry.expires_at = time.monotonic() + ttl
+        self.stats.revalidated += 1
+        self.stats.bytes_saved += entry.size
+        return entry.value
+
+    def invalidate_for_write(self, organization_id: str, endpoint: str) -> int:
+        """
+        Drop an organization's cached responses for the written resource.
+
+        A write to `api/v1/teams/123` drops every cached `teams` URL (and
+        related resources) of that organization, for all of its users.
+
+        Returns:
+            Number of entries dropped
+        """
+        resource = resource_name(endpoint)
+        resources = {resource, *_RELATED_RESOURCES.get(resource, ())}
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if key[0] == organization_id
+                and resource_name(key[2]) in resources
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.generation += 1
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"size": len(self._entries), "maxsize": self.maxsize, **asdict(self.stats)}
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,133 @@
+"""
+Single-flight Coalescing for Backend GETs
+
+Parallel tool calls often request the same endpoint at once (for example
+`organizations/{id}/members` from the organization, team and user context
+tools). For opted-in endpoints, concurrent identical GETs (same URL and
+identity headers) share one in-flight request and its decoded result.
+
+Writes bump a generation per resource (`note_write`), and the generation
+is part of the request key. A GET sent after a write therefore never joins
+a GET that started before it and may return the pre-write data.
+"""
+
+import asyncio
+import fnmatch
+import os
+import threading
+import weakref
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import urlsplit
+
+# Comma-separated glob patterns matched against the endpoint path (no query)
+SINGLE_FLIGHT_ENDPOINTS = [
+    pattern.strip().strip("/")
+    for pattern in os.getenv(
+        "KNOWTED_SINGLE_FLIGHT_ENDPOINTS",
+        "api/v1/organizations/*,api/v1/teams,api/v1/teams/*,api/v1/meeting-types*,"
+        "api/v1/profiles/*,api/v1/permissions*,api/v1/meetings,api/v1/meetings/*",
+    ).split(",")
+    if pattern.strip()
+]
+
+
+@dataclass
+class SingleFlightStats:
+    requests: int = 0
+    collapsed: int = 0
+
+
+# In-flight tasks per event loop (tasks cannot be awaited across loops)
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Counters per matched endpoint pattern
+_stats: Dict[str, SingleFlightStats] = {}
+# Completed writes per (organization_id, resource)
+_write_generations: Dict[Tuple[str, str], int] = {}
+_write_generations_lock = threading.Lock()
+
+
+def resource_name(endpoint: str) -> str:
+    """Resource name of an API endpoint ("api/v1/teams/123?x=1" -> "teams")."""
+    parts = urlsplit(endpoint).path.strip("/").split("/")
+    return parts[2] if len(parts) > 2 and parts[0] == "api" else parts[0]
+
+
+def write_generation(organization_id: str, endpoint: str) -> int:
+    """Number of writes to the endpoint's resource seen for the organization."""
+    with _write_generations_lock:
+        return _write_generations.get((organization_id, resource_name(endpoint)), 0)
+
+
+def note_write(organization_id: str, endpoint: str) -> None:
+    """Record a write so later GETs of the resource do not join earlier ones."""
+    key = (organization_id, resource_name(endpoint))
+    with _write_generations_lock:
+        _write_generations[key] = _write_generations.get(key, 0) + 1
+
+
+def match_endpoint(endpoint: str) -> Optional[str]:
+    """Return the opt-in pattern matching `endpoint`, or None if not opted in."""
+    path = urlsplit(endpoint).path.strip("/")
+    for pattern in SINGLE_FLIGHT_ENDPOINTS:
+        if fnmatch.fnmatchcase(path, pattern):
+            return pattern
+    return None
+
+
+async def single_flight(
+    pattern: str,
+    key: Tuple[Any, ...],
+    request: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Run `request` unless an identical one is already in flight, then share it.
+
+    The request runs as its own task, so cancelling the caller that started
+    it does not cancel the callers waiting on the same result. The result is
+    shared, not copied: callers must not mutate it.
+
+    Args:
+        pattern: Matched endpoint pattern (metrics bucket)
+        key: Identity of the request (method, URL and identity headers)
+        request: Zero-argument coroutine function performing the request
+
+    Returns:
+        The decoded response. Errors propagate to every waiting caller.
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _inflight.setdefault(loop, {})
+    stats = _stats.setdefault(pattern, SingleFlightStats())
+    stats.requests += 1
+
+    task = inflight.get(key)
+    if task is None:
+        task = loop.create_task(request())
+        inflight[key] = task
+
+        def _done(finished: "asyncio.Task[Any]") -> None:
+            if inflight.get(key) is finished:
+                del inflight[key]
+            # Mark retrieved so a failure nobody awaited is not logged
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+    else:
+        stats.collapsed += 1
+    return await asyncio.shield(task)
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Requests and collapsed calls per endpoint pattern."""
+    return {
+        pattern: {
+            **asdict(stats),
+            "collapse_rate": round(stats.collapsed / stats.requests, 4)
+            if stats.requests
+            else 0.0,
+        }
+        for pattern, stats in _stats.items()
+    }
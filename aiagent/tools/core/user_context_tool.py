@@ -6,7 +6,9 @@ import json
 
 from langchain_core.tools import tool
 
-from .api_tools import _make_api_request, get_context_from_config
+from ..utils.meeting_type_registry import get_meeting_type_registry
+from ..utils.tool_output import encode_tool_output
+from .api_tools import get_context_from_config
 
 
 @tool
@@ -29,16 +31,14 @@ async def get_user_accessible_meeting_types() -> str:
         # Query similar to the n8n Postgres node that fetches accessible meeting types
         # We'll use the backend API to get this information
         # First, try to get meeting types from the organization
-        result = await _make_api_request(
-            f"api/v1/meeting-types?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        # Served from the per-organization registry; refreshed in the background when stale
+        registry = await get_meeting_type_registry(
+            organization_id, user_id, internal_service_secret
         )
+        result = registry.meeting_types
 
         # If that endpoint doesn't exist, try alternative approach
-        if not result or isinstance(result, dict) and result.get("statusCode"):
+        if not result:
             # Try getting user profile with teams, then meeting types
             # For now, return empty list - this might need backend endpoint
             return json.dumps(
@@ -48,7 +48,7 @@ async def get_user_accessible_meeting_types() -> str:
                 }
             )
 
-        return json.dumps(result, indent=2, default=str)
+        return encode_tool_output(result, "get_user_accessible_meeting_types")
     except Exception as e:
         # Fallback: return empty list
         return json.dumps({"meeting_types": [], "error": str(e)})
@@ -9,6 +9,7 @@ from .meeting_tools import (
     get_meeting_video_url,
     get_upcoming_meetings,
     list_meetings,
+    search_meeting_transcript,
     search_meetings,
     update_meeting,
 )
@@ -23,6 +24,7 @@ __all__ = [
     "search_meetings",
     "list_meetings",
     "get_meeting_transcript",
+    "search_meeting_transcript",
     "get_meeting_insights",
     "get_upcoming_meetings",
     "get_meeting_share_link",
@@ -0,0 +1,173 @@
+"""
+Per-run Meeting Cache
+
+`get_meeting_details`, `get_meeting_summary`, `get_meeting_transcript` and
+`get_meeting_insights` all read the same `api/v1/meetings/{id}` payload,
+transcript included. Meetings are cached per run (thread and run ID from
+the LangGraph config), so chaining those tools downloads a meeting once,
+and concurrent fetches of the same ID share one request. Transcript search
+indexes are kept longer, per user, since they are what repeated searches
+of one meeting need. `update_meeting` invalidates both.
+
+Invalidation also bumps the meeting's generation. Fetches started before
+the bump do not store their result, and fetches started after it do not
+join them, so an update is never followed by the pre-update payload.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from ..core.api_tools import _make_api_request
+from ..utils.ttl_cache import AsyncTTLCache
+from .transcripts import TranscriptIndex
+
+try:
+    from langgraph.config import get_config
+except ImportError:
+    get_config = None
+
+MEETING_CACHE_TTL = float(os.getenv("KNOWTED_MEETING_CACHE_TTL", "300"))
+# Entries hold full transcripts, so keep the cache small
+MEETING_CACHE_MAXSIZE = int(os.getenv("KNOWTED_MEETING_CACHE_MAXSIZE", "64"))
+
+# Keyed by (organization_id, user_id, thread_id, run_id, generation, meeting_id)
+meeting_cache = AsyncTTLCache(
+    "meetings", maxsize=MEETING_CACHE_MAXSIZE, ttl=MEETING_CACHE_TTL
+)
+
+TRANSCRIPT_INDEX_TTL = float(os.getenv("KNOWTED_TRANSCRIPT_INDEX_TTL", "900"))
+TRANSCRIPT_INDEX_MAXSIZE = int(os.getenv("KNOWTED_TRANSCRIPT_INDEX_MAXSIZE", "32"))
+
+# Keyed by (organization_id, user_id, generation, meeting_id)
+transcript_index_cache = AsyncTTLCache(
+    "transcript_index", maxsize=TRANSCRIPT_INDEX_MAXSIZE, ttl=TRANSCRIPT_INDEX_TTL
+)
+
+# Bumped by invalidate_meeting, per (organization_id, meeting_id)
+_generations: Dict[Tuple[str, str], int] = {}
+_generations_lock = threading.Lock()
+
+
+def _generation(organization_id: str, meeting_id: str) -> int:
+    with _generations_lock:
+        return _generations.get((organization_id, meeting_id), 0)
+
+
+def _run_scope() -> Tuple[Optional[str], Optional[str]]:
+    """(thread_id, run_id) of the current run, or (None, None) outside one."""
+    if get_config is None:
+        return None, None
+    try:
+        configurable = get_config().get("configurable", {})
+    except Exception:
+        return None, None
+    return configurable.get("thread_id"), configurable.get("run_id")
+
+
+def _is_meeting(result: Any) -> bool:
+    return isinstance(result, dict) and "statusCode" not in result
+
+
+async def fetch_meeting(
+    meeting_id: str,
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> Dict[str, Any]:
+    """
+    Fetch a meeting through the per-run cache.
+
+    The returned dict is shared with other tools in the run; do not mutate it.
+
+    Args:
+        meeting_id: Meeting ID
+        organization_id: Organization ID
+        user_id: User ID
+        internal_service_secret: Service secret for authentication
+
+    Returns:
+        Meeting payload from `api/v1/meetings/{id}`
+    """
+    generation = _generation(organization_id, meeting_id)
+    key: Hashable = (organization_id, user_id, *_run_scope(), generation, meeting_id)
+    return await meeting_cache.get_or_load(
+        key,
+        lambda: _make_api_request(
+            f"api/v1/meetings/{meeting_id}?organization_id={organization_id}",
+            method="GET",
+            organization_id=organization_id,
+            user_id=user_id,
+            internal_service_secret=internal_service_secret,
+        ),
+        # Not stored if the meeting was invalidated while it was being fetched
+        cache_if=lambda result: _is_meeting(result)
+        and _generation(organization_id, meeting_id) == generation,
+    )
+
+
+async def fetch_transcript_index(
+    meeting_id: str,
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> TranscriptIndex:
+    """
+    Search index of a meeting's transcript, built once and cached per user.
+
+    Meetings without a transcript yet are not cached, and neither are
+    error responses.
+
+    Args:
+        meeting_id: Meeting ID
+        organization_id: Organization ID
+        user_id: User ID
+        internal_service_secret: Service secret for authentication
+
+    Returns:
+        Transcript index of the meeting
+
+    Raises:
+        ValueError: The meeting could not be fetched (the API's error message)
+    """
+
+    async def load() -> TranscriptIndex:
+        meeting = await fetch_meeting(
+            meeting_id, organization_id, user_id, internal_service_secret
+        )
+        if not _is_meeting(meeting):
+            raise ValueError(
+                (meeting.get("message") if isinstance(meeting, dict) else None)
+                or "Meeting request failed"
+            )
+        return TranscriptIndex(meeting)
+
+    generation = _generation(organization_id, meeting_id)
+    return await transcript_index_cache.get_or_load(
+        (organization_id, user_id, generation, meeting_id),
+        load,
+        cache_if=lambda index: bool(index.segments)
+        and _generation(organization_id, meeting_id) == generation,
+    )
+
+
+def invalidate_meeting(organization_id: str, meeting_id: str) -> int:
+    """
+    Drop a meeting and its transcript index from every cache after it changes.
+
+    Bumps the meeting's generation first, so fetches still in flight do not
+    store the pre-update payload afterwards.
+
+    Returns:
+        Number of entries dropped
+    """
+    with _generations_lock:
+        meeting = (organization_id, meeting_id)
+        _generations[meeting] = _generations.get(meeting, 0) + 1
+
+    def matches(key: Hashable) -> bool:
+        return key[0] == organization_id and key[-1] == meeting_id
+
+    return meeting_cache.invalidate_where(matches) + transcript_index_cache.invalidate_where(
+        matches
+    )
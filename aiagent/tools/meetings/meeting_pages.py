@@ -0,0 +1,215 @@
+"""
+Paginated Meetings Iterator
+
+`api/v1/meetings` returns at most 100 rows per request, newest first, with
+`hasNextPage` to say whether another page follows. `MeetingPages` walks
+those pages as an async iterator. A background task fetches page N+1 while
+the caller processes page N; it waits on a bounded queue, so at most
+`prefetch` pages wait in the queue (plus the one being fetched) however
+large the result set is. Leaving
+the `async with` block (or calling `aclose()`) stops the prefetch, so
+callers can stop as soon as they have what they need.
+"""
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlencode
+
+from ..core.api_tools import _make_api_request
+
+# Rows per request (backend maximum: 100)
+MEETINGS_PAGE_SIZE = int(os.getenv("KNOWTED_MEETINGS_PAGE_SIZE", "100"))
+# Pages fetched ahead of the consumer
+MEETINGS_PREFETCH_PAGES = int(os.getenv("KNOWTED_MEETINGS_PREFETCH_PAGES", "1"))
+# Most meetings one tool call returns (the output budget cuts long lists anyway)
+MEETINGS_TOOL_LIMIT = int(os.getenv("KNOWTED_MEETINGS_TOOL_LIMIT", "500"))
+
+# Queue item marking the last page
+_END = object()
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class MeetingPages:
+    """
+    Async iterator over pages (lists of rows) of `api/v1/meetings`.
+
+    Usage:
+        async with MeetingPages(params, org, user, secret, max_meetings=500) as pages:
+            async for rows in pages:
+                ...
+
+    Attributes:
+        total: `total` from the latest response (meetings matching the query)
+        exhausted: True once the last page was read, False if the walk stopped
+            at `max_meetings` or was closed early
+    """
+
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        organization_id: str,
+        user_id: str,
+        internal_service_secret: str,
+        max_meetings: Optional[int] = None,
+        page_size: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        select: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            params: Query parameters other than page/limit (organization_id,
+                team_id, meeting_type_id, from_date, to_date, search)
+            organization_id: Organization ID
+            user_id: User ID (only meetings the user can access are returned)
+            internal_service_secret: Service secret for authentication
+            max_meetings: Stop after this many rows (default: no limit)
+            page_size: Rows per request (default: KNOWTED_MEETINGS_PAGE_SIZE)
+            prefetch: Pages buffered ahead (default: KNOWTED_MEETINGS_PREFETCH_PAGES)
+            select: Columns to project server-side (see `_make_api_request`)
+        """
+        self.params = params
+        self.organization_id = organization_id
+        self.user_id = user_id
+        self.internal_service_secret = internal_service_secret
+        self.max_meetings = max_meetings
+        self.page_size = max(1, min(page_size or MEETINGS_PAGE_SIZE, 100))
+        if max_meetings is not None:
+            # Do not download more rows than will be used
+            self.page_size = max(1, min(self.page_size, max_meetings))
+        self.select = select
+        self.total: Optional[int] = None
+        self.exhausted = False
+        self._queue: asyncio.Queue = asyncio.Queue(
+            maxsize=max(1, prefetch or MEETINGS_PREFETCH_PAGES)
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._done = False
+
+    async def _fetch(self, page: int) -> Dict[str, Any]:
+        query = urlencode({**self.params, "page": page, "limit": self.page_size})
+        result = await _make_api_request(
+            f"api/v1/meetings?{query}",
+            method="GET",
+            organization_id=self.organization_id,
+            user_id=self.user_id,
+            internal_service_secret=self.internal_service_secret,
+            select=self.select,
+        )
+        if not isinstance(result, dict) or result.get("statusCode"):
+            raise ValueError(
+                (result.get("message") if isinstance(result, dict) else None)
+                or "Meetings request failed"
+            )
+        return result
+
+    async def _produce(self) -> None:
+        page = 0
+        fetched = 0
+        previous_ids: set = set()
+        try:
+            while self.max_meetings is None or fetched < self.max_meetings:
+                result = await self._fetch(page)
+                self.total = result.get("total")
+                rows = [row for row in result.get("data") or [] if isinstance(row, dict)]
+                page_ids = {row.get("id") for row in rows}
+                # Meetings created while paging shift rows onto the next page
+                rows = [row for row in rows if row.get("id") not in previous_ids]
+                if self.max_meetings is not None:
+                    rows = rows[: self.max_meetings - fetched]
+                fetched += len(rows)
+                last = not result.get("hasNextPage") or not page_ids
+                if last:
+                    self.exhausted = True
+                if rows:
+                    # Blocks while the consumer is `prefetch` pages behind
+                    await self._queue.put(rows)
+                if last:
+                    break
+                previous_ids = page_ids
+                page += 1
+        except Exception as e:
+            await self._queue.put(_Failure(e))
+            return
+        await self._queue.put(_END)
+
+    def __aiter__(self) -> "MeetingPages":
+        return self
+
+    async def __anext__(self) -> List[Dict[str, Any]]:
+        if self._done:
+            raise StopAsyncIteration
+        if self._task is None:
+            # Tasks copy the current context, so run deadlines still apply
+            self._task = asyncio.get_running_loop().create_task(self._produce())
+        item = await self._queue.get()
+        if item is _END:
+            self._done = True
+            raise StopAsyncIteration
+        if isinstance(item, _Failure):
+            self._done = True
+            raise item.error
+        return item
+
+    async def rows(self) -> AsyncIterator[Dict[str, Any]]:
+        """The rows of every page, in order."""
+        async for page in self:
+            for row in page:
+                yield row
+
+    async def aclose(self) -> None:
+        """Stop fetching; pages not yet read are dropped."""
+        self._done = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self) -> "MeetingPages":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+async def collect_meetings(
+    params: Dict[str, Any],
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+    limit: int,
+    select: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    The first `limit` meetings of a query, across as many pages as needed.
+
+    Args:
+        params: Query parameters other than page/limit
+        organization_id: Organization ID
+        user_id: User ID
+        internal_service_secret: Service secret for authentication
+        limit: Maximum meetings to return
+        select: Columns to project server-side
+
+    Returns:
+        {"data": rows, "total": matching meetings, "hasNextPage": whether
+        more meetings match than were returned}
+    """
+    data: List[Dict[str, Any]] = []
+    async with MeetingPages(
+        params,
+        organization_id,
+        user_id,
+        internal_service_secret,
+        max_meetings=max(1, limit),
+        select=select,
+    ) as pages:
+        async for rows in pages:
+            data.extend(rows)
+    return {"data": data, "total": pages.total, "hasNextPage": not pages.exhausted}
@@ -1,7 +1,8 @@
 """
 Knowted Meeting Tools
 
-Tools for interacting with meetings data.
+Tools for interacting with meetings data. Single-meeting reads go through
+the per-run cache in `meeting_cache`.
 """
 
 from typing import Any, Dict, Optional
@@ -9,27 +10,40 @@ from typing import Any, Dict, Optional
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.tool_output import encode_tool_output
+from .meeting_cache import fetch_meeting, fetch_transcript_index, invalidate_meeting
+from .meeting_pages import MEETINGS_TOOL_LIMIT, collect_meetings
+from .transcripts import (
+    compile_matcher,
+    search_transcript,
+    transcript_page,
+    without_transcript,
+)
 
 
 @tool
 async def get_meeting_details(
     meeting_id: str,
+    cursor: Optional[str] = None,
 ) -> str:
     """
-    Get complete details for a specific meeting including all fields: title, meeting_date, summary, transcript, 
+    Get complete details for a specific meeting including all fields: title, meeting_date, summary,
     participants, duration, host_email, video_url, chapters, summary_meta_data, and all other meeting information.
 
-    Use this tool when you need comprehensive information about a meeting. This returns all available meeting data.
+    Use this tool when you need comprehensive information about a meeting. The transcript itself is not
+    included, only an overview of it (segments, duration, speakers): read it with get_meeting_transcript,
+    or find what was said with search_meeting_transcript.
 
     The tool automatically uses your organization and user context for access control.
 
     Args:
         meeting_id: The meeting ID (usually obtained from smart_search_meetings or list_meetings)
+        cursor: Cursor from a truncated previous result, to read the rest
 
     Returns:
         Complete meeting details as JSON string including:
         - id, title, meeting_date, duration_mins
-        - summary, transcript, transcript_json
+        - summary, transcript overview (total_segments, total_duration_secs, speakers)
         - host_email, participants_email
         - video_url, thumbnail, transcript_url
         - chapters, summary_meta_data
@@ -43,16 +57,12 @@ async def get_meeting_details(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/meetings/{meeting_id}?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await fetch_meeting(
+            meeting_id, organization_id, user_id, internal_service_secret
+        )
+        return encode_tool_output(
+            without_transcript(result), "get_meeting_details", cursor=cursor, resumable=True
         )
-        import json
-
-        return json.dumps(result, indent=2, default=str)
     except Exception as e:
         return f"Error fetching meeting details: {str(e)}"
 
@@ -78,16 +88,10 @@ async def get_meeting_summary(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/meetings/{meeting_id}?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await fetch_meeting(
+            meeting_id, organization_id, user_id, internal_service_secret
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_meeting_summary")
     except Exception as e:
         return f"Error fetching meeting summary: {str(e)}"
 
@@ -98,6 +102,7 @@ async def list_meetings(
     startdate: Optional[str] = None,
     enddate: Optional[str] = None,
     limit: Optional[int] = 10,
+    cursor: Optional[str] = None,
 ) -> str:
     """
     List meetings based on meeting types and organisation id.
@@ -113,6 +118,7 @@ async def list_meetings(
         startdate: Start date for sql query (format: YYYY-MM-DD)
         enddate: End date for sql query (format: YYYY-MM-DD)
         limit: Limit the query, 10 by default unless user has specifically mentioned
+        cursor: Cursor from a truncated previous result, to read the rest
 
     Returns:
         List of matching meetings as JSON string (only meetings user has access to)
@@ -123,10 +129,7 @@ async def list_meetings(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        params: Dict[str, Any] = {
-            "organization_id": organization_id,
-            "limit": min(limit or 10, 100),
-        }
+        params: Dict[str, Any] = {"organization_id": organization_id}
         if meeting_type_id:
             params["meeting_type_id"] = meeting_type_id
         if startdate:
@@ -134,18 +137,15 @@ async def list_meetings(
         if enddate:
             params["to_date"] = enddate
 
-        # Build query string
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        result = await _make_api_request(
-            f"api/v1/meetings?{query_string}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        # Follows pagination past the backend's 100 rows per request
+        result = await collect_meetings(
+            params,
+            organization_id,
+            user_id,
+            internal_service_secret,
+            limit=min(limit or 10, MEETINGS_TOOL_LIMIT),
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "list_meetings", cursor=cursor, resumable=True)
     except Exception as e:
         return f"Error listing meetings: {str(e)}"
 
@@ -157,6 +157,7 @@ async def search_meetings(
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     limit: int = 20,
+    cursor: Optional[str] = None,
 ) -> str:
     """
     Search meetings by content, participants, or date range.
@@ -168,7 +169,8 @@ async def search_meetings(
         team_id: Filter by team ID (optional)
         from_date: Filter meetings from this date (ISO string format)
         to_date: Filter meetings to this date (ISO string format)
-        limit: Number of results to return (default: 20, max: 100)
+        limit: Number of results to return (default: 20, max: 500)
+        cursor: Cursor from a truncated previous result, to read the rest
 
     Returns:
         List of matching meetings as JSON string (only meetings user has access to)
@@ -179,10 +181,7 @@ async def search_meetings(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        params: Dict[str, Any] = {
-            "organization_id": organization_id,
-            "limit": min(limit, 100),
-        }
+        params: Dict[str, Any] = {"organization_id": organization_id}
         if query:
             params["search"] = query
         if team_id:
@@ -192,18 +191,14 @@ async def search_meetings(
         if to_date:
             params["to_date"] = to_date
 
-        # Build query string
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        result = await _make_api_request(
-            f"api/v1/meetings?{query_string}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await collect_meetings(
+            params,
+            organization_id,
+            user_id,
+            internal_service_secret,
+            limit=min(limit or 20, MEETINGS_TOOL_LIMIT),
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "search_meetings", cursor=cursor, resumable=True)
     except Exception as e:
         return f"Error searching meetings: {str(e)}"
 
@@ -211,17 +206,31 @@ async def search_meetings(
 @tool
 async def get_meeting_transcript(
     meeting_id: str,
+    offset: Optional[int] = 0,
+    limit: Optional[int] = None,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    speaker: Optional[str] = None,
 ) -> str:
     """
     Only use when you have a meeting id to Get a meetings transcript with a meeting id usually returned by list meetings tool. A meeting_id and a meeting_type_id are different things. do not search with a meeting type id.
 
+    Returns one page of transcript segments with a header (total_segments, total_duration_secs, speakers,
+    matching_segments, has_more, next_offset). Long meetings come back in several pages: while has_more
+    is true, call again with offset=next_offset, or narrow with start_time/end_time or speaker.
+
     The tool automatically uses your organization and user context for access control.
 
     Args:
         meeting_id: The meeting ID (must be the same id from RAG or list meetings)
+        offset: Index of the first segment to return, counted after the filters (default: 0)
+        limit: Maximum segments to return (default: 200; pages are also capped by size)
+        start_time: Only segments from this many seconds into the meeting
+        end_time: Only segments up to this many seconds into the meeting
+        speaker: Comma-separated speaker names to keep (case-insensitive, partial names match)
 
     Returns:
-        Meeting transcript as text
+        Transcript page as JSON string
     """
     # Get organization_id, user_id, and internal_service_secret from LangGraph execution context
     organization_id, user_id, internal_service_secret = get_context_from_config()
@@ -229,26 +238,74 @@ async def get_meeting_transcript(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/meetings/{meeting_id}?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await fetch_meeting(
+            meeting_id, organization_id, user_id, internal_service_secret
+        )
+        page = transcript_page(
+            result,
+            offset=offset or 0,
+            limit=limit,
+            start_time=start_time,
+            end_time=end_time,
+            speaker=speaker,
+            tool_name="get_meeting_transcript",
         )
-        # Extract transcript from meeting response
-        transcript = result.get("transcript", "")
-        transcript_json = result.get("transcript_json")
-        
-        # Return structured transcript if available, otherwise plain text
-        if transcript_json:
-            import json
-            return json.dumps(transcript_json, indent=2)
-        return transcript if isinstance(transcript, str) else str(transcript)
+        return encode_tool_output(page, "get_meeting_transcript")
     except Exception as e:
         return f"Error fetching transcript: {str(e)}"
 
 
+@tool
+async def search_meeting_transcript(
+    meeting_id: str,
+    query: str,
+    regex: bool = False,
+    context: int = 2,
+    max_matches: int = 20,
+    speaker: Optional[str] = None,
+) -> str:
+    """
+    Find where something was said in a meeting without reading the whole transcript.
+
+    Returns only the transcript segments matching a keyword or regular expression, each with a few
+    segments of surrounding context. Prefer this over get_meeting_transcript for questions like
+    "what did Sarah say about pricing".
+
+    The tool automatically uses your organization and user context for access control.
+
+    Args:
+        meeting_id: The meeting ID (must be the same id from RAG or list meetings)
+        query: Keyword or phrase to find (case-insensitive), or a regular expression if regex is true
+        regex: Treat query as a regular expression (e.g. "pric(e|ing)")
+        context: Segments of context to include before and after each match (default: 2)
+        max_matches: Maximum matching segments to return (default: 20)
+        speaker: Comma-separated speaker names; only their matching segments are returned
+
+    Returns:
+        Matching excerpts as JSON string, with the total number of matching segments
+    """
+    # Get organization_id, user_id, and internal_service_secret from LangGraph execution context
+    organization_id, user_id, internal_service_secret = get_context_from_config()
+    if not organization_id or not user_id or not internal_service_secret:
+        return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
+
+    try:
+        pattern = compile_matcher(query, regex)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+
+    try:
+        index = await fetch_transcript_index(
+            meeting_id, organization_id, user_id, internal_service_secret
+        )
+        result = search_transcript(
+            index, pattern, context=context, max_matches=max_matches, speaker=speaker
+        )
+        return encode_tool_output(result, "search_meeting_transcript")
+    except Exception as e:
+        return f"Error searching transcript: {str(e)}"
+
+
 @tool
 async def get_meeting_insights(
     meeting_id: str,
@@ -271,12 +328,8 @@ async def get_meeting_insights(
 
     try:
         # Get meeting details and extract insights from response
-        result = await _make_api_request(
-            f"api/v1/meetings/{meeting_id}?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await fetch_meeting(
+            meeting_id, organization_id, user_id, internal_service_secret
         )
         # Extract insights-related fields from meeting response
         insights = {
@@ -285,9 +338,7 @@ async def get_meeting_insights(
             "chapters": result.get("chapters", ""),
             "key_points": result.get("summary_meta_data", {}).get("key_points", []),
         }
-        import json
-
-        return json.dumps(insights, indent=2)
+        return encode_tool_output(insights, "get_meeting_insights")
     except Exception as e:
         return f"Error fetching insights: {str(e)}"
 
@@ -320,9 +371,7 @@ async def get_upcoming_meetings(limit: Optional[int] = 10) -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_upcoming_meetings")
     except Exception as e:
         return f"Error fetching upcoming meetings: {str(e)}"
 
@@ -359,9 +408,7 @@ async def get_meeting_share_link(meeting_id: str) -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_meeting_share_link")
     except Exception as e:
         return f"Error fetching meeting share link: {str(e)}"
 
@@ -399,9 +446,7 @@ async def get_meeting_video_url(
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_meeting_video_url")
     except Exception as e:
         return f"Error fetching meeting video URL: {str(e)}"
 
@@ -436,8 +481,8 @@ async def update_meeting(meeting_id: str, updates: Dict[str, Any]) -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        # Cached copies of this meeting are now stale
+        invalidate_meeting(organization_id, meeting_id)
+        return encode_tool_output(result, "update_meeting")
     except Exception as e:
         return f"Error updating meeting: {str(e)}"
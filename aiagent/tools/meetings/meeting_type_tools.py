@@ -6,7 +6,9 @@ Tools for interacting with meeting types.
 
 from langchain_core.tools import tool
 
-from ..core.api_tools import _make_api_request, get_context_from_config
+from ..core.api_tools import get_context_from_config
+from ..utils.meeting_type_registry import get_meeting_type_registry
+from ..utils.tool_output import encode_tool_output
 
 
 @tool
@@ -31,16 +33,10 @@ async def get_meeting_types() -> str:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/meeting-types?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        registry = await get_meeting_type_registry(
+            organization_id, user_id, internal_service_secret
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(registry.meeting_types, "get_meeting_types")
     except Exception as e:
         return f"Error fetching meeting types: {str(e)}"
 
@@ -72,25 +68,15 @@ async def get_meeting_type(meeting_type_id: str) -> str:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        # GET /api/v1/meeting-types/{id} doesn't exist, so get all and filter
-        result = await _make_api_request(
-            f"api/v1/meeting-types?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
-        )
-        # Filter by meeting_type_id
-        meeting_types = result if isinstance(result, list) else result.get("data", [])
-        meeting_type = next(
-            (mt for mt in meeting_types if mt.get("id") == meeting_type_id), None
+        # GET /api/v1/meeting-types/{id} doesn't exist; look it up in the registry
+        registry = await get_meeting_type_registry(
+            organization_id, user_id, internal_service_secret
         )
+        meeting_type = registry.get(meeting_type_id)
 
         if not meeting_type:
             return f"Error: Meeting type {meeting_type_id} not found"
 
-        import json
-
-        return json.dumps(meeting_type, indent=2)
+        return encode_tool_output(meeting_type, "get_meeting_type")
     except Exception as e:
         return f"Error fetching meeting type: {str(e)}"
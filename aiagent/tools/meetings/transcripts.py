@@ -0,0 +1,316 @@
+"""
+Transcript Paging
+
+Hour-long transcripts do not fit in one tool result, and whatever a tool
+returns stays in the message history for every later turn. Transcripts are
+normalized into segments (speaker, start/end seconds, text) and served in
+pages: offset/limit over the segments that pass the time-range and speaker
+filters, with a header giving the totals so the agent can walk a long
+meeting in bounded chunks. `TranscriptIndex` serves keyword/regex search
+with surrounding context, so the agent can read the relevant excerpts
+without downloading the whole transcript into the conversation.
+"""
+
+import bisect
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Pattern
+
+from ..utils.tool_output import fits_budget
+
+# Segments per page when the caller does not pass a limit
+TRANSCRIPT_PAGE_SEGMENTS = int(os.getenv("KNOWTED_TRANSCRIPT_PAGE_SEGMENTS", "200"))
+
+# "Speaker Name: text" lines in plain-text transcripts
+_SPEAKER_LINE = re.compile(r"^\s*([^:\n]{1,80}):\s*(.*)$")
+
+
+def _seconds(value: Any) -> Optional[float]:
+    try:
+        return round(float(value), 2)
+    except (TypeError, ValueError):
+        return None
+
+
+def transcript_segments(meeting: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Normalize a meeting's transcript into a list of segments.
+
+    Uses `transcript_json` (`{"type": ..., "data": [segments]}`) when present,
+    otherwise splits the plain `transcript` into lines, reading a speaker from
+    "Name: text" prefixes. Plain-text segments have no timestamps.
+
+    Args:
+        meeting: Meeting payload from `api/v1/meetings/{id}`
+
+    Returns:
+        Segments with `speaker`, `start`, `end` and `text` keys
+    """
+    transcript_json = meeting.get("transcript_json")
+    raw = transcript_json.get("data") if isinstance(transcript_json, dict) else transcript_json
+    if isinstance(raw, list) and raw:
+        return [
+            {
+                "speaker": segment.get("speaker"),
+                "start": _seconds(segment.get("start", segment.get("offset"))),
+                "end": _seconds(segment.get("end")),
+                "text": segment.get("conversation") or segment.get("text") or "",
+            }
+            for segment in raw
+            if isinstance(segment, dict)
+        ]
+
+    transcript = meeting.get("transcript") or ""
+    if not isinstance(transcript, str):
+        transcript = str(transcript)
+    segments = []
+    for line in transcript.splitlines():
+        if not line.strip():
+            continue
+        match = _SPEAKER_LINE.match(line)
+        speaker, text = (match.group(1).strip(), match.group(2)) if match else (None, line.strip())
+        segments.append({"speaker": speaker, "start": None, "end": None, "text": text})
+    return segments
+
+
+def _speaker_matches(speaker: Optional[str], wanted: List[str]) -> bool:
+    name = (speaker or "").lower()
+    return any(w in name for w in wanted)
+
+
+def filter_segments(
+    segments: List[Dict[str, Any]],
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    speaker: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Segments overlapping [start_time, end_time] whose speaker matches.
+
+    Args:
+        segments: Normalized segments
+        start_time: Window start in seconds from the meeting start
+        end_time: Window end in seconds
+        speaker: Comma-separated speaker names (case-insensitive substrings)
+    """
+    wanted = [name.strip().lower() for name in (speaker or "").split(",") if name.strip()]
+    selected = []
+    for segment in segments:
+        if wanted and not _speaker_matches(segment["speaker"], wanted):
+            continue
+        # Untimed (plain-text) segments pass the time filters
+        start = segment["start"]
+        end = segment["end"] if segment["end"] is not None else start
+        if start_time is not None and end is not None and end < start_time:
+            continue
+        if end_time is not None and start is not None and start > end_time:
+            continue
+        selected.append(segment)
+    return selected
+
+
+def _duration(segments: List[Dict[str, Any]]) -> Optional[float]:
+    ends = [s["end"] if s["end"] is not None else s["start"] for s in segments]
+    ends = [end for end in ends if end is not None]
+    return max(ends) if ends else None
+
+
+def without_transcript(meeting: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    A meeting payload with its transcript replaced by a short overview.
+
+    `get_meeting_details` returns this so that a full transcript never lands
+    in the conversation; the overview points at the paging and search tools.
+
+    Args:
+        meeting: Meeting payload from `api/v1/meetings/{id}`
+
+    Returns:
+        Shallow copy without `transcript`/`transcript_json`, plus a `transcript` overview
+    """
+    segments = transcript_segments(meeting)
+    details = {
+        key: value
+        for key, value in meeting.items()
+        if key not in ("transcript", "transcript_json")
+    }
+    details["transcript"] = {
+        "total_segments": len(segments),
+        "total_duration_secs": _duration(segments),
+        "speakers": sorted({s["speaker"] for s in segments if s["speaker"]}),
+        "read_with": "get_meeting_transcript (pages) or search_meeting_transcript (keywords)",
+    }
+    return details
+
+
+def transcript_page(
+    meeting: Dict[str, Any],
+    offset: int = 0,
+    limit: Optional[int] = None,
+    start_time: Optional[float] = None,
+    end_time: Optional[float] = None,
+    speaker: Optional[str] = None,
+    tool_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    One page of a meeting's transcript with a totals header.
+
+    `offset` counts segments after filtering. The page is shortened to fit
+    the tool's token budget; `next_offset` always points at the first
+    segment not returned, and `has_more` is False on the last page.
+
+    Args:
+        meeting: Meeting payload from `api/v1/meetings/{id}`
+        offset: Index of the first matching segment to return
+        limit: Maximum segments to return
+        start_time: Window start in seconds from the meeting start
+        end_time: Window end in seconds
+        speaker: Comma-separated speaker names (case-insensitive substrings)
+        tool_name: Tool name, for its token budget
+
+    Returns:
+        Header fields plus `segments`
+    """
+    segments = transcript_segments(meeting)
+    matching = filter_segments(segments, start_time, end_time, speaker)
+    offset = max(0, offset or 0)
+    limit = max(1, limit or TRANSCRIPT_PAGE_SEGMENTS)
+
+    header: Dict[str, Any] = {
+        "meeting_id": meeting.get("id"),
+        "title": meeting.get("title"),
+        "total_segments": len(segments),
+        "total_duration_secs": _duration(segments),
+        "total_chars": sum(len(s["text"]) for s in segments),
+        "speakers": sorted({s["speaker"] for s in segments if s["speaker"]}),
+        "matching_segments": len(matching),
+        "offset": offset,
+    }
+
+    def page(count: int) -> Dict[str, Any]:
+        returned = matching[offset : offset + count]
+        next_offset = offset + len(returned)
+        return {
+            **header,
+            "returned": len(returned),
+            # Explicit flag: null next_offset is elided from the encoded output
+            "has_more": next_offset < len(matching),
+            "next_offset": next_offset if next_offset < len(matching) else None,
+            "segments": returned,
+        }
+
+    count = min(limit, max(0, len(matching) - offset))
+    if count > 1 and not fits_budget(page(count), tool_name):
+        # Largest page within the budget (at least one segment)
+        low, high = 1, count - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits_budget(page(middle), tool_name):
+                low = middle
+            else:
+                high = middle - 1
+        count = low
+    return page(count)
+
+
+class TranscriptIndex:
+    """
+    Searchable form of one meeting's transcript.
+
+    Segment texts are joined into one string so a compiled pattern scans
+    the whole transcript in a single pass; match positions are mapped back
+    to segments by bisecting the segment start offsets.
+    """
+
+    def __init__(self, meeting: Dict[str, Any]):
+        self.meeting_id = meeting.get("id")
+        self.title = meeting.get("title")
+        self.segments = transcript_segments(meeting)
+        self.starts: List[int] = []
+        position = 0
+        for segment in self.segments:
+            self.starts.append(position)
+            position += len(segment["text"]) + 1
+        self.text = "\n".join(segment["text"] for segment in self.segments)
+
+    def matching_segments(self, pattern: Pattern[str]) -> List[int]:
+        """Indexes of the segments containing a match, in order."""
+        found: List[int] = []
+        for match in pattern.finditer(self.text):
+            index = bisect.bisect_right(self.starts, match.start()) - 1
+            if not found or found[-1] != index:
+                found.append(index)
+        return found
+
+
+@lru_cache(maxsize=256)
+def compile_matcher(query: str, regex: bool = False) -> Pattern[str]:
+    """
+    Case-insensitive matcher for a keyword or regular expression.
+
+    Raises:
+        ValueError: The regular expression is invalid
+    """
+    try:
+        return re.compile(query if regex else re.escape(query), re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regular expression {query!r}: {e}")
+
+
+def search_transcript(
+    index: TranscriptIndex,
+    pattern: Pattern[str],
+    context: int = 2,
+    max_matches: int = 20,
+    speaker: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Matching segments with `context` segments either side.
+
+    Overlapping windows are merged into one excerpt; matched segments are
+    flagged with `match: true`.
+
+    Args:
+        index: Transcript index of the meeting
+        pattern: Compiled matcher
+        context: Segments of context before and after each match
+        max_matches: Maximum matching segments to return
+        speaker: Only count matches spoken by these speakers (comma-separated)
+
+    Returns:
+        Match counts plus `excerpts`
+    """
+    matches = index.matching_segments(pattern)
+    wanted = [name.strip().lower() for name in (speaker or "").split(",") if name.strip()]
+    if wanted:
+        matches = [i for i in matches if _speaker_matches(index.segments[i]["speaker"], wanted)]
+    shown = matches[: max(1, max_matches)]
+    context = max(0, context)
+
+    excerpts: List[Dict[str, Any]] = []
+    matched = set(shown)
+    last_end = -1
+    for i in shown:
+        first = max(0, i - context)
+        last = min(len(index.segments) - 1, i + context)
+        if excerpts and first <= last_end + 1:
+            # Overlaps (or touches) the previous excerpt: extend it
+            first = last_end + 1
+        else:
+            excerpts.append({"segments": []})
+        for j in range(first, last + 1):
+            excerpts[-1]["segments"].append(
+                {"index": j, **index.segments[j], "match": j in matched}
+            )
+        last_end = max(last_end, last)
+
+    return {
+        "meeting_id": index.meeting_id,
+        "title": index.title,
+        "pattern": pattern.pattern,
+        "total_segments": len(index.segments),
+        "matching_segments": len(matches),
+        "returned_matches": len(shown),
+        "excerpts": excerpts,
+    }
@@ -9,6 +9,8 @@ from typing import Optional
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.member_directory import get_member_directory
+from ..utils.tool_output import encode_tool_output
 
 
 @tool
@@ -35,16 +37,10 @@ async def get_organization_members() -> str:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/organizations/{organization_id}/members",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        directory = await get_member_directory(
+            organization_id, user_id, internal_service_secret
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(directory.all_members(), "get_organization_members")
     except Exception as e:
         return f"Error fetching organization members: {str(e)}"
 
@@ -81,9 +77,7 @@ async def get_organization_invitations() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_organization_invitations")
     except Exception as e:
         return f"Error fetching organization invitations: {str(e)}"
 
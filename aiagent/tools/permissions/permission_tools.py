@@ -7,6 +7,7 @@ Tools for checking user permissions.
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.tool_output import encode_tool_output
 
 
 @tool
@@ -38,9 +39,7 @@ async def get_user_permissions() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_user_permissions")
     except Exception as e:
         return f"Error fetching user permissions: {str(e)}"
 
@@ -9,6 +9,9 @@ from typing import Dict, Any, Optional
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.tool_output import encode_tool_output
+from ..utils.context_cache import invalidate_user_context
+from ..utils.member_directory import invalidate_member_directory
 
 
 @tool
@@ -43,9 +46,7 @@ async def get_user_profile() -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_user_profile")
     except Exception as e:
         return f"Error fetching user profile: {str(e)}"
 
@@ -89,9 +90,10 @@ async def update_user_profile(first_name: Optional[str] = None, last_name: Optio
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        # The cached context snapshot and member rows hold the old name
+        invalidate_user_context(organization_id, user_id)
+        invalidate_member_directory(organization_id)
+        return encode_tool_output(result, "update_user_profile")
     except Exception as e:
         return f"Error updating user profile: {str(e)}"
 
@@ -0,0 +1,319 @@
+"""
+Streaming Meeting Reports
+
+A report covers every meeting in a date range, which for an organization
+can be a year of meetings. Reports walk `api/v1/meetings` with
+`MeetingPages` and fold each page into a `MeetingReportAccumulator`, while
+the next page downloads. The accumulator holds counters plus a fixed-size
+duration histogram. Its memory grows with the number of weeks, meeting
+types, teams, hosts and participants, not with the number of meetings, and
+only the page being folded and the one being prefetched are held.
+"""
+
+import os
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.deadline import DeadlineExceeded
+from ..meetings.meeting_pages import MeetingPages
+from ..utils.meeting_stats import meeting_type_name, parse_day, parse_duration, week_starts
+
+# Stop paging after this many meetings; the report is marked partial
+REPORT_MAX_MEETINGS = int(os.getenv("KNOWTED_REPORT_MAX_MEETINGS", "50000"))
+# Period covered when no date range is given
+REPORT_DEFAULT_DAYS = int(os.getenv("KNOWTED_REPORT_DEFAULT_DAYS", "30"))
+
+# The only report this engine builds; other types are rejected, not aliased
+REPORT_TYPES = ("meetings",)
+
+# Columns the accumulator reads (list rows carry the type as `meetingType`).
+# Only sent when KNOWTED_API_PROJECTION is on; otherwise rows are full
+_REPORT_COLUMNS = [
+    "id",
+    "meeting_date",
+    "duration_mins",
+    "host_email",
+    "participants_email",
+    "meetingType",
+    "team",
+]
+
+# Durations are histogrammed per minute; longer meetings share the last bucket
+_MAX_DURATION_MINS = 24 * 60
+
+
+def _team_name(meeting: Dict[str, Any]) -> Optional[str]:
+    team = meeting.get("team")
+    if isinstance(team, dict):
+        return team.get("name") or team.get("id")
+    return team or None
+
+
+def _share(count: int, total: int) -> float:
+    return round(count / total, 3) if total else 0.0
+
+
+class MeetingReportAccumulator:
+    """Incremental meeting statistics, folded in one page at a time."""
+
+    def __init__(self):
+        self.meetings = 0
+        self.first_day: Optional[np.datetime64] = None
+        self.last_day: Optional[np.datetime64] = None
+        # Week start (days since the epoch) -> meetings
+        self.weeks: Counter = Counter()
+        # Meetings per whole minute of duration
+        self.duration_histogram = np.zeros(_MAX_DURATION_MINS + 1, dtype=np.int64)
+        self.duration_total = 0.0
+        # Meeting type -> [meetings, minutes]
+        self.by_type: Dict[str, List[float]] = {}
+        self.by_team: Counter = Counter()
+        self.hosts: Counter = Counter()
+        # Participant email -> meetings attended
+        self.participants: Counter = Counter()
+        self.participant_slots = 0
+
+    def add(self, meetings: List[Dict[str, Any]]) -> None:
+        """Fold a page of meeting rows into the totals."""
+        if not meetings:
+            return
+        self.meetings += len(meetings)
+
+        days = [parse_day(m.get("meeting_date")) for m in meetings]
+        dated = np.array([d for d in days if d is not None], dtype="datetime64[D]")
+        if dated.size:
+            weeks, counts = np.unique(week_starts(dated), return_counts=True)
+            self.weeks.update(dict(zip(weeks.tolist(), counts.tolist())))
+            low, high = dated.min(), dated.max()
+            self.first_day = low if self.first_day is None else min(self.first_day, low)
+            self.last_day = high if self.last_day is None else max(self.last_day, high)
+
+        durations = np.array([parse_duration(m.get("duration_mins")) for m in meetings], dtype=float)
+        timed = durations[~np.isnan(durations)]
+        if timed.size:
+            self.duration_total += float(timed.sum())
+            buckets = np.clip(np.rint(timed), 0, _MAX_DURATION_MINS).astype(np.int64)
+            self.duration_histogram += np.bincount(buckets, minlength=_MAX_DURATION_MINS + 1)
+
+        for meeting, duration in zip(meetings, durations.tolist()):
+            entry = self.by_type.setdefault(meeting_type_name(meeting) or "Unassigned", [0, 0.0])
+            entry[0] += 1
+            if duration == duration:  # not NaN
+                entry[1] += duration
+            self.by_team[_team_name(meeting) or "No team"] += 1
+            if meeting.get("host_email"):
+                self.hosts[meeting["host_email"].lower()] += 1
+            emails = {
+                email.lower()
+                for email in meeting.get("participants_email") or []
+                if isinstance(email, str) and email
+            }
+            self.participants.update(emails)
+            self.participant_slots += len(emails)
+
+    def duration_percentile(self, q: float) -> Optional[int]:
+        """Duration in whole minutes at quantile `q` (0-1), from the histogram."""
+        cumulative = np.cumsum(self.duration_histogram)
+        if not cumulative[-1]:
+            return None
+        return int(np.searchsorted(cumulative, q * cumulative[-1]))
+
+    def weekly_counts(self) -> Dict[str, int]:
+        """Meetings per ISO week (keyed by Monday), including empty weeks."""
+        if not self.weeks:
+            return {}
+        first, last = min(self.weeks), max(self.weeks)
+        return {
+            str(np.datetime64(week, "D")): self.weeks.get(week, 0)
+            for week in range(first, last + 1, 7)
+        }
+
+    def report(self, title: str, period: Dict[str, Optional[str]], top: int = 10) -> Dict[str, Any]:
+        """
+        Render the totals as a report.
+
+        Args:
+            title: Report title
+            period: {"from", "to"} of the requested range
+            top: Entries to list per breakdown
+
+        Returns:
+            Report with title, period, summary, metrics, breakdowns and insights
+        """
+        total = self.meetings
+        timed = int(self.duration_histogram.sum())
+        weeks = self.weekly_counts()
+        metrics: Dict[str, Any] = {
+            "meetings": total,
+            "meetings_per_week": round(total / len(weeks), 1) if weeks else 0,
+            "total_hours": round(self.duration_total / 60, 1),
+            "avg_duration_mins": round(self.duration_total / timed, 1) if timed else None,
+            "p50_duration_mins": self.duration_percentile(0.5),
+            "p90_duration_mins": self.duration_percentile(0.9),
+            "distinct_hosts": len(self.hosts),
+            "distinct_participants": len(self.participants),
+            "avg_participants": round(self.participant_slots / total, 1) if total else None,
+        }
+
+        meeting_types = sorted(self.by_type.items(), key=lambda item: -item[1][0])
+        breakdowns = {
+            "meeting_types": [
+                {
+                    "name": name,
+                    "meetings": int(count),
+                    "share": _share(count, total),
+                    "hours": round(minutes / 60, 1),
+                }
+                for name, (count, minutes) in meeting_types[:top]
+            ],
+            "teams": [
+                {"name": name, "meetings": count, "share": _share(count, total)}
+                for name, count in self.by_team.most_common(top)
+            ],
+            "hosts": [
+                {"email": email, "meetings": count, "share": _share(count, total)}
+                for email, count in self.hosts.most_common(top)
+            ],
+            "participants": [
+                {"email": email, "meetings": count}
+                for email, count in self.participants.most_common(top)
+            ],
+            "weeks": weeks,
+        }
+
+        insights = []
+        if weeks:
+            busiest = max(weeks, key=weeks.get)
+            insights.append(f"Busiest week: {busiest} ({weeks[busiest]} meetings)")
+        if meeting_types:
+            name, (count, _) = meeting_types[0]
+            insights.append(f"Most common meeting type: {name} ({_share(count, total):.0%} of meetings)")
+        if self.hosts:
+            email, count = self.hosts.most_common(1)[0]
+            insights.append(f"Most frequent host: {email} ({count} meetings)")
+        if metrics["p90_duration_mins"] is not None:
+            insights.append(
+                f"Half of meetings last {metrics['p50_duration_mins']} minutes or less "
+                f"and 90% finish within {metrics['p90_duration_mins']} minutes"
+            )
+
+        span = (
+            f"between {self.first_day} and {self.last_day}"
+            if self.first_day is not None
+            else f"from {period.get('from') or 'the start'} to {period.get('to') or 'now'}"
+        )
+        return {
+            "title": title,
+            "period": period,
+            "summary": f"{total} meetings {span}, {metrics['total_hours']} hours in total.",
+            "metrics": metrics,
+            "breakdowns": breakdowns,
+            "insights": insights,
+        }
+
+
+def parse_date_range(date_range: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Backend from/to bounds for "from,to" (either side may be empty).
+
+    Without a range the last REPORT_DEFAULT_DAYS days are used. A date-only
+    upper bound is extended to the end of that day, since the backend
+    compares it against meeting timestamps.
+
+    Raises:
+        ValueError: A bound is not an ISO date
+    """
+    if not date_range:
+        today = datetime.now(timezone.utc).date()
+        return (today - timedelta(days=REPORT_DEFAULT_DAYS)).isoformat(), None
+    start, _, end = (part.strip() for part in date_range.partition(","))
+    for bound in (start, end):
+        if bound:
+            try:
+                datetime.fromisoformat(bound.replace("Z", "+00:00"))
+            except ValueError:
+                raise ValueError(f"Invalid date {bound!r} in date_range; use YYYY-MM-DD,YYYY-MM-DD")
+    if end and len(end) == 10:
+        end = f"{date.fromisoformat(end).isoformat()}T23:59:59.999Z"
+    return start or None, end or None
+
+
+async def build_meeting_report(
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+    report_type: str = "meetings",
+    date_range: Optional[str] = None,
+    team_id: Optional[str] = None,
+    max_meetings: int = REPORT_MAX_MEETINGS,
+) -> Dict[str, Any]:
+    """
+    Build a meeting report by streaming the meetings in a date range.
+
+    If the run's time budget or `max_meetings` is reached first, the report
+    covers the meetings read so far and says so under `partial`.
+
+    Args:
+        organization_id: Organization ID
+        user_id: User ID (only meetings the user can access are counted)
+        internal_service_secret: Service secret for authentication
+        report_type: Report type; only "meetings" is supported
+        date_range: "from,to" in ISO format (default: the last REPORT_DEFAULT_DAYS days)
+        team_id: Only count this team's meetings
+        max_meetings: Stop after this many meetings
+
+    Returns:
+        Report dict (see `MeetingReportAccumulator.report`)
+
+    Raises:
+        ValueError: If `report_type` is not in REPORT_TYPES
+    """
+    if report_type not in REPORT_TYPES:
+        raise ValueError(
+            f"Unsupported report type '{report_type}'; supported: {', '.join(REPORT_TYPES)}"
+        )
+    from_date, to_date = parse_date_range(date_range)
+    params: Dict[str, Any] = {"organization_id": organization_id}
+    if team_id:
+        params["team_id"] = team_id
+    if from_date:
+        params["from_date"] = from_date
+    if to_date:
+        params["to_date"] = to_date
+
+    accumulator = MeetingReportAccumulator()
+    partial: Optional[str] = None
+    # The next page downloads while this one is folded in
+    async with MeetingPages(
+        params,
+        organization_id,
+        user_id,
+        internal_service_secret,
+        max_meetings=max_meetings,
+        select=_REPORT_COLUMNS,
+    ) as pages:
+        try:
+            async for rows in pages:
+                accumulator.add(rows)
+            if not pages.exhausted:
+                partial = "meeting limit reached"
+        except DeadlineExceeded:
+            if not accumulator.meetings:
+                raise
+            partial = "time budget reached"
+
+    title = f"{report_type.replace('_', ' ').title()} Report"
+    period = {"from": from_date, "to": to_date[:10] if to_date else None}
+    report = accumulator.report(title, period)
+    if team_id:
+        report["team_id"] = team_id
+    if partial:
+        report["partial"] = {
+            "reason": partial,
+            "meetings_counted": accumulator.meetings,
+            "meetings_in_range": pages.total,
+        }
+    return report
@@ -7,6 +7,8 @@ Tools for generating and managing reports.
 from typing import Optional, Dict, Any
 from langchain_core.tools import tool
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..utils.tool_output import encode_tool_output
+from .report_engine import REPORT_TYPES, build_meeting_report
 
 
 @tool
@@ -17,13 +19,18 @@ async def generate_report(
     format: str = "json",
 ) -> str:
     """
-    Generate reports for teams or organizations.
+    Generate a meeting report for a team or the organization.
+
+    Aggregates every meeting in the date range: meeting counts per week,
+    duration statistics, and breakdowns by meeting type, team, host and
+    participant. "meetings" is the only report type.
     
     The tool automatically uses your organization and user context for access control.
     
     Args:
-        report_type: Type of report (e.g., "meetings", "team_performance", "analytics")
-        date_range: Date range in ISO format (e.g., "2024-01-01,2024-12-31")
+        report_type: Type of report; only "meetings" is supported
+        date_range: Date range in ISO format (e.g., "2024-01-01,2024-12-31");
+            defaults to the last 30 days
         team_id: Filter by team ID (optional)
         format: Output format ("json" or "text")
     
@@ -33,35 +40,27 @@ async def generate_report(
     organization_id, user_id, internal_service_secret = get_context_from_config()
     if not organization_id or not user_id or not internal_service_secret:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
+    if report_type not in REPORT_TYPES:
+        return (
+            f"Error: Unsupported report type '{report_type}'. "
+            f"Supported report types: {', '.join(REPORT_TYPES)}"
+        )
 
     try:
-        data: Dict[str, Any] = {
-            "organization_id": organization_id,
-            "report_type": report_type,
-        }
-        if date_range:
-            data["date_range"] = date_range
-        if team_id:
-            data["team_id"] = team_id
-        
-        # Note: Reports generation endpoint doesn't exist in Swagger
-        # Using report-types endpoint instead
-        result = await _make_api_request(
-            f"api/v1/report-types?organization_id={organization_id}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        # Streams every meeting in the range through bounded-memory accumulators
+        report = await build_meeting_report(
+            organization_id,
+            user_id,
+            internal_service_secret,
+            report_type=report_type,
+            date_range=date_range,
+            team_id=team_id,
         )
-        import json
-        
-        # Return available report types as the "generated report"
-        response_text = f"Report generation not yet implemented. Available report types: {json.dumps(result, indent=2)}"
-        
+
         if format == "text":
-            return response_text
-        
-        return json.dumps({"message": "Report generation not yet implemented", "available_report_types": result}, indent=2)
+            return encode_tool_output(_format_report_as_text(report), "generate_report")
+
+        return encode_tool_output(report, "generate_report")
     except Exception as e:
         return f"Error generating report: {str(e)}"
 
@@ -92,8 +91,7 @@ async def get_report_data(report_id: str) -> str:
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_report_data")
     except Exception as e:
         return f"Error fetching report data: {str(e)}"
 
@@ -134,8 +132,7 @@ async def create_report_template(
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-        import json
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "create_report_template")
     except Exception as e:
         return f"Error creating report template: {str(e)}"
 
@@ -145,7 +142,11 @@ def _format_report_as_text(report_data: Dict[str, Any]) -> str:
     lines = []
     lines.append(f"Report: {report_data.get('title', 'Untitled Report')}")
     lines.append("=" * 60)
-    
+
+    period = report_data.get("period") or {}
+    if period.get("from") or period.get("to"):
+        lines.append(f"Period: {period.get('from') or '...'} to {period.get('to') or 'now'}")
+
     if "summary" in report_data:
         lines.append(f"\nSummary:\n{report_data['summary']}")
     
@@ -154,10 +155,32 @@ def _format_report_as_text(report_data: Dict[str, Any]) -> str:
         for key, value in report_data["metrics"].items():
             lines.append(f"  - {key}: {value}")
     
+    for name, rows in (report_data.get("breakdowns") or {}).items():
+        if not rows:
+            continue
+        lines.append(f"\n{name.replace('_', ' ').title()}:")
+        if isinstance(rows, dict):
+            for key, value in rows.items():
+                lines.append(f"  - {key}: {value}")
+            continue
+        for row in rows:
+            label = row.get("name") or row.get("email")
+            details = ", ".join(
+                f"{key}: {value}" for key, value in row.items() if key not in ("name", "email")
+            )
+            lines.append(f"  - {label} ({details})")
+
     if "insights" in report_data:
         lines.append("\nInsights:")
         for insight in report_data["insights"]:
             lines.append(f"  - {insight}")
+
+    if report_data.get("partial"):
+        partial = report_data["partial"]
+        lines.append(
+            f"\nPartial report ({partial.get('reason')}): counted "
+            f"{partial.get('meetings_counted')} of {partial.get('meetings_in_range')} meetings"
+        )
     
     return "\n".join(lines)
 
@@ -1,80 +1,157 @@
 """
 RAG Search Tool - Vector store semantic search for meetings
-Context-aware: Filters by organization_id and user_id from config
+Context-aware: Filters by organization_id and user_id from config, pushing the
+organization predicate down into the vector store query
 """
 
-from typing import Any, List, Optional
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from langchain_core.documents import Document
 from langchain_core.retrievers import BaseRetriever
 from langchain_core.tools import BaseTool, tool
-from rag.vector_store import setup_vector_store
+from langchain_core.vectorstores import InMemoryVectorStore, VectorStore
+from rag.vector_store import PGVector, get_shared_vector_store, reset_vector_store
+from sqlalchemy.exc import DBAPIError
+
+from ..utils.tool_output import encode_tool_output
+
+
+# Metadata keys that may carry the tenant ID (legacy ingest used "organisation_id")
+ORGANIZATION_METADATA_KEYS = ("organization_id", "organisation_id")
+
+
+def _document_organization_id(doc: Document) -> Optional[str]:
+    metadata = doc.metadata if hasattr(doc, "metadata") else {}
+    return metadata.get("organization_id") or metadata.get("organisation_id")
+
+
+def build_tenant_filter(
+    vector_store: VectorStore,
+    organization_id: str,
+    user_id: Optional[str] = None,
+) -> Union[Dict[str, Any], Callable[[Document], bool]]:
+    """
+    Build a metadata predicate the vector store evaluates inside its query.
+
+    PGVector gets a JSONB filter dict (served by the metadata expression
+    indexes created in `rag.vector_store`); the in-memory store gets a
+    callable, which it applies before ranking.
+
+    Args:
+        vector_store: Store the filter is for
+        organization_id: Organization the results must belong to
+        user_id: Also require this user_id in metadata (optional)
+
+    Returns:
+        Filter accepted by the store's similarity_search(filter=...)
+    """
+    if isinstance(vector_store, InMemoryVectorStore):
+
+        def matches(doc: Document) -> bool:
+            if _document_organization_id(doc) != organization_id:
+                return False
+            return user_id is None or doc.metadata.get("user_id") == user_id
+
+        return matches
+
+    # $in compiles to (cmetadata ->> key) IN (...), which can use the index
+    org_filter: Dict[str, Any] = {
+        "$or": [{key: {"$in": [organization_id]}} for key in ORGANIZATION_METADATA_KEYS]
+    }
+    if user_id is None:
+        return org_filter
+    return {"$and": [org_filter, {"user_id": {"$in": [user_id]}}]}
 
 
 class ContextAwareRetriever(BaseRetriever):
     """
-    Retriever wrapper that adds metadata filtering by organization_id and user_id.
-    Filters results to only include documents from the user's organization.
+    Retriever that scopes results to the user's organization.
+
+    In filtered mode (default) the organization predicate is pushed into the
+    vector query, so one query returns up to `k` tenant-scoped hits.
+    Otherwise it over-fetches `k * 2` documents and filters in Python.
+    Results are always re-checked against organization_id.
     """
 
-    def __init__(
-        self,
-        base_retriever: BaseRetriever,
-        organization_id: Optional[str] = None,
-        user_id: Optional[str] = None,
-    ):
-        super().__init__()
-        self.base_retriever = base_retriever
-        self.organization_id = organization_id
-        self.user_id = user_id
+    vector_store: VectorStore
+    k: int = 5
+    organization_id: Optional[str] = None
+    user_id: Optional[str] = None
+    filtered: bool = True
+    restrict_to_user: bool = False
+
+    def _search(self, query: str) -> List[Document]:
+        if self.filtered and self.organization_id:
+            tenant_filter = build_tenant_filter(
+                self.vector_store,
+                self.organization_id,
+                self.user_id if self.restrict_to_user else None,
+            )
+            docs = self.vector_store.similarity_search(
+                query, k=self.k, filter=tenant_filter
+            )
+        else:
+            # Get more to filter
+            docs = self.vector_store.similarity_search(query, k=self.k * 2)
+        return self._scope(docs)
+
+    def _scope(self, docs: List[Document]) -> List[Document]:
+        """Drop documents outside the organization (defense in depth)."""
+        if not self.organization_id:
+            return docs[: self.k]
+        return [
+            doc for doc in docs if _document_organization_id(doc) == self.organization_id
+        ][: self.k]
 
     def _get_relevant_documents(
         self, query: str, *, run_manager: Any = None
     ) -> List[Document]:
-        """Retrieve documents and filter by organization_id."""
-        # Get documents from base retriever
-        docs = self.base_retriever.get_relevant_documents(
-            query, run_manager=run_manager
-        )
-
-        # Filter by organization_id if available
-        if self.organization_id:
-            filtered_docs = []
-            for doc in docs:
-                metadata = doc.metadata if hasattr(doc, "metadata") else {}
-                # Check if document belongs to the organization
-                doc_org_id = metadata.get("organization_id") or metadata.get(
-                    "organisation_id"
-                )
-                if doc_org_id == self.organization_id:
-                    filtered_docs.append(doc)
-            return filtered_docs
-
-        return docs
+        """Retrieve documents scoped to organization_id."""
+        return self._search(query)
 
     async def _aget_relevant_documents(
         self, query: str, *, run_manager: Any = None
     ) -> List[Document]:
-        """Async retrieve documents and filter by organization_id."""
-        # Get documents from base retriever
-        docs = await self.base_retriever.aget_relevant_documents(
-            query, run_manager=run_manager
-        )
-
-        # Filter by organization_id if available
-        if self.organization_id:
-            filtered_docs = []
-            for doc in docs:
-                metadata = doc.metadata if hasattr(doc, "metadata") else {}
-                # Check if document belongs to the organization
-                doc_org_id = metadata.get("organization_id") or metadata.get(
-                    "organisation_id"
-                )
-                if doc_org_id == self.organization_id:
-                    filtered_docs.append(doc)
-            return filtered_docs
-
-        return docs
+        """Async retrieve documents scoped to organization_id."""
+        if isinstance(self.vector_store, PGVector) and not getattr(
+            self.vector_store, "async_mode", False
+        ):
+            # Sync engine: run embedding + query off the event loop
+            return await asyncio.to_thread(self._search, query)
+        if self.filtered and self.organization_id:
+            tenant_filter = build_tenant_filter(
+                self.vector_store,
+                self.organization_id,
+                self.user_id if self.restrict_to_user else None,
+            )
+            docs = await self.vector_store.asimilarity_search(
+                query, k=self.k, filter=tenant_filter
+            )
+        else:
+            docs = await self.vector_store.asimilarity_search(query, k=self.k * 2)
+        return self._scope(docs)
+
+
+RAG_COLLECTION_NAME = "documents"
+
+
+async def _retrieve(
+    query: str, k: int, organization_id: str, user_id: str
+) -> List[Document]:
+    # Shared store: built once per process, health-checked off the event loop
+    vector_store = await asyncio.to_thread(get_shared_vector_store, RAG_COLLECTION_NAME)
+
+    # Organization filter is pushed into the vector query
+    context_retriever = ContextAwareRetriever(
+        vector_store=vector_store,
+        k=k,
+        organization_id=organization_id,
+        user_id=user_id,
+    )
+
+    # Retrieve documents
+    return await context_retriever.ainvoke(query)
 
 
 @tool
@@ -106,23 +183,13 @@ async def rag_search(
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        # Setup vector store
-        vector_store = setup_vector_store(collection_name="documents")
-
-        # Create base retriever
-        base_retriever = vector_store.as_retriever(
-            search_kwargs={"k": k * 2}
-        )  # Get more to filter
-
-        # Wrap with context-aware retriever that filters by organization_id
-        context_retriever = ContextAwareRetriever(
-            base_retriever=base_retriever,
-            organization_id=organization_id,
-            user_id=user_id,
-        )
-
-        # Retrieve documents
-        docs = await context_retriever.aget_relevant_documents(query)
+        try:
+            docs = await _retrieve(query, k, organization_id, user_id)
+        except DBAPIError as e:
+            # Stale or dropped connection - rebuild the shared store and retry once
+            print(f"Warning: Vector store query failed, reconnecting: {e}")
+            await asyncio.to_thread(reset_vector_store, RAG_COLLECTION_NAME)
+            docs = await _retrieve(query, k, organization_id, user_id)
 
         # Limit to k results
         docs = docs[:k]
@@ -146,9 +213,7 @@ async def rag_search(
                 }
             )
 
-        import json
-
-        return json.dumps(results, indent=2)
+        return encode_tool_output(results, "rag_search")
 
     except Exception as e:
         return f"Error performing RAG search: {str(e)}"
@@ -168,12 +233,15 @@ def create_rag_search_tool(
         collection_name: Name of the vector store collection (default: "documents")
         k: Number of documents to retrieve (default: 5)
 
+    Building the shared store does network and database I/O; from async
+    code use `acreate_rag_search_tool` instead.
+
     Returns:
         RAG search tool, or None if vector store unavailable
     """
     try:
-        # Verify vector store is available
-        vector_store = setup_vector_store(collection_name)
+        # Verify vector store is available (builds the shared instance)
+        vector_store = get_shared_vector_store(collection_name)
         if not vector_store:
             return None
 
@@ -183,3 +251,20 @@ def create_rag_search_tool(
     except Exception as e:
         print(f"Warning: RAG search tool not available: {e}")
         return None
+
+
+async def acreate_rag_search_tool(
+    collection_name: str = "documents",
+    k: int = 5,
+) -> Optional[BaseTool]:
+    """
+    Async version of `create_rag_search_tool`; the store is built off the event loop.
+
+    Args:
+        collection_name: Name of the vector store collection (default: "documents")
+        k: Number of documents to retrieve (default: 5)
+
+    Returns:
+        RAG search tool, or None if vector store unavailable
+    """
+    return await asyncio.to_thread(create_rag_search_tool, collection_name, k)
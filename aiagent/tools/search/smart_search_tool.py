@@ -3,12 +3,172 @@ Smart Search Tool - Intelligent meeting search
 Replicates the n8n Smart Search workflow functionality
 """
 
-import json
-from typing import Any, Dict, Optional
+import asyncio
+import heapq
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.tools import tool
 
-from ..core.api_tools import _make_api_request, get_context_from_config
+from ..core.api_tools import get_context_from_config
+from ..meetings.meeting_pages import MEETINGS_TOOL_LIMIT, collect_meetings
+from ..utils.tool_output import encode_tool_output
+
+# Maximum meeting types queried at once when several are requested
+SEARCH_FANOUT_CONCURRENCY = int(os.getenv("KNOWTED_SEARCH_FANOUT_CONCURRENCY", "8"))
+
+# Fields the tool can return (lowercased request name -> meeting column)
+FIELD_MAP = {
+    "id": "id",
+    "title": "title",
+    "meeting_date": "meeting_date",
+    "summary": "summary",
+    "duration_mins": "duration_mins",
+    "host_email": "host_email",
+    "participants_email": "participants_email",
+}
+
+# Meeting list columns the sort column may name in a projection
+_LIST_COLUMNS = {*FIELD_MAP.values(), "created_at", "analysed", "video_processing_status"}
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _projection(
+    fields: Optional[str], specific_field: Optional[str], sort_by: Optional[str]
+) -> Optional[List[str]]:
+    """
+    Columns to request from the backend, or None to fetch full rows.
+
+    Only used when `fields` narrows the output: the ID, the requested
+    fields, the sort column (needed to merge pages, and only if it is a
+    known list column) and the requested summary_meta_data keys.
+    """
+    columns = [FIELD_MAP[f.lower()] for f in _split(fields) if f.lower() in FIELD_MAP]
+    if not columns:
+        return None
+    sort_column = _parse_sort(sort_by)[0]
+    select = ["id", *columns]
+    if sort_column in _LIST_COLUMNS:
+        select.append(sort_column)
+    select += [f"summary_meta_data.{key}" for key in _split(specific_field)]
+    return list(dict.fromkeys(select))
+
+
+def _parse_sort(sort_by: Optional[str]) -> Tuple[str, bool]:
+    """Parse "column [ASC|DESC]" into (column, descending); defaults to meeting_date DESC."""
+    parts = (sort_by or "").replace(",", " ").split()
+    if not parts:
+        return "meeting_date", True
+    descending = len(parts) < 2 or parts[1].upper() != "ASC"
+    return parts[0], descending
+
+
+def _sort_key(column: str, descending: bool) -> Callable[[Dict[str, Any]], Tuple[bool, Any]]:
+    """Key ordering meetings by `column`, with missing values last in either direction."""
+
+    def key(meeting: Dict[str, Any]) -> Tuple[bool, Any]:
+        value = meeting.get(column)
+        missing = value is None
+        # reverse=True flips the flag too, so invert it to keep missing values last
+        return (not missing if descending else missing, value)
+
+    return key
+
+
+def _merge_meetings(
+    streams: List[List[Dict[str, Any]]], sort_by: Optional[str], limit: int
+) -> List[Dict[str, Any]]:
+    """
+    K-way merge of per-meeting-type results on `sort_by`, deduplicated by ID.
+
+    The backend orders by meeting_date, so each stream is sorted locally
+    first; for other columns the result is the best of each type's page.
+
+    Args:
+        streams: Meeting lists, one per meeting type
+        sort_by: Requested ordering ("column [ASC|DESC]")
+        limit: Maximum meetings to return
+
+    Returns:
+        Up to `limit` meetings in the requested order
+    """
+    column, descending = _parse_sort(sort_by)
+    key = _sort_key(column, descending)
+    ordered = [sorted(stream, key=key, reverse=descending) for stream in streams]
+
+    merged: List[Dict[str, Any]] = []
+    seen = set()
+    for meeting in heapq.merge(*ordered, key=key, reverse=descending):
+        meeting_id = meeting.get("id")
+        if meeting_id is not None:
+            if meeting_id in seen:
+                continue
+            seen.add(meeting_id)
+        merged.append(meeting)
+        if len(merged) >= limit:
+            break
+    return merged
+
+
+async def _search_meeting_types(
+    params: Dict[str, Any],
+    meeting_type_ids: List[str],
+    limit: int,
+    sort_by: Optional[str],
+    select: Optional[List[str]],
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> Dict[str, Any]:
+    """
+    Query each meeting type concurrently and merge the pages.
+
+    Types that fail are reported under "errors"; if every type fails the
+    first error is raised.
+    """
+    semaphore = asyncio.Semaphore(max(1, SEARCH_FANOUT_CONCURRENCY))
+
+    async def search(meeting_type_id: str) -> Any:
+        async with semaphore:
+            return await collect_meetings(
+                {**params, "meeting_type_id": meeting_type_id},
+                organization_id,
+                user_id,
+                internal_service_secret,
+                limit=limit,
+                select=select,
+            )
+
+    results = await asyncio.gather(
+        *(search(mt) for mt in meeting_type_ids), return_exceptions=True
+    )
+
+    streams: List[List[Dict[str, Any]]] = []
+    errors: List[Dict[str, str]] = []
+    total = 0
+    for meeting_type_id, result in zip(meeting_type_ids, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors.append({"meeting_type_id": meeting_type_id, "error": str(result)})
+            continue
+        if isinstance(result, dict):
+            streams.append(result.get("data") or [])
+            total += result.get("total") or 0
+    if errors and not streams:
+        raise next(r for r in results if isinstance(r, Exception))
+
+    merged: Dict[str, Any] = {
+        "data": _merge_meetings(streams, sort_by, limit),
+        "total": total,
+        "meeting_type_ids": meeting_type_ids,
+    }
+    if errors:
+        merged["errors"] = errors
+    return merged
 
 
 @tool
@@ -23,6 +183,7 @@ async def smart_search_meetings(
     meeting_type_id: Optional[str] = None,
     contains_keyword: Optional[str] = None,
     specific_field: Optional[str] = None,
+    cursor: Optional[str] = None,
 ) -> str:
     """
     This tool allows you to return exactly what you want from the meeting database.
@@ -40,9 +201,10 @@ async def smart_search_meetings(
         filters: SQL condition (no WHERE/AND) - only use: id, title, meeting_date, duration_mins, host_email, participants_email, summary, transcript, created_at, updated_at. Strings single-quoted. Example: duration_mins >= 30
         start_date: Filter results from this start date (format YYYY-MM-DD). Used on meeting_date.
         end_date: Filter results up to this end date (format YYYY-MM-DD). Used on meeting_date.
-        meeting_type_id: Comma-separated meeting type IDs. Pick from accessible meeting types. If none apply, return empty string.
+        meeting_type_id: Comma-separated meeting type IDs. Pick from accessible meeting types. Several IDs are searched in one call and merged on sort_by. If none apply, return empty string.
         contains_keyword: Optionally if what the user wants is going to reference a keyword. Example 'what did sarah say' you'd be looking for keyword sarah in transcript. This is different to specific field.
         specific_field: Comma-separated list of summary_meta_data keys to SELECT (e.g., Objectives, Action Items). Return empty if not needed.
+        cursor: Cursor from a truncated previous result, to read the rest. Repeat the other arguments unchanged.
 
     Returns:
         JSON string with meeting results
@@ -54,10 +216,8 @@ async def smart_search_meetings(
 
     try:
         # Build query parameters for the backend API
-        params: Dict[str, Any] = {
-            "organization_id": organization_id,
-            "limit": min(limit or 10, 100),
-        }
+        params: Dict[str, Any] = {"organization_id": organization_id}
+        limit = min(limit or 10, MEETINGS_TOOL_LIMIT)
 
         # Add date filters
         if start_date:
@@ -65,43 +225,50 @@ async def smart_search_meetings(
         if end_date:
             params["to_date"] = end_date
 
-        # Add meeting type filter
-        if meeting_type_id:
-            # Handle comma-separated IDs
-            meeting_type_ids = [
-                mt.strip() for mt in meeting_type_id.split(",") if mt.strip()
-            ]
-            if meeting_type_ids:
-                # Backend API might accept comma-separated or we need to handle multiple calls
-                # For now, use the first one (backend might need enhancement for multiple)
-                params["meeting_type_id"] = (
-                    meeting_type_ids[0]
-                    if len(meeting_type_ids) == 1
-                    else meeting_type_id
-                )
-
         # Add keyword search (use search parameter for transcript/keyword search)
         if contains_keyword:
             params["search"] = contains_keyword
 
-        # Build query string
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        # Only download the columns the answer needs
+        select = _projection(fields, specific_field, sort_by)
 
-        # Call the backend API
-        result = await _make_api_request(
-            f"api/v1/meetings?{query_string}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
-        )
+        meeting_type_ids = list(dict.fromkeys(_split(meeting_type_id)))
+        if len(meeting_type_ids) > 1:
+            # The backend filters on one meeting type per request: fan out and merge
+            result = await _search_meeting_types(
+                params,
+                meeting_type_ids,
+                limit,
+                sort_by,
+                select,
+                organization_id,
+                user_id,
+                internal_service_secret,
+            )
+        else:
+            if meeting_type_ids:
+                params["meeting_type_id"] = meeting_type_ids[0]
 
-        # If specific_field is requested, we need to extract those fields from summary_meta_data
-        # This might require backend support or post-processing
+            # Follows pagination past the backend's 100 rows per request
+            result = await collect_meetings(
+                params,
+                organization_id,
+                user_id,
+                internal_service_secret,
+                limit=limit,
+                select=select,
+            )
+            # The backend always orders by meeting_date DESC; apply sort_by to the rows
+            if sort_by and isinstance(result, dict) and isinstance(result.get("data"), list):
+                data = _merge_meetings([result["data"]], sort_by, limit)
+                result = {**result, "data": data}
+
+        # Trim rows to the requested fields. Projection usually did this already,
+        # but backends without select= support return full rows
         if specific_field and isinstance(result, dict) and "data" in result:
-            specific_fields = [
-                f.strip() for f in specific_field.split(",") if f.strip()
-            ]
+            specific_fields = _split(specific_field)
+            # Results can be shared with other callers: copy rather than mutate
+            data = []
             for meeting in result.get("data", []):
                 if "summary_meta_data" in meeting and isinstance(
                     meeting["summary_meta_data"], dict
@@ -112,34 +279,28 @@ async def smart_search_meetings(
                         if field in meeting["summary_meta_data"]:
                             extracted[field] = meeting["summary_meta_data"][field]
                     if extracted:
-                        meeting["extracted_fields"] = extracted
+                        meeting = {**meeting, "extracted_fields": extracted}
+                data.append(meeting)
+            result = {**result, "data": data}
 
         # Filter fields if requested
         if fields and isinstance(result, dict) and "data" in result:
-            field_list = [f.strip().lower() for f in fields.split(",") if f.strip()]
+            field_list = [f.lower() for f in _split(fields)]
             if field_list:
                 filtered_data = []
                 for meeting in result.get("data", []):
                     filtered_meeting = {}
                     for field in field_list:
-                        # Map common field names
-                        field_map = {
-                            "id": "id",
-                            "title": "title",
-                            "meeting_date": "meeting_date",
-                            "summary": "summary",
-                            "duration_mins": "duration_mins",
-                            "host_email": "host_email",
-                            "participants_email": "participants_email",
-                        }
-                        if field in field_map and field_map[field] in meeting:
-                            filtered_meeting[field_map[field]] = meeting[
-                                field_map[field]
-                            ]
+                        if field in FIELD_MAP and FIELD_MAP[field] in meeting:
+                            filtered_meeting[FIELD_MAP[field]] = meeting[FIELD_MAP[field]]
+                    if filtered_meeting and "extracted_fields" in meeting:
+                        filtered_meeting["extracted_fields"] = meeting["extracted_fields"]
                     if filtered_meeting:
                         filtered_data.append(filtered_meeting)
-                result["data"] = filtered_data
+                result = {**result, "data": filtered_data}
 
-        return json.dumps(result, indent=2, default=str)
+        return encode_tool_output(
+            result, "smart_search_meetings", cursor=cursor, resumable=True
+        )
     except Exception as e:
         return f"Error in smart search: {str(e)}"
@@ -4,55 +4,86 @@ Knowted Team Tools
 Tools for team management and insights.
 """
 
+import asyncio
+import os
 from typing import Optional
 
 from langchain_core.tools import tool
 
 from ..core.api_tools import _make_api_request, get_context_from_config
+from ..meetings.meeting_pages import MEETINGS_TOOL_LIMIT, collect_meetings
+from ..utils.meeting_stats import meeting_insights
+from ..utils.member_directory import get_member_directory, get_team_names
+from ..utils.tool_output import encode_tool_output
+
+# Most recent meetings summarized by get_team_insights
+TEAM_INSIGHTS_MEETINGS = int(os.getenv("KNOWTED_TEAM_INSIGHTS_MEETINGS", "100"))
+
+# Columns the statistics read (list rows carry the type as `meetingType`)
+_INSIGHT_COLUMNS = ["id", "meeting_date", "duration_mins", "host_email", "meetingType"]
 
 
 @tool
 async def get_team_insights(team_id: str) -> str:
     """
     Get insights and analytics for a team.
-    
+
+    Returns the team record plus statistics over its most recent meetings:
+    meetings per week, duration mean/p50/p90, host distribution and
+    meeting-type mix. Use get_team_meetings to list the meetings themselves.
+    If the meetings could not be fetched, meeting_insights_error says why.
+
     The tool automatically uses your organization and user context for access control.
 
     Args:
         team_id: The team ID
 
     Returns:
-        Team insights and analytics as JSON string
+        Team details and meeting statistics as JSON string
     """
     organization_id, user_id, internal_service_secret = get_context_from_config()
     if not organization_id or not user_id or not internal_service_secret:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
+        team_request = _make_api_request(
             f"api/v1/teams/{team_id}",
             method="GET",
             organization_id=organization_id,
             user_id=user_id,
             internal_service_secret=internal_service_secret,
         )
-
-        # Get team meetings for additional insights
-        try:
-            meetings_result = await _make_api_request(
-                f"api/v1/meetings?organization_id={organization_id}&team_id={team_id}&limit=50",
-                method="GET",
-                organization_id=organization_id,
-                user_id=user_id,
-                internal_service_secret=internal_service_secret,
-            )
-            result["recent_meetings"] = meetings_result.get("data", [])
-        except Exception:
-            pass
-
-        import json
-
-        return json.dumps(result, indent=2)
+        meetings_request = collect_meetings(
+            {"organization_id": organization_id, "team_id": team_id},
+            organization_id,
+            user_id,
+            internal_service_secret,
+            limit=TEAM_INSIGHTS_MEETINGS,
+            select=_INSIGHT_COLUMNS,
+        )
+        # Meetings are optional: a failure there still returns the team
+        result, meetings_result = await asyncio.gather(
+            team_request, meetings_request, return_exceptions=True
+        )
+        for outcome in (result, meetings_result):
+            # Cancellation (e.g. the run deadline) ends the tool call
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+        if isinstance(result, Exception):
+            raise result
+
+        if isinstance(meetings_result, Exception):
+            # Tell the model the statistics are missing, not that there are no meetings
+            result = {
+                **result,
+                "meeting_insights_error": f"Could not fetch team meetings: {meetings_result}",
+            }
+        elif isinstance(meetings_result, dict) and isinstance(meetings_result.get("data"), list):
+            insights = meeting_insights(meetings_result["data"])
+            insights["total_team_meetings"] = meetings_result.get("total")
+            result = {**result, "meeting_insights": insights}
+
+        return encode_tool_output(result, "get_team_insights")
     except Exception as e:
         return f"Error fetching team insights: {str(e)}"
 
@@ -65,7 +96,7 @@ async def get_team_members(team_id: str) -> str:
     The tool automatically uses your organization and user context for access control.
 
     Args:
-        team_id: The team ID
+        team_id: The team ID (a team name also works)
 
     Returns:
         Team members list as JSON string
@@ -75,20 +106,24 @@ async def get_team_members(team_id: str) -> str:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        # Get organization members and filter by team
-        result = await _make_api_request(
-            f"api/v1/organizations/{organization_id}/members",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        # Served from the organization's member directory, indexed by team.
+        # Team IDs are mapped to names through the user's own teams list.
+        directory, team_names = await asyncio.gather(
+            get_member_directory(organization_id, user_id, internal_service_secret),
+            get_team_names(organization_id, user_id, internal_service_secret),
         )
-        # Filter members by team
-        members = result if isinstance(result, list) else []
-        team_members = [m for m in members if m.get("team") == team_id or m.get("team_id") == team_id]
-        
-        import json
-        return json.dumps(team_members, indent=2)
+        team_members = directory.team_members(team_id, team_names)
+        if not team_members and team_id not in team_names and not directory.has_team(team_id):
+            # Neither a known team ID nor the name of a team with members
+            if not team_names:
+                return (
+                    f"Error: Could not resolve team '{team_id}'. Team IDs cannot be looked up "
+                    "without permission to read teams; pass the team name instead "
+                    "(members' team names are listed by get_organization_members)"
+                )
+            return f"Error: No team with ID or name '{team_id}' in this organization"
+
+        return encode_tool_output(team_members, "get_team_members")
     except Exception as e:
         return f"Error fetching team members: {str(e)}"
 
@@ -112,15 +147,13 @@ async def get_team_meetings(team_id: str, limit: int = 20) -> str:
         return "Error: organization_id, user_id, and internal_service_secret are required but not found in execution context"
 
     try:
-        result = await _make_api_request(
-            f"api/v1/meetings?organization_id={organization_id}&team_id={team_id}&limit={limit}",
-            method="GET",
-            organization_id=organization_id,
-            user_id=user_id,
-            internal_service_secret=internal_service_secret,
+        result = await collect_meetings(
+            {"organization_id": organization_id, "team_id": team_id},
+            organization_id,
+            user_id,
+            internal_service_secret,
+            limit=min(limit or 20, MEETINGS_TOOL_LIMIT),
         )
-        import json
-
-        return json.dumps(result, indent=2)
+        return encode_tool_output(result, "get_team_meetings")
     except Exception as e:
         return f"Error fetching team meetings: {str(e)}"
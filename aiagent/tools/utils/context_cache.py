@@ -0,0 +1,49 @@
+"""
+Per-user Context Cache
+
+Caches the user context snapshot (profile, organization name, team name,
+meeting types) per (organization_id, user_id). These change rarely, so new
+threads and repeated tool calls are served from memory and refreshed in
+the background once stale. Meeting types themselves live in the
+per-user `meeting_type_registry`.
+"""
+
+import os
+from typing import Optional
+
+from .meeting_type_registry import invalidate_meeting_type_registry
+from .ttl_cache import AsyncTTLCache
+
+CONTEXT_CACHE_TTL = float(os.getenv("KNOWTED_CONTEXT_CACHE_TTL", "300"))
+CONTEXT_CACHE_STALE_TTL = float(os.getenv("KNOWTED_CONTEXT_CACHE_STALE_TTL", "600"))
+CONTEXT_CACHE_MAXSIZE = int(os.getenv("KNOWTED_CONTEXT_CACHE_MAXSIZE", "2048"))
+
+# Keyed by (organization_id, user_id)
+user_context_cache = AsyncTTLCache(
+    "user_context",
+    maxsize=CONTEXT_CACHE_MAXSIZE,
+    ttl=CONTEXT_CACHE_TTL,
+    stale_ttl=CONTEXT_CACHE_STALE_TTL,
+)
+
+
+def invalidate_user_context(organization_id: str, user_id: Optional[str] = None) -> int:
+    """
+    Drop cached context for one user, or for every user of an organization.
+
+    Call this after writes that change profile, team or meeting-type access.
+
+    Args:
+        organization_id: Organization ID
+        user_id: User ID (omit to invalidate the whole organization)
+
+    Returns:
+        Number of entries dropped
+    """
+
+    def matches(key) -> bool:
+        org, user = key
+        return org == organization_id and (user_id is None or user == user_id)
+
+    invalidate_meeting_type_registry(organization_id, user_id)
+    return user_context_cache.invalidate_where(matches)
@@ -0,0 +1,122 @@
+"""
+Meeting Statistics
+
+Aggregates over a list of meeting rows, computed with numpy so a tool can
+hand the model a compact numeric summary (meetings per week, duration
+percentiles, host and meeting-type mix) instead of the raw rows.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# 1970-01-01 was a Thursday: (days + 3) % 7 is the weekday with Monday = 0
+_EPOCH_WEEKDAY_OFFSET = 3
+
+
+def meeting_type_name(meeting: Dict[str, Any]) -> Optional[str]:
+    """Meeting type of a row (`meetingType` in list rows, `meeting_type` elsewhere)."""
+    meeting_type = meeting.get("meetingType") or meeting.get("meeting_type")
+    if isinstance(meeting_type, dict):
+        return meeting_type.get("name") or meeting_type.get("id")
+    return meeting_type or None
+
+
+def week_starts(days: np.ndarray) -> np.ndarray:
+    """Monday of each day's ISO week, as days since the epoch."""
+    ordinals = days.astype("datetime64[D]").astype(np.int64)
+    return ordinals - (ordinals + _EPOCH_WEEKDAY_OFFSET) % 7
+
+
+def parse_day(value: Any) -> Optional[np.datetime64]:
+    try:
+        return np.datetime64(str(value)[:10], "D")
+    except ValueError:
+        return None
+
+
+def parse_duration(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _round(value: Any, digits: int = 1) -> float:
+    return round(float(value), digits)
+
+
+def _distribution(values: List[Optional[str]], top: int) -> Dict[str, Any]:
+    """Top `top` values by count with their share; the rest are summed."""
+    present = [str(value) for value in values if value]
+    if not present:
+        return {"top": []}
+    labels, counts = np.unique(present, return_counts=True)
+    # Stable sort so ties keep alphabetical order
+    order = np.argsort(-counts, kind="stable")
+    shares = counts / counts.sum()
+    result: Dict[str, Any] = {
+        "distinct": int(labels.size),
+        "top": [
+            {"name": str(labels[i]), "meetings": int(counts[i]), "share": round(float(shares[i]), 3)}
+            for i in order[:top]
+        ],
+    }
+    if labels.size > top:
+        result["other_meetings"] = int(counts[order[top:]].sum())
+    return result
+
+
+def meeting_insights(meetings: List[Dict[str, Any]], top: int = 5) -> Dict[str, Any]:
+    """
+    Summary statistics for a list of meetings.
+
+    Weeks are ISO weeks (starting Monday), keyed by their Monday; weeks
+    without meetings inside the covered range are reported as zero.
+
+    Args:
+        meetings: Meeting rows from `api/v1/meetings` (meeting_date,
+            duration_mins, host_email and meetingType are read)
+        top: Hosts and meeting types to list before grouping the rest
+
+    Returns:
+        Counts, date range, meetings per week, duration statistics, host
+        distribution and meeting-type mix
+    """
+    days = [parse_day(m.get("meeting_date")) for m in meetings]
+    dated = np.array([d for d in days if d is not None], dtype="datetime64[D]")
+    durations = np.array([parse_duration(m.get("duration_mins")) for m in meetings], dtype=float)
+    timed = durations[~np.isnan(durations)]
+
+    summary: Dict[str, Any] = {"meetings": len(meetings)}
+
+    if dated.size:
+        weeks = week_starts(dated)
+        first_week = int(weeks.min())
+        counts = np.bincount((weeks - first_week) // 7)
+        summary["from"] = str(dated.min())
+        summary["to"] = str(dated.max())
+        summary["meetings_per_week"] = {
+            "mean": round(float(counts.mean()), 2),
+            "max": int(counts.max()),
+            "by_week": {
+                str(np.datetime64(first_week + 7 * i, "D")): int(count)
+                for i, count in enumerate(counts)
+            },
+        }
+
+    if timed.size:
+        p50, p90 = np.percentile(timed, [50, 90])
+        summary["duration_mins"] = {
+            "mean": _round(timed.mean()),
+            "p50": _round(p50),
+            "p90": _round(p90),
+            "min": _round(timed.min()),
+            "max": _round(timed.max()),
+            "total": _round(timed.sum()),
+            "meetings_with_duration": int(timed.size),
+        }
+
+    summary["hosts"] = _distribution([m.get("host_email") for m in meetings], top)
+    summary["meeting_types"] = _distribution([meeting_type_name(m) for m in meetings], top)
+    return summary
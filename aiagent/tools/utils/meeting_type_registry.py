@@ -0,0 +1,124 @@
+"""
+Meeting-type Registry
+
+The backend has no per-ID meeting-type endpoint, so every lookup used to
+download the organization's full list and scan it. The registry loads the
+list once per user of an organization (with TTL and stale-while-revalidate)
+and keeps it indexed by ID together with the system-prompt fragment
+describing it, so lookups and prompt building are in-memory.
+
+The list endpoint needs the caller's `meeting_types:read` permission, so a
+registry is never shared between users.
+"""
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.api_tools import _make_api_request
+from .ttl_cache import AsyncTTLCache
+
+MEETING_TYPE_REGISTRY_TTL = float(os.getenv("KNOWTED_MEETING_TYPE_REGISTRY_TTL", "300"))
+MEETING_TYPE_REGISTRY_STALE_TTL = float(
+    os.getenv("KNOWTED_MEETING_TYPE_REGISTRY_STALE_TTL", "600")
+)
+MEETING_TYPE_REGISTRY_MAXSIZE = int(os.getenv("KNOWTED_MEETING_TYPE_REGISTRY_MAXSIZE", "1024"))
+
+# Keyed by (organization_id, user_id): the meeting-types list is permission-gated
+meeting_type_registry_cache = AsyncTTLCache(
+    "meeting_type_registry",
+    maxsize=MEETING_TYPE_REGISTRY_MAXSIZE,
+    ttl=MEETING_TYPE_REGISTRY_TTL,
+    stale_ttl=MEETING_TYPE_REGISTRY_STALE_TTL,
+)
+
+
+@lru_cache(maxsize=256)
+def _prompt_fragment(entries: Tuple[Tuple[Any, Any, Any], ...]) -> str:
+    return "\n\n".join(
+        f"Name: {name}\nID: {meeting_type_id}\nDescription: {description}"
+        for name, meeting_type_id, description in entries
+    )
+
+
+def meeting_types_prompt(meeting_types: Optional[List[Dict[str, Any]]]) -> str:
+    """System-prompt text listing meeting types (memoized by content)."""
+    if not meeting_types:
+        return "No meeting types available"
+    return _prompt_fragment(
+        tuple(
+            (mt.get("name", "Unknown"), mt.get("id", ""), mt.get("description", ""))
+            for mt in meeting_types
+        )
+    )
+
+
+@dataclass(frozen=True)
+class MeetingTypeRegistry:
+    """An organization's meeting types, indexed by ID."""
+
+    organization_id: str
+    meeting_types: List[Dict[str, Any]] = field(default_factory=list)
+    by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    prompt_fragment: str = "No meeting types available"
+
+    @classmethod
+    def from_result(cls, organization_id: str, result: Any) -> "MeetingTypeRegistry":
+        """Build from a `meeting-types` response (a list, or a dict wrapping one)."""
+        if isinstance(result, dict):
+            result = result.get("data", result.get("meeting_types"))
+        meeting_types = [mt for mt in result or [] if isinstance(mt, dict)]
+        return cls(
+            organization_id=organization_id,
+            meeting_types=meeting_types,
+            by_id={mt["id"]: mt for mt in meeting_types if mt.get("id")},
+            prompt_fragment=meeting_types_prompt(meeting_types),
+        )
+
+    def get(self, meeting_type_id: str) -> Optional[Dict[str, Any]]:
+        return self.by_id.get(meeting_type_id)
+
+
+async def get_meeting_type_registry(
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> MeetingTypeRegistry:
+    """
+    The user's meeting-type registry for an organization, loaded or refreshed as needed.
+
+    Args:
+        organization_id: Organization ID
+        user_id: User ID (identity for the backend request)
+        internal_service_secret: Service secret for authentication
+
+    Returns:
+        Shared registry; treat its meeting-type dicts as read-only
+    """
+
+    async def load() -> MeetingTypeRegistry:
+        result = await _make_api_request(
+            f"api/v1/meeting-types?organization_id={organization_id}",
+            method="GET",
+            organization_id=organization_id,
+            user_id=user_id,
+            internal_service_secret=internal_service_secret,
+        )
+        if isinstance(result, dict) and result.get("statusCode"):
+            raise ValueError(result.get("message") or "Meeting types request failed")
+        return MeetingTypeRegistry.from_result(organization_id, result)
+
+    return await meeting_type_registry_cache.get_or_load(
+        (organization_id, user_id), load, cache_if=lambda registry: bool(registry.meeting_types)
+    )
+
+
+def invalidate_meeting_type_registry(organization_id: str, user_id: Optional[str] = None) -> int:
+    """Drop one user's registry, or every registry of an organization after its meeting types change."""
+
+    def matches(key) -> bool:
+        org, user = key
+        return org == organization_id and (user_id is None or user == user_id)
+
+    return meeting_type_registry_cache.invalidate_where(matches)
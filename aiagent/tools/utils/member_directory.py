@@ -0,0 +1,251 @@
+"""
+Per-organization Member Directory
+
+The members endpoint returns the whole organization, and several tools
+need only one slice of it: a team's members, one user's team, a member by
+email. The directory loads the member list once per organization and
+indexes it by user ID, email and team name (member rows carry the name of
+the member's team).
+
+The teams list maps team IDs to names, but it needs the caller's
+`teams:read` permission, so it is not part of the shared directory. It is
+cached per user by `get_team_names`, and callers that accept a team ID pass
+it in; without it, teams are looked up by name only.
+
+Refreshes are incremental. Requests are revalidated through the response
+cache (a 304 returns the same payload object), an unchanged payload skips
+re-indexing, and a changed one only re-indexes the members that were
+added, removed or edited. Stale directories keep being served while the
+refresh runs in the background.
+"""
+
+import os
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Set
+
+from ..core.api_tools import _make_api_request
+from .ttl_cache import AsyncTTLCache
+
+MEMBER_DIRECTORY_TTL = float(os.getenv("KNOWTED_MEMBER_DIRECTORY_TTL", "300"))
+MEMBER_DIRECTORY_STALE_TTL = float(os.getenv("KNOWTED_MEMBER_DIRECTORY_STALE_TTL", "900"))
+MEMBER_DIRECTORY_MAXSIZE = int(os.getenv("KNOWTED_MEMBER_DIRECTORY_MAXSIZE", "256"))
+
+# Keyed by organization_id: every member of an organization sees the same list
+member_directory_cache = AsyncTTLCache(
+    "member_directory",
+    maxsize=MEMBER_DIRECTORY_MAXSIZE,
+    ttl=MEMBER_DIRECTORY_TTL,
+    stale_ttl=MEMBER_DIRECTORY_STALE_TTL,
+)
+
+# Keyed by (organization_id, user_id): the teams list is permission-gated
+team_names_cache = AsyncTTLCache(
+    "team_names",
+    maxsize=MEMBER_DIRECTORY_MAXSIZE,
+    ttl=MEMBER_DIRECTORY_TTL,
+    stale_ttl=MEMBER_DIRECTORY_STALE_TTL,
+)
+
+
+def _as_list(result: Any) -> List[Dict[str, Any]]:
+    if isinstance(result, dict):
+        result = result.get("data")
+    return [item for item in result if isinstance(item, dict)] if isinstance(result, list) else []
+
+
+def _member_id(member: Dict[str, Any]) -> Optional[str]:
+    return member.get("user_id") or member.get("id")
+
+
+def _team_name(member: Dict[str, Any]) -> Optional[str]:
+    """Team name of a member row (rows carry the name or a team object)."""
+    team = member.get("team")
+    if isinstance(team, dict):
+        team = team.get("name")
+    return team if isinstance(team, str) and team else None
+
+
+def _team_keys(member: Dict[str, Any]) -> Set[str]:
+    """Index keys of a member's team: lowercased name, and ID when the row has one."""
+    keys = {name.lower() for name in (_team_name(member),) if name}
+    team = member.get("team")
+    team_id = team.get("id") if isinstance(team, dict) else member.get("team_id")
+    if team_id:
+        keys.add(str(team_id).lower())
+    return keys
+
+
+class MemberDirectory:
+    """Members of one organization indexed by user ID, email and team name."""
+
+    def __init__(self, organization_id: str):
+        self.organization_id = organization_id
+        self.members: Dict[str, Dict[str, Any]] = {}
+        self.by_email: Dict[str, str] = {}
+        # Lowercased team name (or ID, when rows carry one) -> user IDs
+        self.by_team: Dict[str, Set[str]] = {}
+        # Raw payload of the last update, to skip re-indexing unchanged data
+        self._source: Any = None
+        self._lock = threading.Lock()
+
+    def _unindex(self, user_id: str, member: Dict[str, Any]) -> None:
+        email = (member.get("email") or "").lower()
+        if self.by_email.get(email) == user_id:
+            del self.by_email[email]
+        for team in _team_keys(member):
+            if team in self.by_team:
+                self.by_team[team].discard(user_id)
+                if not self.by_team[team]:
+                    del self.by_team[team]
+
+    def _index(self, user_id: str, member: Dict[str, Any]) -> None:
+        if member.get("email"):
+            self.by_email[member["email"].lower()] = user_id
+        for team in _team_keys(member):
+            self.by_team.setdefault(team, set()).add(user_id)
+
+    def update(self, members_result: Any) -> Dict[str, int]:
+        """
+        Apply a fresh member list, re-indexing only what changed.
+
+        Returns:
+            Counts of added, removed and changed members
+        """
+        if self._source is members_result:
+            return {"added": 0, "removed": 0, "changed": 0}
+        members = {_member_id(m): m for m in _as_list(members_result) if _member_id(m)}
+
+        with self._lock:
+            previous = self.members
+            added = members.keys() - previous.keys()
+            removed = previous.keys() - members.keys()
+            changed = {u for u in members.keys() & previous.keys() if members[u] != previous[u]}
+            for user_id in removed | changed:
+                self._unindex(user_id, previous[user_id])
+            for user_id in added | changed:
+                self._index(user_id, members[user_id])
+            self.members = members
+            self._source = members_result
+        return {"added": len(added), "removed": len(removed), "changed": len(changed)}
+
+    def member(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.members.get(user_id)
+
+    def member_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            user_id = self.by_email.get(email.lower())
+            return self.members.get(user_id) if user_id else None
+
+    def has_team(self, team: str) -> bool:
+        """Whether any member belongs to the team (by name, or ID when rows carry one)."""
+        with self._lock:
+            return bool(self.by_team.get(team.lower()))
+
+    def team_members(
+        self, team: str, team_names: Optional[Dict[str, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Members of a team.
+
+        Args:
+            team: Team name, or team ID when `team_names` maps it
+            team_names: Team ID -> name, from `get_team_names`
+        """
+        name = (team_names or {}).get(team, team)
+        with self._lock:
+            user_ids = self.by_team.get(name.lower(), ())
+            return [self.members[user_id] for user_id in user_ids if user_id in self.members]
+
+    def team_of(
+        self, user_id: str, team_names: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """{"name"} of a member's team, plus "id" when `team_names` maps it; or None."""
+        member = self.members.get(user_id)
+        name = _team_name(member) if member else None
+        if not name:
+            return None
+        team: Dict[str, Any] = {"name": name}
+        for team_id, team_name in (team_names or {}).items():
+            if team_name.lower() == name.lower():
+                team["id"] = team_id
+                break
+        return team
+
+    def all_members(self) -> List[Dict[str, Any]]:
+        return list(self.members.values())
+
+
+async def get_member_directory(
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> MemberDirectory:
+    """
+    The organization's member directory, loaded or refreshed as needed.
+
+    Args:
+        organization_id: Organization ID
+        user_id: User ID (identity for the backend requests)
+        internal_service_secret: Service secret for authentication
+
+    Returns:
+        Shared directory; treat its member dicts as read-only
+    """
+    key: Hashable = organization_id
+
+    async def load() -> MemberDirectory:
+        members_result = await _make_api_request(
+            f"api/v1/organizations/{organization_id}/members",
+            method="GET",
+            organization_id=organization_id,
+            user_id=user_id,
+            internal_service_secret=internal_service_secret,
+        )
+        # Refresh the cached directory in place so unchanged members are kept
+        directory = member_directory_cache.get(key) or MemberDirectory(organization_id)
+        directory.update(members_result)
+        return directory
+
+    return await member_directory_cache.get_or_load(key, load)
+
+
+async def get_team_names(
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: str,
+) -> Dict[str, str]:
+    """
+    Team ID -> name for the teams the user can read.
+
+    Returns an empty mapping (not cached) when the teams list cannot be
+    fetched, e.g. for users without the `teams:read` permission.
+
+    Args:
+        organization_id: Organization ID
+        user_id: User ID (identity for the backend request)
+        internal_service_secret: Service secret for authentication
+    """
+
+    async def load() -> Dict[str, str]:
+        try:
+            result = await _make_api_request(
+                f"api/v1/teams?organization_id={organization_id}",
+                method="GET",
+                organization_id=organization_id,
+                user_id=user_id,
+                internal_service_secret=internal_service_secret,
+            )
+        except Exception as e:
+            print(f"Warning: Could not fetch teams, matching teams by name only: {e}")
+            return {}
+        return {t["id"]: t.get("name") or t["id"] for t in _as_list(result) if t.get("id")}
+
+    return await team_names_cache.get_or_load(
+        (organization_id, user_id), load, cache_if=bool
+    )
+
+
+def invalidate_member_directory(organization_id: str) -> bool:
+    """Drop an organization's directory and team names after membership or team changes."""
+    team_names_cache.invalidate_where(lambda key: key[0] == organization_id)
+    return member_directory_cache.invalidate(organization_id)
@@ -0,0 +1,250 @@
+"""
+Compact Tool Output Encoding
+
+Tool results are read by the model, so they are encoded for tokens rather
+than for people: JSON without indentation, keys with null or empty values
+dropped, and lists of similar records (meetings, members) written once as
+column names plus rows. Output over the tool's token budget is cut at its
+largest list or text with an explicit `_truncated` marker; tools that take
+a `cursor` argument continue from where the output stopped.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+# Default token budget per tool result (0 disables truncation)
+KNOWTED_TOOL_OUTPUT_BUDGET = int(os.getenv("KNOWTED_TOOL_OUTPUT_BUDGET", "8000"))
+# Encode lists of records as {"columns": [...], "rows": [[...]]}
+KNOWTED_TOOL_OUTPUT_TABULAR = os.getenv("KNOWTED_TOOL_OUTPUT_TABULAR", "true").lower() == "true"
+
+
+def _parse_budgets(value: str) -> Dict[str, int]:
+    """Parse "tool=tokens,tool=tokens"."""
+    budgets = {}
+    for item in value.split(","):
+        name, sep, tokens = item.strip().partition("=")
+        if sep and name:
+            budgets[name.strip()] = int(tokens)
+    return budgets
+
+
+# Per-tool overrides, e.g. "get_meeting_transcript=12000,list_meetings=4000"
+KNOWTED_TOOL_OUTPUT_BUDGETS = _parse_budgets(os.getenv("KNOWTED_TOOL_OUTPUT_BUDGETS", ""))
+
+# Rough size of a token in characters of JSON/English text
+CHARS_PER_TOKEN = 4
+# Lists shorter than this stay as objects; the header would not pay off
+_TABLE_MIN_ROWS = 3
+# Minimum share of filled cells for a list to be tabulated
+_TABLE_MIN_DENSITY = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def output_budget(tool_name: Optional[str]) -> int:
+    """Token budget of a tool's result (0 means unlimited)."""
+    return KNOWTED_TOOL_OUTPUT_BUDGETS.get(tool_name or "", KNOWTED_TOOL_OUTPUT_BUDGET)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def compact(value: Any) -> Any:
+    """Drop dict keys whose values are null or empty, recursively."""
+    if isinstance(value, dict):
+        compacted = {key: compact(item) for key, item in value.items()}
+        return {key: item for key, item in compacted.items() if not _is_empty(item)}
+    if isinstance(value, list):
+        return [compact(item) for item in value]
+    return value
+
+
+def tabulate(value: Any) -> Any:
+    """Rewrite lists of similar dicts as {"columns": [...], "rows": [[...]]}."""
+    if isinstance(value, dict):
+        return {key: tabulate(item) for key, item in value.items()}
+    if not isinstance(value, list):
+        return value
+    items = [tabulate(item) for item in value]
+    if len(items) < _TABLE_MIN_ROWS or not all(isinstance(item, dict) for item in items):
+        return items
+    columns: Dict[str, None] = {}
+    for item in items:
+        columns.update(dict.fromkeys(item))
+    filled = sum(len(item) for item in items)
+    if not columns or filled < _TABLE_MIN_DENSITY * len(columns) * len(items):
+        return items
+    return {
+        "columns": list(columns),
+        "rows": [[item.get(column) for column in columns] for item in items],
+    }
+
+
+def dumps_compact(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _split_path(path: str) -> List[str]:
+    return path.split(".") if path else []
+
+
+def _get_path(value: Any, path: List[str]) -> Any:
+    for key in path:
+        value = value[key]
+    return value
+
+
+def _set_path(value: Any, path: List[str], node: Any) -> Any:
+    """Copy of `value` with the node at `path` replaced (dicts are copied, not mutated)."""
+    if not path:
+        return node
+    return {**value, path[0]: _set_path(value[path[0]], path[1:], node)}
+
+
+def _apply_cursor(value: Any, cursor: str) -> Tuple[Any, str, int]:
+    """Skip the items/characters before the cursor ("path:offset")."""
+    path, sep, offset = cursor.rpartition(":")
+    try:
+        if not sep or int(offset) < 0:
+            raise ValueError
+        node = _get_path(value, _split_path(path))
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Invalid cursor {cursor!r}; use the cursor from a truncated result")
+    if not isinstance(node, (list, str)):
+        raise ValueError(f"Invalid cursor {cursor!r}; use the cursor from a truncated result")
+    return _set_path(value, _split_path(path), node[int(offset):]), path, int(offset)
+
+
+def _candidates(value: Any, path: Tuple[str, ...] = ()) -> List[Tuple[int, str]]:
+    """(size, path) of the lists and strings reachable through dict keys."""
+    if isinstance(value, dict):
+        found: List[Tuple[int, str]] = []
+        for key, item in value.items():
+            found.extend(_candidates(item, path + (str(key),)))
+        return found
+    if isinstance(value, list):
+        return [(len(dumps_compact(value)), ".".join(path))]
+    if isinstance(value, str):
+        return [(len(value), ".".join(path))]
+    return []
+
+
+def _render(value: Any, truncated: List[Dict[str, Any]], tabular: bool) -> str:
+    if isinstance(value, str):
+        if not truncated:
+            return value
+        return f"{value}\n[truncated: {dumps_compact(truncated)}]"
+    if tabular:
+        value = tabulate(value)
+    if truncated:
+        if not isinstance(value, dict):
+            value = {"items": value}
+        value = {**value, "_truncated": truncated}
+    return dumps_compact(value)
+
+
+def fits_budget(
+    value: Any,
+    tool_name: Optional[str] = None,
+    budget: Optional[int] = None,
+    tabular: bool = KNOWTED_TOOL_OUTPUT_TABULAR,
+) -> bool:
+    """Whether `value` encodes within the tool's token budget without truncation."""
+    budget = output_budget(tool_name) if budget is None else budget
+    if budget <= 0:
+        return True
+    if not isinstance(value, str):
+        value = compact(value)
+    return estimate_tokens(_render(value, [], tabular)) <= budget
+
+
+def encode_tool_output(
+    value: Any,
+    tool_name: Optional[str] = None,
+    cursor: Optional[str] = None,
+    resumable: bool = False,
+    budget: Optional[int] = None,
+    tabular: bool = KNOWTED_TOOL_OUTPUT_TABULAR,
+) -> str:
+    """
+    Encode a tool result compactly, within the tool's token budget.
+
+    When the result is over budget, its largest list or text is cut and a
+    `_truncated` entry records the path, the items or characters shown and
+    the total. The first cut also carries a cursor for tools that accept one.
+
+    Args:
+        value: Decoded API result (dict, list or text)
+        tool_name: Tool name, for per-tool budgets
+        cursor: Cursor from a previous truncated result to continue from
+        resumable: Whether the tool accepts a `cursor` argument
+        budget: Token budget overriding the configured one (0 disables)
+        tabular: Encode lists of records as columns plus rows
+
+    Returns:
+        Encoded result
+
+    Raises:
+        ValueError: The cursor does not match the result
+    """
+    offsets: Dict[str, int] = {}
+    if cursor:
+        value, cursor_path, offset = _apply_cursor(value, cursor)
+        offsets[cursor_path] = offset
+    if not isinstance(value, str):
+        value = compact(value)
+
+    budget = output_budget(tool_name) if budget is None else budget
+    text = _render(value, [], tabular)
+    if budget <= 0 or estimate_tokens(text) <= budget:
+        return text
+
+    limit = budget * CHARS_PER_TOKEN
+    truncated: List[Dict[str, Any]] = []
+    # Cut the largest nodes first until the output fits
+    for _, path in sorted(_candidates(value), reverse=True):
+        keys = _split_path(path)
+        node = _get_path(value, keys)
+        base = offsets.get(path, 0)
+
+        def marker(shown: int) -> Dict[str, Any]:
+            unit = "items" if isinstance(node, list) else "chars"
+            entry: Dict[str, Any] = {
+                "path": path or "$",
+                unit: f"{base}-{base + shown} of {base + len(node)}",
+            }
+            if not truncated:
+                if resumable:
+                    entry["cursor"] = f"{path}:{base + shown}"
+                    entry["hint"] = "Call the tool again with this cursor for the rest"
+                else:
+                    entry["hint"] = "Narrow the request (filters, fields, limit) to see the rest"
+            return entry
+
+        def fits(shown: int) -> bool:
+            candidate = _set_path(value, keys, node[:shown])
+            return len(_render(candidate, truncated + [marker(shown)], tabular)) <= limit
+
+        # Largest prefix that fits
+        low, high = 0, len(node) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+        if isinstance(node, str):
+            # Prefer ending on a line break (transcript turns are lines)
+            newline = node.rfind("\n", 0, low)
+            if newline >= low * 0.8:
+                low = newline + 1
+        value = _set_path(value, keys, node[:low])
+        truncated.append(marker(low))
+        text = _render(value, truncated, tabular)
+        if len(text) <= limit:
+            break
+    return text
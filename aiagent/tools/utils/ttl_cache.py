@@ -0,0 +1,242 @@
+"""
+Async TTL Cache
+
+Bounded LRU cache with per-entry TTL, stale-while-revalidate and
+deduplication of concurrent loads. Shared by the context, directory and
+registry caches in this package; every instance registers itself so hit
+rates can be inspected with `cache_stats()`.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+_registry: Dict[str, "AsyncTTLCache"] = {}
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache instance."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class _LoadCancelled(Exception):
+    """Set on a shared load whose caller was cancelled; waiters load again."""
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    stale_until: float
+
+
+class AsyncTTLCache:
+    """
+    LRU cache whose values are loaded by async callables.
+
+    Entries younger than `ttl` are fresh. Until `ttl + stale_ttl` they are
+    still served, but a background refresh is started. Concurrent misses for
+    the same key on the same event loop share one load; if the caller
+    running it is cancelled, the other callers retry instead of being
+    cancelled too. Loads that overlap an invalidation are returned but not
+    stored, and callers arriving after the invalidation do not join them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._background: Set["asyncio.Task[Any]"] = set()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation; loads started before one are not stored
+        self._generation = 0
+        _registry[name] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a fresh or stale value without loading, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry.stale_until:
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + self.stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one key. Returns True if it was cached."""
+        with self._lock:
+            self._generation += 1
+            # Later callers load afresh instead of joining a pre-invalidation load
+            self._inflight.pop(key, None)
+            return self._entries.pop(key, None) is not None
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every key matching `predicate`. Returns the number dropped."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._inflight if predicate(key)]:
+                del self._inflight[key]
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._inflight.clear()
+            self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for `key`, loading it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument coroutine function producing the value
+            cache_if: Optional predicate; results it rejects are returned but
+                not stored (and never replace a stale value on refresh)
+
+        Returns:
+            The cached or freshly loaded value. Loader exceptions propagate
+            and are not cached.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now >= entry.stale_until:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            if now < entry.expires_at:
+                self.stats.hits += 1
+            else:
+                self.stats.stale_hits += 1
+                self._schedule_refresh(key, loader, cache_if)
+            return entry.value
+
+        self.stats.misses += 1
+        return await self._load(key, loader, cache_if)
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except _LoadCancelled:
+                # The caller running the load was cancelled, not this one
+                return await self._load(key, loader, cache_if)
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        else:
+            if (cache_if is None or cache_if(value)) and generation == self._generation:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _schedule_refresh(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> None:
+        if key in self._inflight:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._load(key, loader, cache_if)
+                self.stats.refreshes += 1
+            except Exception as e:
+                self.stats.refresh_failures += 1
+                print(f"Warning: Background refresh failed for {self.name} cache: {e}")
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current size, configuration and counters."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            **asdict(self.stats),
+            "hit_rate": round(self.stats.hit_rate, 4),
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshot of every registered cache, keyed by cache name."""
+    return {name: cache.snapshot() for name, cache in _registry.items()}
@@ -1,15 +1,67 @@
 """
 User Context Fetcher - Fetch user profile and accessible meeting types from backend API
+
+Independent sections are fetched concurrently, and each section has its own
+timeout so one slow endpoint only degrades its own field. The team name
+comes from the shared per-organization member directory. Complete
+snapshots are cached per (organization_id, user_id) in `context_cache`.
+
+`UserContextMiddleware` loads the snapshot once at the start of each agent
+run, so the system prompt can fill in what the run's config leaves out.
 """
 
-from typing import Any, Dict
+import asyncio
+import os
+from typing import Any, Awaitable, Dict, List, Optional
+
+from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain.agents.middleware.types import PrivateStateAttr
+from typing_extensions import Annotated, NotRequired
+
+from ..core.api_tools import INTERNAL_SERVICE_SECRET, _make_api_request, get_context_from_config
+from ..core.deadline import remaining
+from .context_cache import user_context_cache
+from .meeting_type_registry import get_meeting_type_registry
+from .member_directory import get_member_directory
+
+# Per-section timeout in seconds
+CONTEXT_SECTION_TIMEOUT = float(os.getenv("KNOWTED_CONTEXT_SECTION_TIMEOUT", "5"))
+
+
+async def _fetch_section(
+    name: str, request: Awaitable[Any], timeout: float, failed: List[str]
+) -> Optional[Any]:
+    """Await one section, returning None (and recording it) if it fails or times out."""
+    left = remaining()
+    if left is not None:
+        # Finish inside the caller's deadline with whatever sections arrived
+        timeout = max(0.0, min(timeout, left))
+    try:
+        return await asyncio.wait_for(request, timeout=timeout)
+    except asyncio.TimeoutError:
+        print(f"Warning: Timed out fetching {name} after {timeout}s")
+    except Exception as e:
+        print(f"Warning: Could not fetch {name}: {e}")
+    failed.append(name)
+    return None
+
 
-from ..core.api_tools import _make_api_request
+def _resolve_user_name(profile: Dict[str, Any]) -> str:
+    # Build full name from first_name and last_name
+    first_name = profile.get("first_name", "")
+    last_name = profile.get("last_name", "")
+    if first_name or last_name:
+        return f"{first_name} {last_name}".strip()
+    # Fallback to email if no name
+    return profile.get("email", "User")
 
 
 async def fetch_user_context(
     organization_id: str,
     user_id: str,
+    internal_service_secret: Optional[str] = None,
+    section_timeout: float = CONTEXT_SECTION_TIMEOUT,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Fetch user context from backend API including:
@@ -21,6 +73,9 @@ async def fetch_user_context(
     Args:
         organization_id: Organization ID
         user_id: User ID
+        internal_service_secret: Service secret (defaults to INTERNAL_SERVICE_SECRET)
+        section_timeout: Timeout in seconds applied to each section separately
+        use_cache: Serve from the per-user context cache (default True)
 
     Returns:
         Dict with:
@@ -28,158 +83,133 @@ async def fetch_user_context(
         - organization_name: Name of the organization
         - team_name: Name of the user's primary team (or first team if multiple)
         - accessible_meeting_types: List of meeting types user has access to
+        - meeting_types_prompt: The registry's system-prompt text for those types
         - user_profile: Full user profile data
     """
+    if not use_cache:
+        return await _load_user_context(
+            organization_id, user_id, internal_service_secret, section_timeout, []
+        )
+
+    # Degraded snapshots are returned but never cached
+    failed_sections: List[str] = []
+    context = await user_context_cache.get_or_load(
+        (organization_id, user_id),
+        lambda: _load_user_context(
+            organization_id,
+            user_id,
+            internal_service_secret,
+            section_timeout,
+            failed_sections,
+        ),
+        cache_if=lambda _: not failed_sections,
+    )
+    return dict(context)
+
+
+async def _load_user_context(
+    organization_id: str,
+    user_id: str,
+    internal_service_secret: Optional[str],
+    section_timeout: float,
+    failed_sections: List[str],
+) -> Dict[str, Any]:
+    """Fetch all context sections from the backend, bypassing the cache."""
     context = {
         "user_name": None,
         "organization_name": None,
         "team_name": None,
         "accessible_meeting_types": [],
+        "meeting_types_prompt": None,
         "user_profile": None,
     }
+    secret = internal_service_secret or INTERNAL_SERVICE_SECRET
 
-    try:
-        # Fetch user profile
-        try:
-            profile_result = await _make_api_request(
-                "api/v1/profiles/me",
-                method="GET",
-                organization_id=organization_id,
-                user_id=user_id,
-            )
+    def get(endpoint: str) -> Awaitable[Any]:
+        return _make_api_request(
+            endpoint,
+            method="GET",
+            organization_id=organization_id,
+            user_id=user_id,
+            internal_service_secret=secret,
+        )
 
-            if profile_result:
-                context["user_profile"] = profile_result
-                # Build full name from first_name and last_name
-                first_name = profile_result.get("first_name", "")
-                last_name = profile_result.get("last_name", "")
-                if first_name or last_name:
-                    context["user_name"] = f"{first_name} {last_name}".strip()
-                else:
-                    # Fallback to email if no name
-                    context["user_name"] = profile_result.get("email", "User")
-        except Exception as e:
-            print(f"Warning: Could not fetch user profile: {e}")
+    try:
+        # All sections are independent
+        (
+            profile_result,
+            org_result,
+            directory,
+            meeting_type_registry,
+        ) = await asyncio.gather(
+            _fetch_section(
+                "user profile",
+                get("api/v1/profiles/me"),
+                section_timeout,
+                failed_sections,
+            ),
+            _fetch_section(
+                "organization data",
+                get(f"api/v1/organizations/{organization_id}"),
+                section_timeout,
+                failed_sections,
+            ),
+            _fetch_section(
+                "member directory",
+                get_member_directory(organization_id, user_id, secret),
+                section_timeout,
+                failed_sections,
+            ),
+            _fetch_section(
+                "accessible meeting types",
+                get_meeting_type_registry(organization_id, user_id, secret),
+                section_timeout,
+                failed_sections,
+            ),
+        )
 
-        # Fetch organization data to get organization name
-        try:
-            org_result = await _make_api_request(
-                f"api/v1/organizations/{organization_id}",
-                method="GET",
-                organization_id=organization_id,
-                user_id=user_id,
-            )
-            if org_result and isinstance(org_result, dict):
-                context["organization_name"] = org_result.get("name")
-        except Exception as e:
-            print(f"Warning: Could not fetch organization data: {e}")
+        if profile_result and isinstance(profile_result, dict):
+            context["user_profile"] = profile_result
+            context["user_name"] = _resolve_user_name(profile_result)
 
-        # Fetch user teams to get team name
-        try:
-            # Try to get teams from profile or a teams endpoint
-            # First, try getting organization members to find user's team
-            members_result = await _make_api_request(
-                f"api/v1/organizations/{organization_id}/members",
-                method="GET",
-                organization_id=organization_id,
-                user_id=user_id,
-            )
-            if members_result:
-                # Find the current user in members and get their team
-                if isinstance(members_result, list):
-                    for member in members_result:
-                        if (
-                            member.get("user_id") == user_id
-                            or member.get("id") == user_id
-                        ):
-                            # Try to get team info from member or fetch teams separately
-                            team_id = member.get("team_id")
-                            if team_id:
-                                # Fetch team details
-                                try:
-                                    teams_result = await _make_api_request(
-                                        "api/v1/teams",
-                                        method="GET",
-                                        organization_id=organization_id,
-                                        user_id=user_id,
-                                    )
-                                    if teams_result:
-                                        teams_list = (
-                                            teams_result
-                                            if isinstance(teams_result, list)
-                                            else teams_result.get("data", [])
-                                        )
-                                        for team in teams_list:
-                                            if team.get("id") == team_id:
-                                                context["team_name"] = team.get("name")
-                                                break
-                                except Exception:
-                                    pass
-                            break
-                elif isinstance(members_result, dict):
-                    # If it's a dict, try to extract data
-                    members_list = members_result.get("data", [])
-                    for member in members_list:
-                        if (
-                            member.get("user_id") == user_id
-                            or member.get("id") == user_id
-                        ):
-                            team_id = member.get("team_id")
-                            if team_id:
-                                try:
-                                    teams_result = await _make_api_request(
-                                        "api/v1/teams",
-                                        method="GET",
-                                        organization_id=organization_id,
-                                        user_id=user_id,
-                                    )
-                                    if teams_result:
-                                        teams_list = (
-                                            teams_result
-                                            if isinstance(teams_result, list)
-                                            else teams_result.get("data", [])
-                                        )
-                                        for team in teams_list:
-                                            if team.get("id") == team_id:
-                                                context["team_name"] = team.get("name")
-                                                break
-                                except Exception:
-                                    pass
-                            break
-        except Exception as e:
-            print(f"Warning: Could not fetch team information: {e}")
+        if org_result and isinstance(org_result, dict):
+            context["organization_name"] = org_result.get("name")
 
-        # Fetch accessible meeting types
-        try:
-            # Try the meeting types endpoint
-            meeting_types_result = await _make_api_request(
-                f"api/v1/meeting-types?organization_id={organization_id}",
-                method="GET",
-                organization_id=organization_id,
-                user_id=user_id,
-            )
+        if directory is not None:
+            team = directory.team_of(user_id)
+            context["team_name"] = team["name"] if team else None
 
-            if meeting_types_result and isinstance(meeting_types_result, list):
-                context["accessible_meeting_types"] = meeting_types_result
-            elif meeting_types_result and isinstance(meeting_types_result, dict):
-                # If it's a dict, try to extract the list
-                if "data" in meeting_types_result:
-                    context["accessible_meeting_types"] = meeting_types_result["data"]
-                elif "meeting_types" in meeting_types_result:
-                    context["accessible_meeting_types"] = meeting_types_result[
-                        "meeting_types"
-                    ]
-        except Exception as e:
-            print(f"Warning: Could not fetch accessible meeting types: {e}")
-            # Try alternative endpoint
-            try:
-                # Use the get_user_accessible_meeting_types tool's logic
-                # This might need to be adjusted based on actual backend endpoint
-                pass
-            except Exception:
-                pass
+        if meeting_type_registry is not None:
+            context["accessible_meeting_types"] = meeting_type_registry.meeting_types
+            context["meeting_types_prompt"] = meeting_type_registry.prompt_fragment
 
     except Exception as e:
         print(f"Error fetching user context: {e}")
 
     return context
+
+
+class UserContextState(AgentState):
+    user_context: NotRequired[Annotated[Optional[Dict[str, Any]], PrivateStateAttr]]
+
+
+class UserContextMiddleware(AgentMiddleware):
+    """Loads the user's context (through the context cache) at the start of each run."""
+
+    state_schema = UserContextState
+
+    async def abefore_agent(
+        self, state: UserContextState, runtime: Any
+    ) -> Optional[Dict[str, Any]]:
+        organization_id, user_id, internal_service_secret = get_context_from_config()
+        if not organization_id or not user_id:
+            return None
+        try:
+            context = await fetch_user_context(
+                organization_id, user_id, internal_service_secret
+            )
+        except Exception as e:
+            # The prompt falls back to the run's config alone
+            print(f"Warning: Could not load user context: {e}")
+            return None
+        return {"user_context": context}
@@ -0,0 +1,66 @@
+"""
+Knowted Agent HTTP App
+
+Custom Starlette app mounted by the LangGraph server (see langgraph.json).
+Its lifespan runs the optional checkpoint retention task and releases
+process-wide resources, such as the pooled backend HTTP client and
+checkpointer pool, when the server shuts down. Cache metrics are served
+at `/cache/stats` only when KNOWTED_CACHE_STATS_ENDPOINT is enabled, since
+this app is public and has no authentication of its own.
+"""
+
+import os
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from memory.async_checkpointer import aclose_checkpointers
+from memory.bounded_checkpointer import memory_checkpointer_stats
+from memory.retention import start_retention_task
+from rag.vector_store import embedding_cache_stats
+from tools.core.http_client import aclose_http_clients
+from tools.core.resilience import circuit_stats
+from tools.core.response_cache import response_cache
+from tools.core.single_flight import single_flight_stats
+from tools.utils.ttl_cache import cache_stats
+
+# Debug-only: the stats reveal per-endpoint traffic and cache sizes
+KNOWTED_CACHE_STATS_ENDPOINT = (
+    os.getenv("KNOWTED_CACHE_STATS_ENDPOINT", "false").lower() == "true"
+)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette):
+    """Start checkpoint retention; release shared resources on server shutdown."""
+    retention = start_retention_task()
+    yield
+    if retention is not None:
+        retention.cancel()
+    await aclose_http_clients()
+    await aclose_checkpointers()
+
+
+async def get_cache_stats(request: Request) -> JSONResponse:
+    """Counters for every in-process cache, request coalescing and circuit breakers."""
+    stats = cache_stats()
+    embeddings = embedding_cache_stats()
+    if embeddings is not None:
+        stats["query_embeddings"] = embeddings
+    stats["responses"] = response_cache.snapshot()
+    stats["single_flight"] = single_flight_stats()
+    stats["circuits"] = circuit_stats()
+    checkpointers = memory_checkpointer_stats()
+    if checkpointers:
+        stats["memory_checkpointers"] = checkpointers
+    return JSONResponse(stats)
+
+
+routes = []
+if KNOWTED_CACHE_STATS_ENDPOINT:
+    routes.append(Route("/cache/stats", get_cache_stats, methods=["GET"]))
+
+app = Starlette(routes=routes, lifespan=lifespan)